@@ -45,6 +45,7 @@ _database_mongodb = {
     'backend': os.environ.get('BIGCHAINDB_DATABASE_BACKEND', 'mongodb'),
     'connection_timeout': 5000,
     'max_tries': 3,
+    'max_pool_size': 100,
     'ssl': bool(os.environ.get('BIGCHAINDB_DATABASE_SSL', False)),
     'ca_cert': os.environ.get('BIGCHAINDB_DATABASE_CA_CERT'),
     'certfile': os.environ.get('BIGCHAINDB_DATABASE_CERTFILE'),
@@ -67,6 +68,14 @@ config = {
         'loglevel': logging.getLevelName(
             log_config['handlers']['console']['level']).lower(),
         'workers': None,  # if none, the value will be cpu_count * 2 + 1
+        # threads per worker; if none, 1 with gunicorn, 32 with aiohttp
+        'threads': None,
+        'engine': 'gunicorn',  # or 'aiohttp'
+        # MongoDB read preference of the read-only endpoints of the API
+        'read_preference': 'primary',
+        'max_staleness': 90,
+        # responses for decided blocks and valid transactions, per process
+        'cache_size': 1024,
     },
     'wsserver': {
         'scheme': os.environ.get('BIGCHAINDB_WSSERVER_SCHEME') or 'ws',
@@ -85,6 +94,14 @@ config = {
     },
     'keyring': [],
     'backlog_reassign_delay': 120,
+    'block': {
+        'max_size': 1000,
+        'max_bytes': 15 * 1024 * 1024,
+        'timeout': 1.0,
+        'adaptive': False,
+        'min_size': 100,
+        'min_timeout': 0.1,
+    },
     'log': {
         'file': log_config['handlers']['file']['filename'],
         'error_file': log_config['handlers']['errors']['filename'],
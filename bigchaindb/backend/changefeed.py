@@ -24,7 +24,8 @@ class ChangeFeed(Node):
     DELETE = 2
     UPDATE = 4
 
-    def __init__(self, table, operation, *, prefeed=None, connection=None):
+    def __init__(self, table, operation, *, prefeed=None, connection=None,
+                 checkpoint=None, acks=False):
         """Create a new ChangeFeed.
 
         Args:
@@ -38,12 +39,21 @@ class ChangeFeed(Node):
             connection (:class:`~bigchaindb.backend.connection.Connection`, optional):  # noqa
                 A connection to the database. If no connection is provided a
                 default connection will be created.
+            checkpoint (str, optional): the name under which the position of
+                the changefeed is persisted, so that it resumes from there
+                when restarted. If not provided, the changefeed starts from
+                the changes happening after it is started.
+            acks (bool, optional): whether the consumer of the changefeed
+                calls :meth:`ack` once it has processed a record, so that
+                the checkpoint only moves past the processed records.
         """
 
         super().__init__(name='changefeed')
         self.prefeed = prefeed if prefeed else []
         self.table = table
         self.operation = operation
+        self.checkpoint = checkpoint
+        self.acks = acks
         if connection:
             self.connection = connection
         else:
@@ -71,9 +81,19 @@ class ChangeFeed(Node):
         """
         raise NotImplementedError
 
+    def ack(self):
+        """Acknowledge that the oldest record output and not acknowledged
+        yet was processed.
+
+        Called by the consumer of a changefeed created with ``acks``, in the
+        order the records were output. Backends that cannot resume a
+        changefeed ignore it.
+        """
+
 
 @singledispatch
-def get_changefeed(connection, table, operation, *, prefeed=None):
+def get_changefeed(connection, table, operation, *, prefeed=None,
+                   checkpoint=None, acks=False):
     """Return a ChangeFeed.
 
     Args:
@@ -86,5 +106,11 @@ def get_changefeed(connection, table, operation, *, prefeed=None):
             (e.g. ``ChangeFeed.INSERT | ChangeFeed.UPDATE``)
         prefeed (iterable): whatever set of data you want to be published
             first.
+        checkpoint (str): the name under which the position of the
+            changefeed is persisted, to resume from it when restarted. Not
+            every backend supports resuming a changefeed.
+        acks (bool): whether the consumer acknowledges each record it
+            processed with :meth:`ChangeFeed.ack`. Without it, the
+            checkpoint moves past the records as soon as they are output.
     """
     raise NotImplementedError
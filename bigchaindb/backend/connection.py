@@ -1,6 +1,7 @@
 from itertools import repeat
 from importlib import import_module
 import logging
+import os
 
 import bigchaindb
 from bigchaindb.common.exceptions import ConfigurationError
@@ -18,7 +19,8 @@ logger = logging.getLogger(__name__)
 def connect(backend=None, host=None, port=None, name=None, max_tries=None,
             connection_timeout=None, replicaset=None, ssl=None, login=None, password=None,
             ca_cert=None, certfile=None, keyfile=None, keyfile_passphrase=None,
-            crlfile=None):
+            crlfile=None, max_pool_size=None, read_preference=None,
+            max_staleness=None):
     """Create a new connection to the database backend.
 
     All arguments default to the current configuration's values if not
@@ -31,6 +33,15 @@ def connect(backend=None, host=None, port=None, name=None, max_tries=None,
         name (str): the name of the database to use.
         replicaset (str): the name of the replica set (only relevant for
                           MongoDB connections).
+        max_pool_size (int): the maximum size of the pool of sockets of the
+                             client (only relevant for MongoDB connections).
+        read_preference (str): the read preference mode of the queries, e.g.
+                               ``secondaryPreferred`` (only relevant for
+                               MongoDB connections). Defaults to ``primary``
+                               rather than to the configuration.
+        max_staleness (int): the maximum replication lag, in seconds, of the
+                             secondaries to read from (only relevant for
+                             MongoDB connections).
 
     Returns:
         An instance of :class:`~bigchaindb.backend.connection.Connection`
@@ -62,6 +73,7 @@ def connect(backend=None, host=None, port=None, name=None, max_tries=None,
     keyfile = keyfile or bigchaindb.config['database'].get('keyfile', None)
     keyfile_passphrase = keyfile_passphrase or bigchaindb.config['database'].get('keyfile_passphrase', None)
     crlfile = crlfile or bigchaindb.config['database'].get('crlfile', None)
+    max_pool_size = max_pool_size or bigchaindb.config['database'].get('max_pool_size')
 
     try:
         module_name, _, class_name = BACKENDS[backend].rpartition('.')
@@ -77,7 +89,9 @@ def connect(backend=None, host=None, port=None, name=None, max_tries=None,
                  max_tries=max_tries, connection_timeout=connection_timeout,
                  replicaset=replicaset, ssl=ssl, login=login, password=password,
                  ca_cert=ca_cert, certfile=certfile, keyfile=keyfile,
-                 keyfile_passphrase=keyfile_passphrase, crlfile=crlfile)
+                 keyfile_passphrase=keyfile_passphrase, crlfile=crlfile,
+                 max_pool_size=max_pool_size, read_preference=read_preference,
+                 max_staleness=max_staleness)
 
 
 class Connection:
@@ -115,10 +129,13 @@ class Connection:
         self.max_tries = max_tries if max_tries is not None else dbconf['max_tries']
         self.max_tries_counter = range(self.max_tries) if self.max_tries != 0 else repeat(0)
         self._conn = None
+        self._pid = None
 
     @property
     def conn(self):
-        if self._conn is None:
+        # a connection inherited from a parent process cannot be used, the
+        # child process connects on its own
+        if self._conn is None or self._pid != os.getpid():
             self.connect()
         return self._conn
 
@@ -151,6 +168,7 @@ class Connection:
             attempt += 1
             try:
                 self._conn = self._connect()
+                self._pid = os.getpid()
             except ConnectionError as exc:
                 logger.warning('Attempt %s/%s. Connection to %s:%s failed after %sms.',
                                attempt, self.max_tries if self.max_tries != 0 else '∞',
@@ -1,8 +1,12 @@
 import logging
+import multiprocessing as mp
 import time
 
 import pymongo
+import statsd
+from bson.timestamp import Timestamp
 
+import bigchaindb
 from bigchaindb import backend
 from bigchaindb.backend.changefeed import ChangeFeed
 from bigchaindb.backend.utils import module_dispatch_registrar
@@ -14,59 +18,235 @@ logger = logging.getLogger(__name__)
 register_changefeed = module_dispatch_registrar(backend.changefeed)
 
 
+UPDATES_BATCH_SIZE = 1000
+"""Maximum number of updated documents read with a single query."""
+
+IDLE_AWAIT_TIME_MS = 100
+"""How long to wait for new records before reading the documents of the
+pending updates."""
+
+CHECKPOINT_INTERVAL = 1
+"""Minimum number of seconds between two writes of the checkpoint of a
+changefeed, while records keep coming."""
+
+
 class MongoDBChangeFeed(ChangeFeed):
     """This class implements a MongoDB changefeed as a multipipes Node.
 
     We emulate the behaviour of the RethinkDB changefeed by using a tailable
     cursor that listens for events on the oplog.
+
+    The oplog entries of updates do not contain the updated documents, so
+    the consecutive updates drained from the oplog are grouped, and their
+    documents read with a single query per group.
+
+    The number of records and of queries, and the lag of the changefeed
+    behind the oplog, are sent to statsd as
+    ``changefeed.<table>.{records,queries,lag}``.
+
+    If the changefeed has a ``checkpoint``, the timestamp of an oplog entry
+    is persisted in the ``changefeed_checkpoints`` collection under that
+    name, and the changefeed resumes after it when restarted:
+
+    - without ``acks``, it is the last entry output. The records output but
+      not processed yet by the consumer when the node crashes are not output
+      again, so the consumer must recover them in another way.
+    - with ``acks``, it is the last entry acknowledged by the consumer with
+      :meth:`ack`, so that every record is processed at least once. The
+      records processed between the last write of the checkpoint and a
+      crash are output again.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.position = self.saved_position = None
+        self.saved_at = 0
+        # the positions of the records output and not acknowledged yet,
+        # shared with the process of the consumer
+        self.pending = None
+        if self.acks and self.checkpoint is not None:
+            self.pending = mp.Queue()
+
     def run_forever(self):
         for element in self.prefeed:
-            self.outqueue.put(element)
+            self.output(element)
 
         table = self.table
-        dbname = self.connection.dbname
+        self.statsd = statsd.StatsClient(bigchaindb.config['graphite']['host'])
 
-        # last timestamp in the oplog. We only care for operations happening
-        # in the future.
-        last_ts = self.connection.run(
-            self.connection.query().local.oplog.rs.find()
-            .sort('$natural', pymongo.DESCENDING).limit(1)
-            .next()['ts'])
+        last_ts = self.load_checkpoint()
+        if last_ts is None:
+            # last timestamp in the oplog. We only care for operations
+            # happening in the future.
+            last_ts = self.connection.run(
+                self.connection.query().local.oplog.rs.find()
+                .sort('$natural', pymongo.DESCENDING).limit(1)
+                .next()['ts'])
+        self.position = self.saved_position = last_ts
+        self.saved_at = time.time()
 
-        for record in run_changefeed(self.connection, table, last_ts):
+        updates = []
+        for record in run_changefeed(self.connection, table, last_ts,
+                                     yield_idle=True):
+            # the oplog is drained for now
+            if record is None:
+                self.put_updates(updates)
+                self.checkpoint_output(force=True)
+                continue
 
+            self.statsd.incr('changefeed.{}.records'.format(table))
             is_insert = record['op'] == 'i'
             is_delete = record['op'] == 'd'
             is_update = record['op'] == 'u'
 
+            if is_update and (self.operation & ChangeFeed.UPDATE):
+                updates.append(record)
+                if len(updates) >= UPDATES_BATCH_SIZE:
+                    self.put_updates(updates)
+                continue
+
+            # the pending updates happened before this record
+            self.put_updates(updates)
+
             # mongodb documents uses the `_id` for the primary key.
             # We are not using this field at this point and we need to
             # remove it to prevent problems with schema validation.
             # See https://github.com/bigchaindb/bigchaindb/issues/992
             if is_insert and (self.operation & ChangeFeed.INSERT):
                 record['o'].pop('_id', None)
-                self.outqueue.put(record['o'])
+                self.output(record['o'], record['ts'])
             elif is_delete and (self.operation & ChangeFeed.DELETE):
                 # on delete it only returns the id of the document
-                self.outqueue.put(record['o'])
-            elif is_update and (self.operation & ChangeFeed.UPDATE):
-                # the oplog entry for updates only returns the update
-                # operations to apply to the document and not the
-                # document itself. So here we first read the document
-                # and then return it.
-                doc = self.connection.conn[dbname][table].find_one(
-                    {'_id': record['o2']['_id']},
-                    {'_id': False}
-                )
-                self.outqueue.put(doc)
+                self.output(record['o'], record['ts'])
 
+            self.position = record['ts']
+            self.checkpoint_output()
+            self.report_lag(record)
             logger.debug('Record in changefeed: %s:%s', table, record['op'])
 
+        self.put_updates(updates)
+        self.checkpoint_output(force=True)
+
+    def output(self, doc, ts=None):
+        """Put a document in the outqueue.
+
+        Args:
+            doc (dict): the document.
+            ts: the timestamp of the oplog entry of the document, kept until
+                the consumer acknowledges it. ``None`` for the prefeed.
+        """
+        self.outqueue.put(doc)
+        if self.pending is not None:
+            self.pending.put(ts)
+
+    def ack(self):
+        """Move the checkpoint past the oldest record output and not
+        acknowledged yet. Called from the process of the consumer.
+        """
+        if self.pending is None:
+            return
+        ts = self.pending.get()
+        if ts is not None:
+            self.position = ts
+        # write the checkpoint at once when the consumer caught up
+        self.save_checkpoint(force=self.pending.empty())
+
+    def checkpoint_output(self, force=False):
+        """Persist the position of the last oplog entry output, unless the
+        consumer acknowledges the records.
+        """
+        if self.pending is None:
+            self.save_checkpoint(force=force)
+
+    def load_checkpoint(self):
+        """Return the timestamp of the oplog entry to resume after, or
+        ``None`` if the changefeed has no checkpoint yet.
+        """
+        if self.checkpoint is None:
+            return None
+
+        checkpoint = self.connection.run(
+            self.connection.collection('changefeed_checkpoints')
+            .find_one({'id': self.checkpoint}))
+        if checkpoint is None:
+            return None
+
+        first_ts = self.connection.run(
+            self.connection.query().local.oplog.rs.find()
+            .sort('$natural', pymongo.ASCENDING).limit(1)
+            .next()['ts'])
+        if checkpoint['ts'] < first_ts:
+            logger.warning('The oplog was truncated after the checkpoint '
+                           '%s of the changefeed, some changes of `%s` '
+                           'are missed', self.checkpoint, self.table)
+        logger.info('Resuming the changefeed %s at %s',
+                    self.checkpoint, checkpoint['ts'])
+        return checkpoint['ts']
+
+    def save_checkpoint(self, force=False):
+        """Persist the current position of the changefeed, at most every
+        ``CHECKPOINT_INTERVAL`` seconds unless ``force`` is set.
+        """
+        if self.checkpoint is None or self.position == self.saved_position:
+            return
+        if not force and time.time() - self.saved_at < CHECKPOINT_INTERVAL:
+            return
+
+        self.connection.run(
+            self.connection.collection('changefeed_checkpoints')
+            .update_one({'id': self.checkpoint},
+                        {'$set': {'ts': self.position}},
+                        upsert=True))
+        self.saved_position = self.position
+        self.saved_at = time.time()
+
+    def put_updates(self, records):
+        """Read the documents of a group of update records and put them in
+        the outqueue, in the order of the records. The list of records is
+        emptied.
+
+        Args:
+            records (list): the oplog entries of the updates.
+        """
+        if not records:
+            return
+
+        # the oplog entry for updates only returns the update
+        # operations to apply to the document and not the
+        # document itself. So here we first read the documents
+        # and then return them.
+        ids = [record['o2']['_id'] for record in records]
+        docs = self.connection.conn[self.connection.dbname][self.table].find(
+            {'_id': {'$in': ids}})
+        docs = {doc.pop('_id'): doc for doc in docs}
+        self.statsd.incr('changefeed.{}.queries'.format(self.table))
+
+        for _id, record in zip(ids, records):
+            # the document may have been deleted since
+            if _id in docs:
+                self.output(docs[_id], record['ts'])
+
+        self.position = records[-1]['ts']
+        self.report_lag(records[-1])
+        logger.debug('Records in changefeed: %s:u (%s)',
+                     self.table, len(records))
+        records.clear()
+
+    def report_lag(self, record):
+        """Send the lag of the changefeed behind the oplog to statsd.
+
+        Args:
+            record (dict): the last oplog entry that was output.
+        """
+        if isinstance(record['ts'], Timestamp):
+            lag = time.time() - record['ts'].time
+            self.statsd.timing('changefeed.{}.lag'.format(self.table),
+                               max(lag, 0) * 1000)
+
 
 @register_changefeed(MongoDBConnection)
-def get_changefeed(connection, table, operation, *, prefeed=None):
+def get_changefeed(connection, table, operation, *, prefeed=None,
+                   checkpoint=None, acks=False):
     """Return a MongoDB changefeed.
 
     Returns:
@@ -75,7 +255,8 @@ def get_changefeed(connection, table, operation, *, prefeed=None):
     """
 
     return MongoDBChangeFeed(table, operation, prefeed=prefeed,
-                             connection=connection)
+                             connection=connection, checkpoint=checkpoint,
+                             acks=acks)
 
 
 _FEED_STOP = False
@@ -83,20 +264,26 @@ _FEED_STOP = False
 """
 
 
-def run_changefeed(conn, table, last_ts):
+def run_changefeed(conn, table, last_ts, *, yield_idle=False):
     """Encapsulate operational logic of tailing changefeed from MongoDB
+
+    Args:
+        yield_idle (bool): whether to yield ``None`` each time there are no
+            more records to read for now.
     """
     while True:
         try:
-            # XXX: hack to force reconnection, in case the connection
-            # is lost while waiting on the cursor. See #1154.
-            conn._conn = None
+            # The client is kept: it reconnects by itself, and the cursor is
+            # created again after `last_ts` when it dies.
             namespace = conn.dbname + '.' + table
             query = conn.query().local.oplog.rs.find(
                 {'ns': namespace, 'ts': {'$gt': last_ts}},
                 {'o._id': False},
                 cursor_type=pymongo.CursorType.TAILABLE_AWAIT
             )
+            if yield_idle:
+                # bound the time to notice that there are no more records
+                query = query.max_await_time_ms(IDLE_AWAIT_TIME_MS)
             cursor = conn.run(query)
             logging.debug('Tailing oplog at %s/%s', namespace, last_ts)
             while cursor.alive:
@@ -107,6 +294,8 @@ def run_changefeed(conn, table, last_ts):
                 except StopIteration:
                     if _FEED_STOP:
                         return
+                    if yield_idle:
+                        yield None
         except (BackendError, pymongo.errors.ConnectionFailure):
             logger.exception('Lost connection while tailing oplog, retrying')
             time.sleep(1)
@@ -1,5 +1,8 @@
+import os
 import time
 import logging
+import threading
+from collections import Counter
 from ssl import CERT_REQUIRED
 
 import pymongo
@@ -19,12 +22,22 @@ class MongoDBConnection(Connection):
 
     def __init__(self, replicaset=None, ssl=None, login=None, password=None,
                  ca_cert=None, certfile=None, keyfile=None,
-                 keyfile_passphrase=None, crlfile=None, **kwargs):
+                 keyfile_passphrase=None, crlfile=None, max_pool_size=None,
+                 read_preference=None, max_staleness=None, **kwargs):
         """Create a new Connection instance.
 
         Args:
             replicaset (str, optional): the name of the replica set to
                                         connect to.
+            max_pool_size (int, optional): the maximum number of sockets
+                the (shared) client keeps open to each server.
+            read_preference (str, optional): the MongoDB read preference
+                mode of the queries, e.g. ``secondaryPreferred``. Defaults
+                to ``primary``. Writes always go to the primary.
+            max_staleness (int, optional): the maximum replication lag, in
+                seconds, of the secondaries to read from (``-1``, the
+                default, means no maximum). Ignored when reading from the
+                primary.
             **kwargs: arbitrary keyword arguments provided by the
                 configuration's ``database`` settings
         """
@@ -39,6 +52,9 @@ class MongoDBConnection(Connection):
         self.keyfile = keyfile or bigchaindb.config['database'].get('keyfile', None)
         self.keyfile_passphrase = keyfile_passphrase or bigchaindb.config['database'].get('keyfile_passphrase', None)
         self.crlfile = crlfile or bigchaindb.config['database'].get('crlfile', None)
+        self.max_pool_size = max_pool_size or bigchaindb.config['database'].get('max_pool_size', 100)
+        self.read_preference = read_preference or 'primary'
+        self.max_staleness = max_staleness if max_staleness is not None else -1
 
     @property
     def db(self):
@@ -70,8 +86,25 @@ class MongoDBConnection(Connection):
         except pymongo.errors.OperationFailure as exc:
             raise OperationError from exc
 
+    def _client_key(self):
+        return (self.host, self.port, self.replicaset, self.ssl, self.login,
+                self.password, self.ca_cert, self.certfile, self.keyfile,
+                self.crlfile, self.connection_timeout, self.max_pool_size,
+                self.read_preference, self.max_staleness)
+
+    def _read_preference_options(self):
+        if self.read_preference == 'primary':
+            return {}
+        return {'readpreference': self.read_preference,
+                'maxstalenessseconds': self.max_staleness}
+
     def _connect(self):
-        """Try to connect to the database.
+        """Return the client of this process for the connection parameters,
+        connecting to the database if there is none yet.
+
+        ``MongoClient`` is thread-safe and keeps its own pool of sockets, so
+        all the connections of a process with the same parameters share one
+        client (see :class:`ClientRegistry`).
 
         Raises:
             :exc:`~ConnectionError`: If the connection to the database
@@ -82,6 +115,9 @@ class MongoDBConnection(Connection):
                 connecting to the database.
         """
 
+        return clients.get(self._client_key(), self._create_client)
+
+    def _create_client(self):
         try:
             # we should only return a connection if the replica set is
             # initialized. initialize_replica_set will check if the
@@ -111,6 +147,8 @@ class MongoDBConnection(Connection):
                                              replicaset=self.replicaset,
                                              serverselectiontimeoutms=self.connection_timeout,
                                              ssl=self.ssl,
+                                             maxpoolsize=self.max_pool_size,
+                                             **self._read_preference_options(),
                                              **MONGO_OPTS)
                 if self.login is not None and self.password is not None:
                     client[self.dbname].authenticate(self.login, self.password)
@@ -127,6 +165,8 @@ class MongoDBConnection(Connection):
                                              ssl_pem_passphrase=self.keyfile_passphrase,
                                              ssl_crlfile=self.crlfile,
                                              ssl_cert_reqs=CERT_REQUIRED,
+                                             maxpoolsize=self.max_pool_size,
+                                             **self._read_preference_options(),
                                              **MONGO_OPTS)
                 if self.login is not None:
                     client[self.dbname].authenticate(self.login,
@@ -149,6 +189,74 @@ MONGO_OPTS = {
 }
 
 
+class ClientRegistry:
+    """Per-process registry of the MongoDB clients, keyed by connection
+    parameters.
+
+    A ``MongoClient`` must not be used across a ``fork()``: its sockets and
+    monitor threads belong to the parent. The registry remembers the pid it
+    was populated in, and starts from scratch in a child process, without
+    closing the clients of the parent.
+    """
+
+    def __init__(self):
+        self.stats = Counter()
+        self._reset()
+
+    def _reset(self):
+        # the lock may have been held by another thread at the time of the
+        # fork, hence it is re-created along with the clients
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._clients = {}
+
+    def get(self, key, factory):
+        """Return the client registered for ``key``, creating it with
+        ``factory`` if there is none.
+
+        A ``factory`` that raises leaves the registry unchanged, so the next
+        call tries to connect again.
+        """
+        if self._pid != os.getpid():
+            logger.debug('Process forked, dropping %s MongoDB client(s)',
+                         len(self._clients))
+            self._reset()
+            self.stats['forks'] += 1
+
+        with self._lock:
+            try:
+                client = self._clients[key]
+            except KeyError:
+                client = self._clients[key] = factory()
+                self.stats['created'] += 1
+            else:
+                self.stats['reused'] += 1
+            return client
+
+    def clear(self):
+        """Close and forget all the clients of this process."""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients = {}
+
+    def pool_stats(self):
+        """Return the number of clients of this process, and how many times
+        clients were created, reused and dropped after a fork."""
+        with self._lock:
+            clients = list(self._clients.values())
+        return {
+            'pid': self._pid,
+            'clients': len(clients),
+            'created': self.stats['created'],
+            'reused': self.stats['reused'],
+            'forks': self.stats['forks'],
+        }
+
+
+clients = ClientRegistry()
+
+
 def initialize_replica_set(host, port, connection_timeout, dbname, ssl, login,
                            password, ca_cert, certfile, keyfile,
                            keyfile_passphrase, crlfile):
@@ -2,19 +2,24 @@
 
 from time import time
 
-from pymongo import ReturnDocument
+from pymongo import ASCENDING, ReturnDocument, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError
 
 from bigchaindb import backend
 from bigchaindb.backend.mongodb.changefeed import run_changefeed
 from bigchaindb.common.exceptions import CyclicBlockchainError
 from bigchaindb.common.transaction import Transaction
 from bigchaindb.backend.exceptions import DuplicateKeyError, OperationError
-from bigchaindb.backend.utils import module_dispatch_registrar
+from bigchaindb.backend.utils import (module_dispatch_registrar,
+                                      index_block_transactions)
 from bigchaindb.backend.mongodb.connection import MongoDBConnection
 
 
 register_query = module_dispatch_registrar(backend.query)
 
+# The code of the errors reported by MongoDB for duplicate keys.
+DUPLICATE_KEY_ERROR_CODE = 11000
+
 
 @register_query(MongoDBConnection)
 def write_transaction(conn, signed_transaction):
@@ -26,6 +31,11 @@ def write_transaction(conn, signed_transaction):
         return
 
 
+@register_query(MongoDBConnection)
+def write_transactions(conn, signed_transactions):
+    return _insert_many_unordered(conn, 'backlog', signed_transactions)
+
+
 @register_query(MongoDBConnection)
 def update_transaction(conn, transaction_id, doc):
     # with mongodb we need to add update operators to the doc
@@ -53,6 +63,32 @@ def get_stale_transactions(conn, reassign_delay):
               projection={'_id': False}))
 
 
+@register_query(MongoDBConnection)
+def reassign_stale_transactions(conn, reassignments, default_assignee,
+                                lease_duration):
+    now = time()
+    # The transactions assigned before the assignments had an expiry are
+    # reclaimed too.
+    stale = {'$or': [{'assignment_expiry': {'$lt': now}},
+                     {'assignment_expiry': {'$exists': False}}]}
+
+    def assign(assignee):
+        return {'$set': {'assignee': assignee,
+                         'assignment_timestamp': now,
+                         'assignment_expiry': now + lease_duration}}
+
+    # every update is served by the `assignee__assignment_expiry` index
+    requests = [UpdateMany(dict(stale, assignee=assignee),
+                           assign(new_assignee))
+                for assignee, new_assignee in reassignments.items()]
+    requests.append(UpdateMany(dict(stale,
+                                    assignee={'$nin': list(reassignments)}),
+                               assign(default_assignee)))
+    return conn.run(
+        conn.collection('backlog')
+        .bulk_write(requests, ordered=False)).modified_count
+
+
 @register_query(MongoDBConnection)
 def get_transaction_from_block(conn, transaction_id, block_id):
     try:
@@ -87,7 +123,19 @@ def get_transaction_from_backlog(conn, transaction_id):
         .find_one({'id': transaction_id},
                   projection={'_id': False,
                               'assignee': False,
-                              'assignment_timestamp': False}))
+                              'assignment_timestamp': False,
+                              'assignment_expiry': False}))
+
+
+@register_query(MongoDBConnection)
+def get_transactions_from_backlog(conn, transaction_ids):
+    return conn.run(
+        conn.collection('backlog')
+        .find({'id': {'$in': transaction_ids}},
+              projection={'_id': False,
+                          'assignee': False,
+                          'assignment_timestamp': False,
+                          'assignment_expiry': False}))
 
 
 @register_query(MongoDBConnection)
@@ -99,7 +147,80 @@ def get_blocks_status_from_transaction(conn, transaction_id):
 
 
 @register_query(MongoDBConnection)
-def get_txids_filtered(conn, asset_id, operation=None):
+def get_blocks_status(conn, block_ids):
+    return conn.run(
+        conn.collection('bigchain')
+        .find({'id': {'$in': block_ids}},
+              projection=['id', 'block.voters']))
+
+
+@register_query(MongoDBConnection)
+def get_blocks(conn):
+    return conn.run(
+        conn.collection('bigchain')
+        .find(projection={'_id': False}))
+
+
+@register_query(MongoDBConnection)
+def get_indexed_transactions(conn, transaction_ids):
+    return conn.run(
+        conn.collection('transactions')
+        .find({'transaction_id': {'$in': transaction_ids}},
+              projection={'_id': False}))
+
+
+@register_query(MongoDBConnection)
+def write_transactions_index(conn, blocks):
+    index = [entry for block in blocks
+             for entry in index_block_transactions(block)]
+    if index:
+        return _insert_many_unordered(conn, 'transactions', index)
+
+
+@register_query(MongoDBConnection)
+def update_transactions_status(conn, block_id, status):
+    return conn.run(
+        conn.collection('transactions')
+        .update_many({'block_id': block_id, 'status': {'$ne': status}},
+                     {'$set': {'status': status}}))
+
+
+@register_query(MongoDBConnection)
+def store_outputs(conn, outputs):
+    return conn.run(
+        conn.collection('outputs')
+        .bulk_write([UpdateOne({'transaction_id': output['transaction_id'],
+                                'output_index': output['output_index']},
+                               {'$set': output}, upsert=True)
+                     for output in outputs], ordered=False))
+
+
+@register_query(MongoDBConnection)
+def spend_outputs(conn, spends):
+    return conn.run(
+        conn.collection('outputs')
+        .bulk_write([UpdateOne({'transaction_id': spend['transaction_id'],
+                                'output_index': spend['output_index']},
+                               {'$set': {'spent_by': spend['spent_by']}},
+                               upsert=True)
+                     for spend in spends], ordered=False))
+
+
+@register_query(MongoDBConnection)
+def get_outputs_by_public_key(conn, public_key, spent=None):
+    query = {'public_keys': public_key}
+    if spent is True:
+        query['spent_by'] = {'$ne': None}
+    elif spent is False:
+        query['spent_by'] = None
+    return conn.run(
+        conn.collection('outputs')
+        .find(query, projection={'_id': False}))
+
+
+@register_query(MongoDBConnection)
+def get_txids_filtered(conn, asset_id, operation=None, *, after=None,
+                       limit=0):
     match_create = {
         'block.transactions.operation': 'CREATE',
         'block.transactions.id': asset_id
@@ -116,16 +237,26 @@ def get_txids_filtered(conn, asset_id, operation=None):
     else:
         match = {'$or': [match_create, match_transfer]}
 
+    if after is not None:
+        # skip the blocks and the transactions of the previous pages before
+        # grouping and sorting, rather than the whole asset for every page
+        match = {'$and': [match, {'block.transactions.id': {'$gt': after}}]}
+
     pipeline = [
         {'$match': match},
         {'$unwind': '$block.transactions'},
         {'$match': match},
-        {'$project': {'block.transactions.id': True}}
+        # a transaction may be in several blocks
+        {'$group': {'_id': '$block.transactions.id'}},
+        {'$sort': {'_id': ASCENDING}},
     ]
+    if limit:
+        pipeline.append({'$limit': limit})
+    # the transactions of a large asset may not be grouped in memory
     cursor = conn.run(
         conn.collection('bigchain')
-        .aggregate(pipeline))
-    return (elem['block']['transactions']['id'] for elem in cursor)
+        .aggregate(pipeline, allowDiskUse=True))
+    return (elem['_id'] for elem in cursor)
 
 
 # TODO: This doesn't seem to be used anywhere
@@ -215,6 +346,14 @@ def get_votes_by_block_id(conn, block_id):
               projection={'_id': False}))
 
 
+@register_query(MongoDBConnection)
+def get_votes_by_block_ids(conn, block_ids):
+    return conn.run(
+        conn.collection('votes')
+        .find({'vote.voting_for_block': {'$in': block_ids}},
+              projection={'_id': False}))
+
+
 @register_query(MongoDBConnection)
 def get_votes_for_blocks_by_voter(conn, block_ids, node_pubkey):
     return conn.run(
@@ -235,9 +374,61 @@ def get_votes_by_block_id_and_voter(conn, block_id, node_pubkey):
 
 @register_query(MongoDBConnection)
 def write_block(conn, block_dict):
-    return conn.run(
+    index = index_block_transactions(block_dict)
+    result = conn.run(
         conn.collection('bigchain')
         .insert_one(block_dict))
+    if index:
+        # The entries of a block may already have been written by a previous
+        # attempt to write it.
+        _insert_many_unordered(conn, 'transactions', index)
+    return result
+
+
+def _only_duplicate_keys(exc):
+    # An unordered bulk insert reports the errors of all its documents.
+    if isinstance(exc, DuplicateKeyError):
+        return True
+    cause = exc.__cause__
+    if not isinstance(cause, BulkWriteError):
+        return False
+    write_errors = cause.details.get('writeErrors', [])
+    return (bool(write_errors) and
+            not cause.details.get('writeConcernErrors') and
+            all(error['code'] == DUPLICATE_KEY_ERROR_CODE
+                for error in write_errors))
+
+
+def _insert_many_unordered(conn, collection, documents):
+    # unordered means that all the inserts will be attempted instead of
+    # stopping after the first error, so that the documents that were
+    # already written by a previous attempt are skipped.
+    try:
+        return conn.run(
+            conn.collection(collection)
+            .insert_many(documents, ordered=False))
+    except OperationError as exc:
+        if not _only_duplicate_keys(exc):
+            raise
+
+
+@register_query(MongoDBConnection)
+def write_decoupled_block(conn, block, assets, metadata):
+    # One unordered bulk insert per collection.
+    writes = [('transactions', index_block_transactions(block)),
+              ('assets', assets),
+              ('metadata', metadata)]
+    for collection, documents in writes:
+        if documents:
+            _insert_many_unordered(conn, collection, documents)
+
+    try:
+        return conn.run(
+            conn.collection('bigchain')
+            .insert_one(block))
+    # The block was written by a previous attempt.
+    except DuplicateKeyError:
+        return
 
 
 @register_query(MongoDBConnection)
@@ -291,6 +482,20 @@ def get_metadata(conn, txn_ids):
               projection={'_id': False}))
 
 
+@register_query(MongoDBConnection)
+def get_migrations(conn):
+    return conn.run(
+        conn.collection('migrations')
+        .find(projection={'_id': False}))
+
+
+@register_query(MongoDBConnection)
+def write_migration(conn, name):
+    return conn.run(
+        conn.collection('migrations')
+        .update_one({'id': name}, {'$set': {'id': name}}, upsert=True))
+
+
 @register_query(MongoDBConnection)
 def count_blocks(conn):
     return conn.run(
@@ -309,6 +514,12 @@ def count_backlog(conn):
 def write_vote(conn, vote):
     conn.run(conn.collection('votes').insert_one(vote))
     vote.pop('_id')
+    # advance the voting tip of the node, if the vote extends it
+    conn.run(
+        conn.collection('voting_tips')
+        .update_one({'_id': vote['node_pubkey'],
+                     'block_id': vote['vote']['previous_block']},
+                    {'$set': {'block_id': vote['vote']['voting_for_block']}}))
     return vote
 
 
@@ -324,6 +535,43 @@ def get_genesis_block(conn):
 
 @register_query(MongoDBConnection)
 def get_last_voted_block_id(conn, node_pubkey):
+    # The voting tip of a node is the last block it voted on, it is advanced
+    # by `write_vote`.
+    tip = conn.run(
+        conn.collection('voting_tips')
+        .find_one({'_id': node_pubkey}))
+    if tip is None:
+        last_block_id = _rebuild_last_voted_block_id(conn, node_pubkey)
+    else:
+        last_block_id = tip['block_id']
+
+    # The tip is behind if a vote was written but not the tip, so follow
+    # the votes extending it, if any.
+    explored = {last_block_id}
+    while True:
+        vote = conn.run(
+            conn.collection('votes')
+            .find_one({'node_pubkey': node_pubkey,
+                       'vote.previous_block': last_block_id},
+                      projection={'vote.voting_for_block': True},
+                      sort=[('vote.timestamp', -1)]))
+        if vote is None:
+            break
+        last_block_id = vote['vote']['voting_for_block']
+        if last_block_id in explored:
+            raise CyclicBlockchainError()
+        explored.add(last_block_id)
+
+    if tip is None or tip['block_id'] != last_block_id:
+        conn.run(
+            conn.collection('voting_tips')
+            .update_one({'_id': node_pubkey},
+                        {'$set': {'block_id': last_block_id}},
+                        upsert=True))
+    return last_block_id
+
+
+def _rebuild_last_voted_block_id(conn, node_pubkey):
     last_voted = conn.run(
             conn.collection('votes')
             .find({'node_pubkey': node_pubkey},
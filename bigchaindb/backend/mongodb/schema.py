@@ -2,7 +2,7 @@
 
 import logging
 
-from pymongo import ASCENDING, DESCENDING, TEXT
+from pymongo import ASCENDING, TEXT
 
 from bigchaindb import backend
 from bigchaindb.common import exceptions
@@ -27,7 +27,7 @@ def create_database(conn, dbname):
 
 @register_schema(MongoDBConnection)
 def create_tables(conn, dbname):
-    for table_name in ['bigchain', 'backlog', 'votes', 'assets', 'metadata']:
+    for table_name in backend.schema.TABLES:
         logger.info('Create `%s` table.', table_name)
         # create the table
         # TODO: read and write concerns can be declared here
@@ -41,6 +41,20 @@ def create_indexes(conn, dbname):
     create_votes_secondary_index(conn, dbname)
     create_assets_secondary_index(conn, dbname)
     create_metadata_secondary_index(conn, dbname)
+    create_transactions_secondary_index(conn, dbname)
+    create_outputs_secondary_index(conn, dbname)
+    create_migrations_secondary_index(conn, dbname)
+
+
+@register_schema(MongoDBConnection)
+def create_missing_tables(conn, dbname):
+    existing = conn.conn[dbname].collection_names()
+    for table_name in backend.schema.TABLES:
+        if table_name not in existing:
+            logger.info('Create `%s` table.', table_name)
+            conn.conn[dbname].create_collection(table_name)
+    # creating an index that already exists does nothing
+    create_indexes(conn, dbname)
 
 
 @register_schema(MongoDBConnection)
@@ -91,11 +105,12 @@ def create_backlog_secondary_index(conn, dbname):
                                               name='transaction_id',
                                               unique=True)
 
-    # compound index to read transactions from the backlog per assignee
+    # compound index to read transactions from the backlog per assignee,
+    # and to reclaim the expired assignments of an assignee
     conn.conn[dbname]['backlog']\
         .create_index([('assignee', ASCENDING),
-                       ('assignment_timestamp', DESCENDING)],
-                      name='assignee__transaction_timestamp')
+                       ('assignment_expiry', ASCENDING)],
+                      name='assignee__assignment_expiry')
 
 
 def create_votes_secondary_index(conn, dbname):
@@ -110,6 +125,13 @@ def create_votes_secondary_index(conn, dbname):
                                             name='block_and_voter',
                                             unique=True)
 
+    # compound index to follow the votes of a node, from the block they
+    # extend
+    conn.conn[dbname]['votes'].create_index([('node_pubkey', ASCENDING),
+                                             ('vote.previous_block',
+                                              ASCENDING)],
+                                            name='voter_and_previous_block')
+
 
 def create_assets_secondary_index(conn, dbname):
     logger.info('Create `assets` secondary index.')
@@ -136,3 +158,45 @@ def create_metadata_secondary_index(conn, dbname):
 
     # full text search index
     conn.conn[dbname]['metadata'].create_index([('$**', TEXT)], name='text')
+
+
+def create_transactions_secondary_index(conn, dbname):
+    logger.info('Create `transactions` secondary index.')
+
+    # compound index to look up the entries of a transaction, a
+    # transaction is indexed once per block containing it
+    conn.conn[dbname]['transactions']\
+        .create_index([('transaction_id', ASCENDING),
+                       ('block_id', ASCENDING)],
+                      name='transaction_and_block',
+                      unique=True)
+
+    # to update the status of the transactions of a block
+    conn.conn[dbname]['transactions'].create_index('block_id',
+                                                   name='block_id')
+
+
+def create_outputs_secondary_index(conn, dbname):
+    logger.info('Create `outputs` secondary index.')
+
+    # unique index on the transaction link of the outputs
+    conn.conn[dbname]['outputs']\
+        .create_index([('transaction_id', ASCENDING),
+                       ('output_index', ASCENDING)],
+                      name='output',
+                      unique=True)
+
+    # to look up the (unspent) outputs of a public key
+    conn.conn[dbname]['outputs']\
+        .create_index([('public_keys', ASCENDING),
+                       ('spent_by', ASCENDING)],
+                      name='public_keys')
+
+
+def create_migrations_secondary_index(conn, dbname):
+    logger.info('Create `migrations` secondary index.')
+
+    # unique index on the name of the migrations
+    conn.conn[dbname]['migrations'].create_index('id',
+                                                 name='migration_id',
+                                                 unique=True)
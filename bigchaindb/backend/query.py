@@ -19,6 +19,23 @@ def write_transaction(connection, signed_transaction):
     raise NotImplementedError
 
 
+@singledispatch
+def write_transactions(connection, signed_transactions):
+    """Write several transactions to the backlog table at once.
+
+    The transactions that are already in the backlog are skipped, the
+    others are written.
+
+    Args:
+        signed_transactions (list): the signed transactions.
+
+    Returns:
+        The result of the operation.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def update_transaction(connection, transaction_id, doc):
     """Update a transaction in the backlog table.
@@ -65,6 +82,28 @@ def get_stale_transactions(connection, reassign_delay):
     raise NotImplementedError
 
 
+@singledispatch
+def reassign_stale_transactions(connection, reassignments, default_assignee,
+                                lease_duration):
+    """Reassign in bulk the transactions of the backlog of which the
+    assignment expired, and renew their assignment for ``lease_duration``
+    seconds.
+
+    Args:
+        reassignments (dict): the new assignee of the stale transactions of
+            each assignee.
+        default_assignee (str): the new assignee of the stale transactions
+            of the assignees missing from ``reassignments``.
+        lease_duration (float): the duration (in seconds) of the new
+            assignments.
+
+    Returns:
+        int: the number of reassigned transactions.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def get_transaction_from_block(connection, transaction_id, block_id):
     """Get a transaction from a specific block.
@@ -94,6 +133,20 @@ def get_transaction_from_backlog(connection, transaction_id):
     raise NotImplementedError
 
 
+@singledispatch
+def get_transactions_from_backlog(connection, transaction_ids):
+    """Get many transactions from backlog.
+
+    Args:
+        transaction_ids (list): the ids of the transactions.
+
+    Returns:
+        A cursor of the matching transactions.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def get_blocks_status_from_transaction(connection, transaction_id):
     """Retrieve block election information given a secondary index and value.
@@ -109,6 +162,139 @@ def get_blocks_status_from_transaction(connection, transaction_id):
     raise NotImplementedError
 
 
+@singledispatch
+def get_blocks_status(connection, block_ids):
+    """Retrieve the election information of blocks.
+
+    Args:
+        block_ids (list): the ids of the blocks.
+
+    Returns:
+        :obj:`list` of :obj:`dict`: A list of blocks with only election
+        information.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_blocks(connection):
+    """Get all the blocks, e.g. to migrate the data derived from them.
+
+    Returns:
+        A cursor of the blocks, with their assets and metadata decoupled.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_indexed_transactions(connection, transaction_ids):
+    """Get the entries of the transactions table for the given
+    transactions.
+
+    There is one entry per transaction and block containing it, holding
+    the transaction (with its asset and metadata decoupled) and the status
+    of the block, as last recorded by :func:`update_transactions_status`.
+
+    Args:
+        transaction_ids (list): the ids of the transactions.
+
+    Returns:
+        A cursor of ``{'transaction_id', 'block_id', 'status',
+        'transaction'}`` documents.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def write_transactions_index(connection, blocks):
+    """Write the entries of the transactions table for the transactions of
+    blocks, e.g. of the blocks written before the table existed (see
+    :mod:`bigchaindb.migrations`).
+
+    The entries that already exist are skipped.
+
+    Args:
+        blocks (list): the blocks, with their assets and metadata
+            decoupled.
+
+    Returns:
+        The database response.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def update_transactions_status(connection, block_id, status):
+    """Record the election status of a block in the entries of the
+    transactions table of its transactions.
+
+    Args:
+        block_id (str): the id of the block.
+        status (str): the status of the block.
+
+    Returns:
+        The database response.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def store_outputs(connection, outputs):
+    """Write outputs to the outputs table, or update them if they already
+    exist.
+
+    Args:
+        outputs (list): the outputs, as ``{'transaction_id',
+            'output_index', 'public_keys', 'amount', 'asset_id'}``
+            documents.
+
+    Returns:
+        The database response.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def spend_outputs(connection, spends):
+    """Mark outputs of the outputs table as spent.
+
+    The outputs need not be stored yet: they are created if needed, and
+    completed by :func:`store_outputs`.
+
+    Args:
+        spends (list): ``{'transaction_id', 'output_index', 'spent_by'}``
+            documents, `spent_by` being the id of the spending transaction.
+
+    Returns:
+        The database response.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_outputs_by_public_key(connection, public_key, spent=None):
+    """Get the outputs of the outputs table owned by a public key.
+
+    Args:
+        public_key (str): base58 encoded public key.
+        spent (bool): If ``True`` return only the spent outputs. If
+            ``False`` return only unspent outputs. If spent is not
+            specified (``None``) return all outputs.
+
+    Returns:
+        A cursor of the matching outputs.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def get_asset_by_id(conneciton, asset_id):
     """Returns the asset associated with an asset_id.
@@ -184,6 +370,20 @@ def get_votes_by_block_id(connection, block_id):
     raise NotImplementedError
 
 
+@singledispatch
+def get_votes_by_block_ids(connection, block_ids):
+    """Get all the votes casted for many blocks.
+
+    Args:
+        block_ids (list): the block ids to use.
+
+    Returns:
+        A cursor for the matching votes.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def get_votes_by_block_id_and_voter(connection, block_id, node_pubkey):
     """Get all the votes casted for a specific block by a specific voter.
@@ -215,7 +415,8 @@ def get_votes_for_blocks_by_voter(connection, block_ids, pubkey):
 
 @singledispatch
 def write_block(connection, block):
-    """Write a block to the bigchain table.
+    """Write a block to the bigchain table, and index its transactions in
+    the transactions table.
 
     Args:
         block (dict): the block to write.
@@ -227,6 +428,28 @@ def write_block(connection, block):
     raise NotImplementedError
 
 
+@singledispatch
+def write_decoupled_block(connection, block, assets, metadata):
+    """Write a block decoupled from its assets and metadata, that is the
+    assets, the metadata, the index of the transactions of the block and the
+    block itself, in as few round trips as possible.
+
+    The block is written last, so that a block is never visible before its
+    assets and metadata. Writing the same block again is a no-op, so a
+    failed write can safely be retried.
+
+    Args:
+        block (dict): the block to write, without assets and metadata.
+        assets (list): the assets of the block.
+        metadata (list): the metadata of the transactions of the block.
+
+    Returns:
+        The database response to the write of the block.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def get_block(connection, block_id):
     """Get a block from the bigchain table.
@@ -295,6 +518,32 @@ def get_metadata(connection, txn_ids):
     raise NotImplementedError
 
 
+@singledispatch
+def get_migrations(connection):
+    """Get the migrations applied to the database.
+
+    Returns:
+        A cursor of ``{'id'}`` documents, ``id`` being the name of the
+        migration.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def write_migration(connection, name):
+    """Record that a migration was applied to the database.
+
+    Args:
+        name (str): the name of the migration.
+
+    Returns:
+        The database response.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def count_blocks(connection):
     """Count the number of blocks in the bigchain table.
@@ -358,12 +607,17 @@ def get_last_voted_block_id(connection, node_pubkey):
 
 
 @singledispatch
-def get_txids_filtered(connection, asset_id, operation=None):
-    """Return all transactions for a particular asset id and optional operation.
+def get_txids_filtered(connection, asset_id, operation=None, *, after=None,
+                       limit=0):
+    """Return the ids of the transactions of a particular asset id and
+    optional operation, in ascending order and without duplicates.
 
     Args:
         asset_id (str): ID of transaction that defined the asset
         operation (str) (optional): Operation to filter on
+        after (str) (optional): only return the ids greater than this one
+        limit (int) (optional): the maximum number of ids to return, 0
+            meaning no limit
     """
 
     raise NotImplementedError
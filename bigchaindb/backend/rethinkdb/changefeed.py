@@ -47,9 +47,13 @@ def run_changefeed(connection, table):
 
 
 @register_changefeed(RethinkDBConnection)
-def get_changefeed(connection, table, operation, *, prefeed=None):
+def get_changefeed(connection, table, operation, *, prefeed=None,
+                   checkpoint=None, acks=False):
     """Return a RethinkDB changefeed.
 
+    RethinkDB changefeeds cannot be resumed, so the ``checkpoint`` and
+    ``acks`` are ignored.
+
     Returns:
         An instance of
         :class:`~bigchaindb.backend.rethinkdb.RethinkDBChangeFeed`.
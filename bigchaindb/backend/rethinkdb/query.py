@@ -9,7 +9,8 @@ from bigchaindb.backend.rethinkdb import changefeed
 from bigchaindb.common import exceptions
 from bigchaindb.common.transaction import Transaction
 from bigchaindb.common.utils import serialize
-from bigchaindb.backend.utils import module_dispatch_registrar
+from bigchaindb.backend.utils import (module_dispatch_registrar,
+                                      index_block_transactions)
 from bigchaindb.backend.rethinkdb.connection import RethinkDBConnection
 
 
@@ -29,6 +30,13 @@ def write_transaction(connection, signed_transaction):
             .insert(signed_transaction, durability=WRITE_DURABILITY))
 
 
+@register_query(RethinkDBConnection)
+def write_transactions(connection, signed_transactions):
+    return connection.run(
+            r.table('backlog')
+            .insert(signed_transactions, durability=WRITE_DURABILITY))
+
+
 @register_query(RethinkDBConnection)
 def update_transaction(connection, transaction_id, doc):
     return connection.run(
@@ -52,6 +60,34 @@ def get_stale_transactions(connection, reassign_delay):
             .filter(lambda tx: time() - tx['assignment_timestamp'] > reassign_delay))
 
 
+@register_query(RethinkDBConnection)
+def reassign_stale_transactions(connection, reassignments, default_assignee,
+                                lease_duration):
+    now = time()
+
+    def assign(assignee):
+        return {'assignee': assignee,
+                'assignment_timestamp': now,
+                'assignment_expiry': now + lease_duration}
+
+    # The transactions assigned before the assignments had an expiry are
+    # indexed as expired, see `create_backlog_secondary_index`.
+    reassigned = 0
+    for assignee, new_assignee in reassignments.items():
+        reassigned += connection.run(
+                r.table('backlog')
+                .between([assignee, r.minval], [assignee, now],
+                         index='assignee__assignment_expiry')
+                .update(assign(new_assignee)))['replaced']
+    reassigned += connection.run(
+            r.table('backlog')
+            .between(r.minval, now, index='assignment_expiry')
+            .filter(lambda tx: r.expr(list(reassignments))
+                    .contains(tx['assignee']).not_())
+            .update(assign(default_assignee)))['replaced']
+    return reassigned
+
+
 @register_query(RethinkDBConnection)
 def get_transaction_from_block(connection, transaction_id, block_id):
     return connection.run(
@@ -67,10 +103,18 @@ def get_transaction_from_backlog(connection, transaction_id):
     return connection.run(
             r.table('backlog')
             .get(transaction_id)
-            .without('assignee', 'assignment_timestamp')
+            .without('assignee', 'assignment_timestamp', 'assignment_expiry')
             .default(None))
 
 
+@register_query(RethinkDBConnection)
+def get_transactions_from_backlog(connection, transaction_ids):
+    return connection.run(
+            r.table('backlog')
+            .get_all(*transaction_ids)
+            .without('assignee', 'assignment_timestamp', 'assignment_expiry'))
+
+
 @register_query(RethinkDBConnection)
 def get_blocks_status_from_transaction(connection, transaction_id):
     return connection.run(
@@ -80,7 +124,71 @@ def get_blocks_status_from_transaction(connection, transaction_id):
 
 
 @register_query(RethinkDBConnection)
-def get_txids_filtered(connection, asset_id, operation=None):
+def get_blocks_status(connection, block_ids):
+    return connection.run(
+            r.table('bigchain', read_mode=READ_MODE)
+            .get_all(*block_ids)
+            .pluck('id', {'block': ['voters']}))
+
+
+@register_query(RethinkDBConnection)
+def get_blocks(connection):
+    return connection.run(
+            r.table('bigchain', read_mode=READ_MODE))
+
+
+@register_query(RethinkDBConnection)
+def get_indexed_transactions(connection, transaction_ids):
+    return connection.run(
+            r.table('transactions', read_mode=READ_MODE)
+            .get_all(*transaction_ids, index='transaction_id')
+            .without('id'))
+
+
+@register_query(RethinkDBConnection)
+def update_transactions_status(connection, block_id, status):
+    return connection.run(
+            r.table('transactions')
+            .get_all(block_id, index='block_id')
+            .filter(r.row['status'] != status)
+            .update({'status': status}))
+
+
+def _output_id(output):
+    # outputs are identified by their transaction link
+    return [output['transaction_id'], output['output_index']]
+
+
+@register_query(RethinkDBConnection)
+def store_outputs(connection, outputs):
+    return connection.run(
+            r.table('outputs')
+            .insert([dict(output, id=_output_id(output)) for output in outputs],
+                    conflict='update', durability=WRITE_DURABILITY))
+
+
+@register_query(RethinkDBConnection)
+def spend_outputs(connection, spends):
+    return connection.run(
+            r.table('outputs')
+            .insert([dict(spend, id=_output_id(spend)) for spend in spends],
+                    conflict='update', durability=WRITE_DURABILITY))
+
+
+@register_query(RethinkDBConnection)
+def get_outputs_by_public_key(connection, public_key, spent=None):
+    query = (r.table('outputs', read_mode=READ_MODE)
+             .get_all(public_key, index='public_keys'))
+    if spent is True:
+        query = query.filter(r.row.has_fields('spent_by'))
+    elif spent is False:
+        query = query.filter(~r.row.has_fields('spent_by'))
+    return connection.run(query.without('id'))
+
+
+@register_query(RethinkDBConnection)
+def get_txids_filtered(connection, asset_id, operation=None, *, after=None,
+                       limit=0):
     # here we only want to return the transaction ids since later on when
     # we are going to retrieve the transaction with status validation
 
@@ -100,7 +208,10 @@ def get_txids_filtered(connection, asset_id, operation=None):
             .filter(lambda transaction: transaction['asset']['id'] == asset_id)
             .get_field('id')))
 
-    return chain(*parts)
+    txids = sorted(set(chain(*parts)))
+    if after is not None:
+        txids = [txid for txid in txids if txid > after]
+    return iter(txids[:limit or None])
 
 
 @register_query(RethinkDBConnection)
@@ -146,6 +257,16 @@ def get_votes_by_block_id(connection, block_id):
             .without('id'))
 
 
+@register_query(RethinkDBConnection)
+def get_votes_by_block_ids(connection, block_ids):
+    votes = r.table('votes', read_mode=READ_MODE)
+    return connection.run(
+            r.expr(block_ids)
+            .concat_map(lambda block_id: votes.between([block_id, r.minval], [block_id, r.maxval],
+                                                       index='block_and_voter'))
+            .without('id'))
+
+
 @register_query(RethinkDBConnection)
 def get_votes_by_block_id_and_voter(connection, block_id, node_pubkey):
     return connection.run(
@@ -154,11 +275,53 @@ def get_votes_by_block_id_and_voter(connection, block_id, node_pubkey):
             .without('id'))
 
 
+def _index_block_transactions(block_dict):
+    # The primary key of an entry is deterministic so that writing the same
+    # block again does not duplicate its entries.
+    return [dict(entry, id=[entry['transaction_id'], entry['block_id']])
+            for entry in index_block_transactions(block_dict)]
+
+
 @register_query(RethinkDBConnection)
 def write_block(connection, block_dict):
-    return connection.run(
+    result = connection.run(
             r.table('bigchain')
             .insert(r.json(serialize(block_dict)), durability=WRITE_DURABILITY))
+    index = _index_block_transactions(block_dict)
+    if index:
+        connection.run(
+            r.table('transactions')
+            .insert(r.json(serialize(index)), durability=WRITE_DURABILITY))
+    return result
+
+
+@register_query(RethinkDBConnection)
+def write_transactions_index(connection, blocks):
+    index = [entry for block in blocks
+             for entry in _index_block_transactions(block)]
+    if index:
+        # The entries that already exist are reported as errors, and skipped.
+        return connection.run(
+                r.table('transactions')
+                .insert(r.json(serialize(index)), durability=WRITE_DURABILITY))
+
+
+@register_query(RethinkDBConnection)
+def write_decoupled_block(connection, block, assets, metadata):
+    writes = [('transactions', _index_block_transactions(block)),
+              ('assets', assets),
+              ('metadata', metadata)]
+    writes = [r.table(table).insert(r.json(serialize(documents)),
+                                    durability=WRITE_DURABILITY)
+              for table, documents in writes if documents]
+    # The inserts are sent together in a single query. The documents that
+    # were already written by a previous attempt are reported as errors in
+    # the response, and skipped.
+    if writes:
+        connection.run(r.expr(writes))
+    return connection.run(
+            r.table('bigchain')
+            .insert(r.json(serialize(block)), durability=WRITE_DURABILITY))
 
 
 @register_query(RethinkDBConnection)
@@ -194,6 +357,20 @@ def get_metadata(connection, txn_ids):
             .get_all(*txn_ids))
 
 
+@register_query(RethinkDBConnection)
+def get_migrations(connection):
+    return connection.run(
+            r.table('migrations', read_mode=READ_MODE))
+
+
+@register_query(RethinkDBConnection)
+def write_migration(connection, name):
+    return connection.run(
+            r.table('migrations')
+            .insert({'id': name}, conflict='replace',
+                    durability=WRITE_DURABILITY))
+
+
 @register_query(RethinkDBConnection)
 def count_blocks(connection):
     return connection.run(
@@ -23,7 +23,7 @@ def create_database(connection, dbname):
 
 @register_schema(RethinkDBConnection)
 def create_tables(connection, dbname):
-    for table_name in ['bigchain', 'backlog', 'votes', 'assets', 'metadata']:
+    for table_name in backend.schema.TABLES:
         logger.info('Create `%s` table.', table_name)
         connection.run(r.db(dbname).table_create(table_name))
 
@@ -33,6 +33,26 @@ def create_indexes(connection, dbname):
     create_bigchain_secondary_index(connection, dbname)
     create_backlog_secondary_index(connection, dbname)
     create_votes_secondary_index(connection, dbname)
+    create_transactions_secondary_index(connection, dbname)
+    create_outputs_secondary_index(connection, dbname)
+
+
+@register_schema(RethinkDBConnection)
+def create_missing_tables(connection, dbname):
+    secondary_indexes = {
+        'bigchain': create_bigchain_secondary_index,
+        'backlog': create_backlog_secondary_index,
+        'votes': create_votes_secondary_index,
+        'transactions': create_transactions_secondary_index,
+        'outputs': create_outputs_secondary_index,
+    }
+    existing = connection.run(r.db(dbname).table_list())
+    for table_name in backend.schema.TABLES:
+        if table_name not in existing:
+            logger.info('Create `%s` table.', table_name)
+            connection.run(r.db(dbname).table_create(table_name))
+            if table_name in secondary_indexes:
+                secondary_indexes[table_name](connection, dbname)
 
 
 @register_schema(RethinkDBConnection)
@@ -101,11 +121,23 @@ def create_bigchain_secondary_index(connection, dbname):
 def create_backlog_secondary_index(connection, dbname):
     logger.info('Create `backlog` secondary index.')
 
-    # compound index to read transactions from the backlog per assignee
+    # The transactions assigned before the assignments had an expiry are
+    # indexed as expired.
+    assignment_expiry = r.row['assignment_expiry'].default(0)
+
+    # compound index to read transactions from the backlog per assignee,
+    # and to reclaim the expired assignments of an assignee
+    connection.run(
+        r.db(dbname)
+        .table('backlog')
+        .index_create('assignee__assignment_expiry', [r.row['assignee'], assignment_expiry]))
+
+    # to reclaim the expired assignments of the nodes that left the
+    # federation
     connection.run(
         r.db(dbname)
         .table('backlog')
-        .index_create('assignee__transaction_timestamp', [r.row['assignee'], r.row['assignment_timestamp']]))
+        .index_create('assignment_expiry', assignment_expiry))
 
     # wait for rethinkdb to finish creating secondary indexes
     connection.run(
@@ -128,3 +160,42 @@ def create_votes_secondary_index(connection, dbname):
         r.db(dbname)
         .table('votes')
         .index_wait())
+
+
+def create_transactions_secondary_index(connection, dbname):
+    logger.info('Create `transactions` secondary index.')
+
+    # to look up the entries of a transaction, a transaction is indexed once
+    # per block containing it
+    connection.run(
+        r.db(dbname)
+        .table('transactions')
+        .index_create('transaction_id'))
+
+    # to update the status of the transactions of a block
+    connection.run(
+        r.db(dbname)
+        .table('transactions')
+        .index_create('block_id'))
+
+    # wait for rethinkdb to finish creating secondary indexes
+    connection.run(
+        r.db(dbname)
+        .table('transactions')
+        .index_wait())
+
+
+def create_outputs_secondary_index(connection, dbname):
+    logger.info('Create `outputs` secondary index.')
+
+    # to look up the outputs of a public key
+    connection.run(
+        r.db(dbname)
+        .table('outputs')
+        .index_create('public_keys', multi=True))
+
+    # wait for rethinkdb to finish creating secondary indexes
+    connection.run(
+        r.db(dbname)
+        .table('outputs')
+        .index_wait())
@@ -8,6 +8,12 @@ Attributes:
         * ``bigchain`` for blocks.
         * ``votes`` to store votes for each block by each federation
           node.
+        * ``transactions`` to look up the transactions of the blocks, along
+          with the status of their block.
+        * ``outputs`` for the outputs of the transactions of the valid
+          blocks, and whether they are spent.
+        * ``migrations`` for the migrations applied to the data of the
+          database (see :mod:`bigchaindb.migrations`).
 
 """
 
@@ -15,13 +21,20 @@ from functools import singledispatch
 import logging
 
 import bigchaindb
+from bigchaindb.backend import query
 from bigchaindb.backend.connection import connect
 from bigchaindb.common.exceptions import ValidationError
-from bigchaindb.common.utils import validate_all_values_for_key
+from bigchaindb.common.utils import (validate_all_keys,
+                                     validate_all_values_for_key,
+                                     validate_key)
 
 logger = logging.getLogger(__name__)
 
-TABLES = ('bigchain', 'backlog', 'votes', 'assets', 'metadata')
+TABLES = ('bigchain', 'backlog', 'votes', 'assets', 'metadata',
+          'transactions', 'outputs', 'migrations')
+# The migrations of the data of a database, in the order they are applied
+# (see :mod:`bigchaindb.migrations`).
+MIGRATIONS = ('index_transactions', 'store_outputs')
 VALID_LANGUAGES = ('danish', 'dutch', 'english', 'finnish', 'french', 'german',
                    'hungarian', 'italian', 'norwegian', 'portuguese', 'romanian',
                    'russian', 'spanish', 'swedish', 'turkish', 'none',
@@ -66,6 +79,18 @@ def create_indexes(connection, dbname):
     raise NotImplementedError
 
 
+@singledispatch
+def create_missing_tables(connection, dbname):
+    """Create the tables, along with their indexes, that do not exist in a
+    database initialized by an earlier version of BigchainDB.
+
+    Args:
+        dbname (str): the name of the database to update.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def drop_database(connection, dbname):
     """Drop the database used by BigchainDB.
@@ -85,7 +110,7 @@ def init_database(connection=None, dbname=None):
     """Initialize the configured backend for use with BigchainDB.
 
     Creates a database with :attr:`dbname` with any required tables
-    and supporting indexes.
+    and supporting indexes, and records the :attr:`MIGRATIONS` as applied.
 
     Args:
         connection (:class:`~bigchaindb.backend.connection.Connection`): an
@@ -107,6 +132,10 @@ def init_database(connection=None, dbname=None):
     create_tables(connection, dbname)
     create_indexes(connection, dbname)
 
+    # a new database has no data to migrate
+    for name in MIGRATIONS:
+        query.write_migration(connection, name)
+
 
 def validate_language_key(obj, key):
     """Validate all nested "language" key in `obj`.
@@ -128,6 +157,46 @@ def validate_language_key(obj, key):
             validate_all_values_for_key(data, 'language', validate_language)
 
 
+def validate_transaction_keys(tx_body):
+    """Validate the keys of the asset data and of the metadata of a
+       transaction, along with the nested "language" keys of the asset data.
+
+       This is equivalent to calling
+       :func:`~bigchaindb.common.utils.validate_txn_obj` on the asset data
+       and on the metadata, and :func:`validate_language_key` on the asset
+       data, but walks the asset data only once.
+
+       Args:
+           tx_body (dict): the transaction to be validated.
+
+       Returns:
+           None: validation successful
+
+        Raises:
+            ValidationError: will raise exception in case a key or a language
+                is not valid.
+    """
+    backend = bigchaindb.config['database']['backend']
+
+    if backend == 'mongodb':
+        data = tx_body['asset'].get('data', {})
+        if isinstance(data, dict):
+            _validate_keys_and_language('asset', data)
+
+        metadata = tx_body.get('metadata', {})
+        if isinstance(metadata, dict):
+            validate_all_keys('metadata', metadata, validate_key)
+
+
+def _validate_keys_and_language(obj_name, obj):
+    for key, value in obj.items():
+        validate_key(obj_name, key)
+        if key == 'language':
+            validate_language(value)
+        elif isinstance(value, dict):
+            _validate_keys_and_language(obj_name, value)
+
+
 def validate_language(value):
     """Check if `value` is a valid language.
        https://docs.mongodb.com/manual/reference/text-search-languages/
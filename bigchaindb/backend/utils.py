@@ -19,3 +19,24 @@ def module_dispatch_registrar(module):
                          func=func_name, module=module.__name__)) from ex
         return wrapper
     return dispatch_wrapper
+
+
+def index_block_transactions(block_dict, status='undecided'):
+    """Return the documents of the ``transactions`` table for the
+    transactions of a block.
+
+    Args:
+        block_dict (dict): the block, with its assets and metadata
+            decoupled.
+        status (str): the election status of the block.
+
+    Returns:
+        list: one document per transaction, with the id of the
+        transaction, the id of the block, the status of the block and the
+        transaction itself.
+    """
+    return [{'transaction_id': tx['id'],
+             'block_id': block_dict['id'],
+             'status': status,
+             'transaction': tx}
+            for tx in block_dict['block']['transactions']]
@@ -15,7 +15,7 @@ from bigchaindb.common.exceptions import (StartupError,
                                           KeypairNotFoundException,
                                           DatabaseDoesNotExist)
 import bigchaindb
-from bigchaindb import backend, processes
+from bigchaindb import backend, migrations, processes
 from bigchaindb.backend import schema
 from bigchaindb.backend.admin import (set_replicas, set_shards, add_replicas,
                                       remove_replicas)
@@ -154,6 +154,22 @@ def run_init(args):
         print('If you wish to re-initialize it, first drop it.', file=sys.stderr)
 
 
+def _run_upgrade():
+    b = bigchaindb.Bigchain()
+
+    schema.create_missing_tables(b.connection,
+                                 bigchaindb.config['database']['name'])
+
+    for name in migrations.run_migrations(b):
+        logger.info('Migration `%s` applied.', name)
+
+
+@configure_bigchaindb
+def run_upgrade(args):
+    """Upgrade a database initialized by an earlier version"""
+    _run_upgrade()
+
+
 @configure_bigchaindb
 def run_drop(args):
     """Drop the database"""
@@ -198,9 +214,11 @@ def run_start(args):
     try:
         if not args.skip_initialize_database:
             logger.info('Initializing database')
-            _run_init()
-    except DatabaseAlreadyExists:
-        pass
+            try:
+                _run_init()
+            except DatabaseAlreadyExists:
+                logger.info('Upgrading database')
+                _run_upgrade()
     except KeypairNotFoundException:
         sys.exit(CANNOT_START_KEYPAIR_NOT_FOUND)
 
@@ -285,6 +303,10 @@ def create_parser():
     subparsers.add_parser('init',
                           help='Init the database')
 
+    subparsers.add_parser('upgrade',
+                          help='Upgrade a database initialized by an '
+                               'earlier version')
+
     subparsers.add_parser('drop',
                           help='Drop the database')
 
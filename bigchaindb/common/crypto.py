@@ -3,6 +3,8 @@ from collections import namedtuple
 
 import sha3
 from cryptoconditions import crypto
+from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
 
 
 CryptoKeypair = namedtuple('CryptoKeypair', ('private_key', 'public_key'))
@@ -30,3 +32,41 @@ def generate_key_pair():
 
 PrivateKey = crypto.Ed25519SigningKey
 PublicKey = crypto.Ed25519VerifyingKey
+
+
+def verify_batch(signatures):
+    """Verify a batch of Ed25519 signatures.
+
+    libsodium does not expose Ed25519 batch verification, so the batch is
+    checked in a single pass that builds each verifying key only once and
+    verifies each distinct ``(public_key, message, signature)`` triple only
+    once. The result of every triple is reported so that the caller can
+    find out which ones are invalid.
+
+    Args:
+        signatures (:obj:`list` of :obj:`tuple`): ``(public_key, message,
+            signature)`` triples, each element being a bytestring.
+
+    Returns:
+        :obj:`list` of bool: The validity of each triple, in order.
+    """
+    verifying_keys = {}
+    results = {}
+    valid = []
+
+    for triple in signatures:
+        if triple not in results:
+            public_key, message, signature = triple
+            try:
+                try:
+                    verifying_key = verifying_keys[public_key]
+                except KeyError:
+                    verifying_key = VerifyKey(public_key)
+                    verifying_keys[public_key] = verifying_key
+                verifying_key.verify(message, signature)
+                results[triple] = True
+            except (BadSignatureError, TypeError, ValueError):
+                results[triple] = False
+        valid.append(results[triple])
+
+    return valid
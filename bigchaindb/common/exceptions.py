@@ -112,5 +112,9 @@ class ThresholdTooDeep(ValidationError):
     """Raised if threshold condition is too deep"""
 
 
+class ConditionUriMismatch(ValidationError):
+    """Raised if the uri of an output condition does not match its details"""
+
+
 class GenesisBlockAlreadyExistsError(ValidationError):
     """Raised when trying to create the already existing genesis block"""
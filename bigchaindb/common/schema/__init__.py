@@ -33,8 +33,51 @@ _, TX_SCHEMA_TRANSFER = _load_schema('transaction_transfer_' +
 VOTE_SCHEMA_PATH, VOTE_SCHEMA = _load_schema('vote')
 
 
-def _validate_schema(schema, body):
-    """Validate data against a schema"""
+def _combine_schemas(*schemas):
+    """Combine schemas into a single one that data is valid against only
+    if it is valid against each of them.
+
+    The ``definitions`` of all the schemas are hoisted to the root of the
+    combined schema so that their ``#/definitions/...`` references still
+    resolve.
+    """
+    definitions = {}
+    all_of = []
+    for schema, _ in schemas:
+        schema = dict(schema)
+        schema.pop('$schema', None)
+        definitions.update(schema.pop('definitions', {}))
+        all_of.append(schema)
+    combined = {
+        '$schema': schemas[0][0]['$schema'],
+        'definitions': definitions,
+        'allOf': all_of,
+    }
+    fast_combined = rapidjson_schema.loads(rapidjson.dumps(combined))
+    return combined, fast_combined
+
+
+# NOTE: The common constraints and the operation specific ones are merged in
+#       a single compiled schema per operation, so that a transaction is
+#       parsed and validated only once by rapidjson.
+TX_SCHEMA_COMMON_CREATE = _combine_schemas(TX_SCHEMA_COMMON, TX_SCHEMA_CREATE)
+TX_SCHEMA_COMMON_TRANSFER = _combine_schemas(TX_SCHEMA_COMMON,
+                                             TX_SCHEMA_TRANSFER)
+
+
+def _validate_schema(schema, body, body_serialized=None, fallbacks=None):
+    """Validate data against a schema
+
+    Args:
+        schema (tuple): The schema and its compiled rapidjson counterpart.
+        body (dict): The data to validate.
+        body_serialized (str, optional): `body` already serialized to JSON,
+            to avoid serializing it again.
+        fallbacks (:obj:`list` of :obj:`tuple`, optional): The schemas to
+            validate `body` against with `jsonschema`, in order, to produce
+            an error message if rapidjson rejects `body`. Defaults to
+            `[schema]`.
+    """
 
     # Note
     #
@@ -47,28 +90,40 @@ def _validate_schema(schema, body):
     # jsonschema as a fallback in case there is a failure, so we can produce
     # a helpful error message.
 
+    if body_serialized is None:
+        body_serialized = rapidjson.dumps(body)
+
     try:
-        schema[1].validate(rapidjson.dumps(body))
+        schema[1].validate(body_serialized)
     except ValueError as exc:
         try:
-            jsonschema.validate(body, schema[0])
+            for fallback in fallbacks or [schema]:
+                jsonschema.validate(body, fallback[0])
         except jsonschema.ValidationError as exc2:
             raise SchemaValidationError(str(exc2)) from exc2
         logger.warning('code problem: jsonschema did not raise an exception, wheras rapidjson raised %s', exc)
         raise SchemaValidationError(str(exc)) from exc
 
 
-def validate_transaction_schema(tx):
+def validate_transaction_schema(tx, tx_serialized=None):
     """Validate a transaction dict.
 
     TX_SCHEMA_COMMON contains properties that are common to all types of
     transaction. TX_SCHEMA_[TRANSFER|CREATE] add additional constraints on top.
+
+    Args:
+        tx (dict): The transaction to validate.
+        tx_serialized (str, optional): `tx` already serialized to JSON. The
+            serialization of `tx` with its `id` set to `None` (as returned
+            by :meth:`~bigchaindb.common.transaction.Transaction.validate_id`)
+            can be given too, as the schema allows a `null` id.
     """
-    _validate_schema(TX_SCHEMA_COMMON, tx)
-    if tx['operation'] == 'TRANSFER':
-        _validate_schema(TX_SCHEMA_TRANSFER, tx)
+    if tx.get('operation') == 'TRANSFER':
+        schema, specific = TX_SCHEMA_COMMON_TRANSFER, TX_SCHEMA_TRANSFER
     else:
-        _validate_schema(TX_SCHEMA_CREATE, tx)
+        schema, specific = TX_SCHEMA_COMMON_CREATE, TX_SCHEMA_CREATE
+    _validate_schema(schema, tx, tx_serialized,
+                     fallbacks=[TX_SCHEMA_COMMON, specific])
 
 
 def validate_vote_schema(vote):
@@ -10,11 +10,12 @@ from cryptoconditions import Fulfillment, ThresholdSha256, Ed25519Sha256
 from cryptoconditions.exceptions import (
     ParsingError, ASN1DecodeError, ASN1EncodeError, UnsupportedTypeError)
 
-from bigchaindb.common.crypto import PrivateKey, hash_data
+from bigchaindb.common.crypto import PrivateKey, hash_data, verify_batch
 from bigchaindb.common.exceptions import (KeypairMismatchException,
                                           InvalidHash, InvalidSignature,
                                           AmountError, AssetIdMismatch,
-                                          ThresholdTooDeep)
+                                          ThresholdTooDeep,
+                                          ConditionUriMismatch)
 from bigchaindb.common.utils import serialize
 
 
@@ -54,6 +55,28 @@ class Input(object):
         self.fulfills = fulfills
         self.owners_before = owners_before
 
+    @property
+    def fulfillment(self):
+        """The Fulfillment of the Input.
+
+            Note:
+                An Input created by :meth:`~.Input.from_dict` keeps the
+                serialized fulfillment, and only parses it on first access.
+
+            Raises:
+                InvalidSignature: If the fulfillment URI couldn't be parsed.
+        """
+        if self._fulfillment_serialized is not None:
+            self._fulfillment = _fulfillment_from_serialized(
+                self._fulfillment_serialized)
+            self._fulfillment_serialized = None
+        return self._fulfillment
+
+    @fulfillment.setter
+    def fulfillment(self, fulfillment):
+        self._fulfillment = fulfillment
+        self._fulfillment_serialized = None
+
     def __eq__(self, other):
         # TODO: If `other !== Fulfillment` return `False`
         return self.to_dict() == other.to_dict()
@@ -68,10 +91,13 @@ class Input(object):
             Returns:
                 dict: The Input as an alternative serialization format.
         """
-        try:
-            fulfillment = self.fulfillment.serialize_uri()
-        except (TypeError, AttributeError, ASN1EncodeError):
-            fulfillment = _fulfillment_to_details(self.fulfillment)
+        if self._fulfillment_serialized is not None:
+            fulfillment = self._fulfillment_serialized
+        else:
+            try:
+                fulfillment = self.fulfillment.serialize_uri()
+            except (TypeError, AttributeError, ASN1EncodeError):
+                fulfillment = _fulfillment_to_details(self.fulfillment)
 
         try:
             # NOTE: `self.fulfills` can be `None` and that's fine
@@ -102,29 +128,42 @@ class Input(object):
                 Optionally, this method can also serialize a Cryptoconditions-
                 Fulfillment that is not yet signed.
 
+                A serialized fulfillment is not parsed until the
+                :attr:`~.Input.fulfillment` is accessed, and is returned as
+                is by :meth:`~.Input.to_dict` until then.
+
             Args:
                 data (dict): The Input to be transformed.
 
             Returns:
                 :class:`~bigchaindb.common.transaction.Input`
-
-            Raises:
-                InvalidSignature: If an Input's URI couldn't be parsed.
         """
         fulfillment = data['fulfillment']
-        if not isinstance(fulfillment, (Fulfillment, type(None))):
-            try:
-                fulfillment = Fulfillment.from_uri(data['fulfillment'])
-            except ASN1DecodeError:
-                # TODO Remove as it is legacy code, and simply fall back on
-                # ASN1DecodeError
-                raise InvalidSignature("Fulfillment URI couldn't been parsed")
-            except TypeError:
-                # NOTE: See comment about this special case in
-                #       `Input.to_dict`
-                fulfillment = _fulfillment_from_details(data['fulfillment'])
         fulfills = TransactionLink.from_dict(data['fulfills'])
-        return cls(fulfillment, data['owners_before'], fulfills)
+        if isinstance(fulfillment, (Fulfillment, type(None))):
+            return cls(fulfillment, data['owners_before'], fulfills)
+        input_ = cls(None, data['owners_before'], fulfills)
+        input_._fulfillment_serialized = fulfillment
+        return input_
+
+
+def _fulfillment_from_serialized(fulfillment):
+    """Parse the serialized fulfillment of an Input: a fulfillment URI, or
+    the details of a fulfillment that is not signed yet.
+
+    Raises:
+        InvalidSignature: If the fulfillment URI couldn't be parsed.
+    """
+    try:
+        return Fulfillment.from_uri(fulfillment)
+    except ASN1DecodeError:
+        # TODO Remove as it is legacy code, and simply fall back on
+        # ASN1DecodeError
+        raise InvalidSignature("Fulfillment URI couldn't been parsed")
+    except TypeError:
+        # NOTE: See comment about this special case in
+        #       `Input.to_dict`
+        return _fulfillment_from_details(fulfillment)
 
 
 def _fulfillment_to_details(fulfillment):
@@ -291,6 +330,51 @@ class Output(object):
         self.amount = amount
         self.public_keys = public_keys
 
+    @property
+    def fulfillment(self):
+        """The Fulfillment the Condition of the Output is extracted from,
+        or the Condition URI for a hashlock Output.
+
+            Note:
+                An Output created by :meth:`~.Output.from_dict` keeps the
+                serialized condition, and only parses it on first access.
+
+            Raises:
+                ConditionUriMismatch: If the URI of the serialized condition
+                    is not the URI of its details.
+        """
+        if self._condition is not None:
+            try:
+                details = self._condition['details']
+            except KeyError:
+                # NOTE: Hashlock condition case
+                self._fulfillment = self._condition['uri']
+            else:
+                fulfillment = _fulfillment_from_details(details)
+                if fulfillment.condition_uri != self._condition.get('uri'):
+                    raise ConditionUriMismatch(
+                        'The condition uri does not match its details')
+                self._fulfillment = fulfillment
+            self._condition = None
+        return self._fulfillment
+
+    @fulfillment.setter
+    def fulfillment(self, fulfillment):
+        self._fulfillment = fulfillment
+        self._condition = None
+
+    def validate_condition(self):
+        """Parses the condition of the Output if it hasn't been yet, and
+        checks that its URI is the URI of its details.
+
+            Raises:
+                ThresholdTooDeep: If the threshold condition is too deep.
+                UnsupportedTypeError: If a condition type is not supported.
+                ConditionUriMismatch: If the URI of the condition is not
+                    the URI of its details.
+        """
+        self.fulfillment
+
     def __eq__(self, other):
         # TODO: If `other !== Condition` return `False`
         return self.to_dict() == other.to_dict()
@@ -305,18 +389,21 @@ class Output(object):
             Returns:
                 dict: The Output as an alternative serialization format.
         """
-        # TODO FOR CC: It must be able to recognize a hashlock condition
-        #              and fulfillment!
-        condition = {}
-        try:
-            condition['details'] = _fulfillment_to_details(self.fulfillment)
-        except AttributeError:
-            pass
+        if self._condition is not None:
+            condition = dict(self._condition)
+        else:
+            # TODO FOR CC: It must be able to recognize a hashlock condition
+            #              and fulfillment!
+            condition = {}
+            try:
+                condition['details'] = _fulfillment_to_details(self.fulfillment)
+            except AttributeError:
+                pass
 
-        try:
-            condition['uri'] = self.fulfillment.condition_uri
-        except AttributeError:
-            condition['uri'] = self.fulfillment
+            try:
+                condition['uri'] = self.fulfillment.condition_uri
+            except AttributeError:
+                condition['uri'] = self.fulfillment
 
         output = {
             'public_keys': self.public_keys,
@@ -429,22 +516,23 @@ class Output(object):
                 passed-in dictionary, as Condition URIs are not serializable
                 anymore.
 
+                The condition is not parsed until the
+                :attr:`~.Output.fulfillment` is accessed, and is returned as
+                is by :meth:`~.Output.to_dict` until then.
+
             Args:
                 data (dict): The dict to be transformed.
 
             Returns:
                 :class:`~bigchaindb.common.transaction.Output`
         """
-        try:
-            fulfillment = _fulfillment_from_details(data['condition']['details'])
-        except KeyError:
-            # NOTE: Hashlock condition case
-            fulfillment = data['condition']['uri']
         try:
             amount = int(data['amount'])
         except ValueError:
             raise AmountError('Invalid amount: %s' % data['amount'])
-        return cls(fulfillment, data['public_keys'], amount)
+        output = cls(None, data['public_keys'], amount)
+        output._condition = data['condition']
+        return output
 
 
 class Transaction(object):
@@ -530,6 +618,7 @@ class Transaction(object):
         self.outputs = outputs or []
         self.metadata = metadata
         self._id = hash_id
+        self._signed_message_cache = None
 
     @property
     def serialized(self):
@@ -704,6 +793,7 @@ class Transaction(object):
         if not isinstance(input_, Input):
             raise TypeError('`input_` must be a Input instance')
         self.inputs.append(input_)
+        self._signed_message_cache = None
 
     def add_output(self, output):
         """Adds an output to a Transaction's list of outputs.
@@ -716,6 +806,7 @@ class Transaction(object):
         if not isinstance(output, Output):
             raise TypeError('`output` must be an Output instance or None')
         self.outputs.append(output)
+        self._signed_message_cache = None
 
     def sign(self, private_keys):
         """Fulfills a previous Transaction's Output by signing Inputs.
@@ -760,9 +851,13 @@ class Transaction(object):
         key_pairs = {gen_public_key(PrivateKey(private_key)):
                      PrivateKey(private_key) for private_key in private_keys}
 
-        tx_dict = self.to_dict()
-        tx_dict = Transaction._remove_signatures(tx_dict)
-        tx_serialized = Transaction._to_str(tx_dict)
+        self._signed_message_cache = None
+        if self._id is None:
+            tx_serialized = self._signed_message()
+        else:
+            tx_dict = self.to_dict()
+            tx_dict = Transaction._remove_signatures(tx_dict)
+            tx_serialized = Transaction._to_str(tx_dict)
         for i, input_ in enumerate(self.inputs):
             self.inputs[i] = self._sign_input(input_, tx_serialized, key_pairs)
 
@@ -883,16 +978,26 @@ class Transaction(object):
             Returns:
                 bool: If all Inputs are valid.
         """
+        return self._inputs_valid(self._output_condition_uris(outputs))
+
+    def _output_condition_uris(self, outputs=None):
+        """Returns the condition URIs the Inputs are validated against.
+
+            Args:
+                outputs (:obj:`list` of :class:`~bigchaindb.common.
+                    transaction.Output`): The Outputs spent by the Inputs.
+
+            Returns:
+                :obj:`list` of :obj:`str`
+        """
         if self.operation in (Transaction.CREATE, Transaction.GENESIS):
             # NOTE: Since in the case of a `CREATE`-transaction we do not have
             #       to check for outputs, we're just submitting dummy
             #       values to the actual method. This simplifies it's logic
             #       greatly, as we do not have to check against `None` values.
-            return self._inputs_valid(['dummyvalue'
-                                       for _ in self.inputs])
+            return ['dummyvalue' for _ in self.inputs]
         elif self.operation == Transaction.TRANSFER:
-            return self._inputs_valid([output.fulfillment.condition_uri
-                                       for output in outputs])
+            return [output.fulfillment.condition_uri for output in outputs]
         else:
             allowed_ops = ', '.join(self.__class__.ALLOWED_OPERATIONS)
             raise TypeError('`operation` must be one of {}'
@@ -917,10 +1022,7 @@ class Transaction(object):
             raise ValueError('Inputs and '
                              'output_condition_uris must have the same count')
 
-        tx_dict = self.to_dict()
-        tx_dict = Transaction._remove_signatures(tx_dict)
-        tx_dict['id'] = None
-        tx_serialized = Transaction._to_str(tx_dict)
+        tx_serialized = self._signed_message()
 
         def validate(i, output_condition_uri=None):
             """Validate input against output condition URI"""
@@ -930,6 +1032,31 @@ class Transaction(object):
         return all(validate(i, cond)
                    for i, cond in enumerate(output_condition_uris))
 
+    def _signed_message(self):
+        """Returns the message signed by the Inputs of the Transaction.
+
+            Note:
+                The message is computed once and cached. The cache is
+                cleared by :meth:`~.Transaction.sign`,
+                :meth:`~.Transaction.add_input` and
+                :meth:`~.Transaction.add_output`. Code changing the
+                Transaction's attributes directly must not rely on a
+                message computed before the change.
+
+            Returns:
+                str: The serialized Transaction without fulfillments and
+                with its `id` set to `None`.
+        """
+        if self._signed_message_cache is None:
+            tx_dict = self.to_dict()
+            # NOTE: `to_dict` creates new dicts for the inputs, so they can
+            #       be changed without copying them first.
+            for input_ in tx_dict['inputs']:
+                input_['fulfillment'] = None
+            tx_dict['id'] = None
+            self._signed_message_cache = Transaction._to_str(tx_dict)
+        return self._signed_message_cache
+
     @staticmethod
     def _input_valid(input_, operation, tx_serialized, output_condition_uri=None):
         """Validates a single Input against a single Output.
@@ -1028,6 +1155,8 @@ class Transaction(object):
 
     # TODO: This method shouldn't call `_remove_signatures`
     def __str__(self):
+        if self._id is None:
+            return self._signed_message()
         tx = Transaction._remove_signatures(self.to_dict())
         return Transaction._to_str(tx)
 
@@ -1072,9 +1201,15 @@ class Transaction(object):
 
             Args:
                 tx_body (dict): The Transaction to be transformed.
+
+            Returns:
+                str: The serialized body of the Transaction with its `id`
+                set to `None`, i.e. the data that was hashed. It can be
+                reused by callers to avoid serializing the body again.
         """
-        # NOTE: Remove reference to avoid side effects
-        tx_body = deepcopy(tx_body)
+        # NOTE: Remove reference to avoid side effects. Only the top level
+        #       `id` is changed, so a shallow copy is enough.
+        tx_body = dict(tx_body)
         try:
             proposed_tx_id = tx_body['id']
         except KeyError:
@@ -1090,6 +1225,8 @@ class Transaction(object):
                        "the hash of its body, i.e. it's not valid.")
             raise InvalidHash(err_msg.format(proposed_tx_id))
 
+        return tx_body_serialized
+
     @classmethod
     def from_dict(cls, tx):
         """Transforms a Python dictionary to a Transaction object.
@@ -1104,3 +1241,91 @@ class Transaction(object):
         outputs = [Output.from_dict(output) for output in tx['outputs']]
         return cls(tx['operation'], tx['asset'], inputs, outputs,
                    tx['metadata'], tx['version'], hash_id=tx['id'])
+
+
+class SignatureBatch(object):
+    """Collects the Inputs of many Transactions, e.g. all the Transactions of
+    a Block, to verify their signatures together.
+
+        Note:
+            Inputs holding an Ed25519 fulfillment are reduced to
+            ``(public_key, message, signature)`` triples that are verified
+            in one go by :func:`~bigchaindb.common.crypto.verify_batch`.
+            Any other fulfillment (e.g. ThresholdSha256) is validated on its
+            own with :meth:`~.Transaction._input_valid`.
+
+        Attributes:
+            transactions (:obj:`list` of :class:`~bigchaindb.common.
+                transaction.Transaction`): The Transactions added to the
+                batch.
+    """
+
+    def __init__(self):
+        self.transactions = []
+        self._signatures = []
+        self._signers = []
+        self._invalid = set()
+
+    def __len__(self):
+        return len(self.transactions)
+
+    def add(self, transaction, outputs=None):
+        """Adds the Inputs of a Transaction to the batch.
+
+            Args:
+                transaction (:class:`~bigchaindb.common.transaction.
+                    Transaction`): The Transaction to add.
+                outputs (:obj:`list` of :class:`~bigchaindb.common.
+                    transaction.Output`): The Outputs spent by the Inputs of
+                    the Transaction, see :meth:`~.Transaction.inputs_valid`.
+        """
+        index = len(self.transactions)
+        self.transactions.append(transaction)
+
+        output_condition_uris = transaction._output_condition_uris(outputs)
+        if len(transaction.inputs) != len(output_condition_uris):
+            raise ValueError('Inputs and '
+                             'output_condition_uris must have the same count')
+
+        tx_serialized = transaction._signed_message()
+        message = tx_serialized.encode()
+        check_output = transaction.operation == Transaction.TRANSFER
+
+        for input_, output_condition_uri in zip(transaction.inputs,
+                                                output_condition_uris):
+            ccffill = input_.fulfillment
+            if not isinstance(ccffill, Ed25519Sha256):
+                if not Transaction._input_valid(input_, transaction.operation,
+                                                tx_serialized,
+                                                output_condition_uri):
+                    self._invalid.add(index)
+                continue
+
+            # NOTE: An Ed25519 fulfillment can only be serialized (and so
+            #       be valid) if it holds both a public key and a signature.
+            if ccffill.public_key is None or ccffill.signature is None:
+                self._invalid.add(index)
+            elif check_output and \
+                    output_condition_uri != ccffill.condition_uri:
+                self._invalid.add(index)
+            else:
+                self._signatures.append(
+                    (ccffill.public_key, message, ccffill.signature))
+                self._signers.append(index)
+
+    def verify(self):
+        """Verifies all the signatures in the batch.
+
+            Returns:
+                :obj:`list` of :class:`~bigchaindb.common.transaction.
+                Transaction`: The Transactions with at least one invalid
+                Input, in the order they were added. An empty list means
+                that all the Inputs are valid.
+        """
+        invalid = set(self._invalid)
+        results = verify_batch(self._signatures)
+        for index, valid in zip(self._signers, results):
+            if not valid:
+                invalid.add(index)
+        return [tx for index, tx in enumerate(self.transactions)
+                if index in invalid]
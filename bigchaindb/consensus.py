@@ -13,11 +13,16 @@ class BaseConsensusRules():
     voting = Voting
 
     @staticmethod
-    def validate_transaction(bigchain, transaction):
+    def validate_transaction(bigchain, transaction, context=None,
+                             signatures=None):
         """See :meth:`bigchaindb.models.Transaction.validate`
         for documentation.
+
+        ``context`` (a :class:`~bigchaindb.models.ValidationContext`) is used
+        instead of ``bigchain`` to look up the inputs when given, and the
+        signatures are added to the ``signatures`` batch when given.
         """
-        return transaction.validate(bigchain)
+        return transaction.validate(context or bigchain, signatures=signatures)
 
     @staticmethod
     def validate_block(bigchain, block):
@@ -1,16 +1,19 @@
-import random
 import statsd
+from collections import defaultdict
 from time import time
 
 from bigchaindb import exceptions as core_exceptions
 from bigchaindb.common import crypto, exceptions
+from bigchaindb.common.transaction import TransactionLink
 from bigchaindb.common.utils import gen_timestamp, serialize
 
 import bigchaindb
 
 from bigchaindb import backend, config_utils, fastquery
+from bigchaindb.utils import condition_details_public_keys
 from bigchaindb.consensus import BaseConsensusRules
 from bigchaindb.models import Block, Transaction
+from bigchaindb.voting import DecidedElections
 
 
 class Bigchain(object):
@@ -31,6 +34,9 @@ class Bigchain(object):
     TX_IN_BACKLOG = 'backlog'
     """return if transaction is in backlog"""
 
+    FILTERED_TXIDS_CHUNK_SIZE = 1000
+    """how many transaction ids :meth:`get_transactions_filtered` looks up at once"""
+
     def __init__(self, public_key=None, private_key=None, keyring=[], connection=None, backlog_reassign_delay=None):
         """Initialize the Bigchain instance
 
@@ -77,6 +83,9 @@ class Bigchain(object):
     federation = property(lambda self: set(self.nodes_except_me + [self.me]))
     """ Set of federation member public keys """
 
+    decided_elections = DecidedElections()
+    """ Statuses of the decided blocks, shared by the instances of a process """
+
     def write_transaction(self, signed_transaction):
         """Write the transaction to bigchain.
 
@@ -89,40 +98,88 @@ class Bigchain(object):
         Returns:
             dict: database response
         """
+        # write to the backlog
+        return backend.query.write_transaction(self.connection,
+                                               self._assign(signed_transaction))
+
+    def write_transactions(self, signed_transactions):
+        """Write several transactions to the backlog at once.
+
+        Args:
+            signed_transactions (list): the :class:`~.Transaction` objects,
+                with the `signature` included, to write.
+
+        Returns:
+            The database response.
+        """
+        return backend.query.write_transactions(
+            self.connection, [self._assign(tx) for tx in signed_transactions])
+
+    def _assign(self, signed_transaction):
         signed_transaction = signed_transaction.to_dict()
 
         # we will assign this transaction to `one` node. This way we make sure that there are no duplicate
         # transactions on the bigchain
-        if self.nodes_except_me:
-            assignee = random.choice(self.nodes_except_me)
-        else:
-            # I am the only node
-            assignee = self.me
+        assignee = self.get_assignee(signed_transaction['id'])
+        assignment_timestamp = time()
 
-        signed_transaction.update({'assignee': assignee})
-        signed_transaction.update({'assignment_timestamp': time()})
+        # the assignment is a lease that the stale transaction monitor
+        # reclaims once it expired
+        signed_transaction.update({
+            'assignee': assignee,
+            'assignment_timestamp': assignment_timestamp,
+            'assignment_expiry': assignment_timestamp + self.backlog_reassign_delay,
+        })
+        return signed_transaction
 
-        # write to the backlog
-        return backend.query.write_transaction(self.connection, signed_transaction)
+    def get_assignee(self, transaction_id):
+        """Return the node a transaction is assigned to.
+
+        The assignee is chosen deterministically among the other nodes of the
+        federation by rendezvous hashing, i.e. the node for which the hash of
+        the transaction id and of its public key is the highest.
+
+        Args:
+            transaction_id (str): the id of the transaction.
+
+        Returns:
+            str: the public key of the assignee.
+        """
+        # I am the only node
+        nodes = self.nodes_except_me or [self.me]
+        return max(nodes, key=lambda node: crypto.hash_data(transaction_id + node))
 
-    def reassign_transaction(self, transaction):
-        """Assign a transaction to a new node
+    def get_next_assignee(self, assignee):
+        """Return the node the stale transactions of a node are reassigned
+        to, that is the next node of the federation, ordered by public key.
 
         Args:
-            transaction (dict): assigned transaction
+            assignee (str): the public key of the current assignee.
 
         Returns:
-            dict: database response or None if no reassignment is possible
+            str: the public key of the new assignee.
         """
+        nodes = sorted(self.federation)
+        for node in nodes:
+            if node > assignee:
+                return node
+        return nodes[0]
+
+    def reassign_stale_transactions(self):
+        """Reassign the transactions of which the assignment expired.
 
-        other_nodes = tuple(
-            self.federation.difference([transaction['assignee']])
-        )
-        new_assignee = random.choice(other_nodes) if other_nodes else self.me
+        The stale transactions of each node of the federation are reassigned
+        in bulk to the next node (see :meth:`get_next_assignee`), and the
+        ones assigned to nodes that left the federation to this node.
 
-        return backend.query.update_transaction(
-                self.connection, transaction['id'],
-                {'assignee': new_assignee, 'assignment_timestamp': time()})
+        Returns:
+            int: the number of reassigned transactions.
+        """
+        reassignments = {node: self.get_next_assignee(node)
+                         for node in self.federation}
+        return backend.query.reassign_stale_transactions(
+            self.connection, reassignments, self.me,
+            self.backlog_reassign_delay)
 
     def delete_transaction(self, *transaction_id):
         """Delete a transaction from the backlog.
@@ -136,27 +193,25 @@ class Bigchain(object):
 
         return backend.query.delete_transaction(self.connection, *transaction_id)
 
-    def get_stale_transactions(self):
-        """Get a cursor of stale transactions.
-
-        Transactions are considered stale if they have been assigned a node, but are still in the
-        backlog after some amount of time specified in the configuration
-        """
-
-        return backend.query.get_stale_transactions(self.connection, self.backlog_reassign_delay)
-
-    def validate_transaction(self, transaction):
+    def validate_transaction(self, transaction, context=None, signatures=None):
         """Validate a transaction.
 
         Args:
             transaction (Transaction): transaction to validate.
+            context (:class:`~bigchaindb.models.ValidationContext`): the
+                inputs prefetched for a batch of transactions (optional).
+            signatures (:class:`~bigchaindb.common.transaction.SignatureBatch`):
+                if given, the signatures of the inputs are added to the batch
+                instead of being verified right away (optional).
 
         Returns:
             The transaction if the transaction is valid else it raises an
             exception describing the reason why the transaction is invalid.
         """
 
-        return self.consensus.validate_transaction(self, transaction)
+        return self.consensus.validate_transaction(self, transaction,
+                                                   context=context,
+                                                   signatures=signatures)
 
     def is_new_transaction(self, txid, exclude_block_id=None):
         """Return True if the transaction does not exist in any
@@ -173,6 +228,26 @@ class Bigchain(object):
                 return False
         return True
 
+    def filter_new_transactions(self, txids, exclude_block_id=None):
+        """Return the ids of the transactions that do not exist in any
+        VALID or UNDECIDED block.
+
+        This is the bulk version of :meth:`is_new_transaction`.
+
+        Args:
+            txids (list): Transaction IDs
+            exclude_block_id (str): Exclude block from search
+
+        Returns:
+            list: The ids of the new transactions, in the order of `txids`.
+        """
+        txids = list(txids)
+        existing = {entry['transaction_id']
+                    for entry in self.get_indexed_transactions(
+                        txids, exclude_block_id=exclude_block_id)
+                    if entry['status'] != self.BLOCK_INVALID}
+        return [txid for txid in txids if txid not in existing]
+
     def get_block(self, block_id, include_status=False):
         """Get the block with the specified `block_id` (and optionally its status)
 
@@ -233,7 +308,8 @@ class Bigchain(object):
 
         response, tx_status = None, None
 
-        blocks_validity_status = self.get_blocks_status_containing_tx(txid)
+        entries = self.get_indexed_transactions([txid])
+        blocks_validity_status = self._get_blocks_status(txid, entries)
         check_backlog = True
 
         if blocks_validity_status:
@@ -257,8 +333,9 @@ class Bigchain(object):
                         tx_status = self.TX_VALID
                         break
 
-                # Query the transaction in the target block and return
-                response = backend.query.get_transaction_from_block(self.connection, txid, target_block_id)
+                # The transaction of the target block is in its entry
+                response = next(entry['transaction'] for entry in entries
+                                if entry['block_id'] == target_block_id)
 
         if check_backlog:
             response = backend.query.get_transaction_from_backlog(self.connection, txid)
@@ -307,31 +384,81 @@ class Bigchain(object):
             e.g. {block_id_1: 'valid', block_id_2: 'invalid' ...}, or None
         """
 
-        # First, get information on all blocks which contain this transaction
-        blocks = backend.query.get_blocks_status_from_transaction(self.connection, txid)
-        if blocks:
-            # Determine the election status of each block
-            blocks_validity_status = {
-                block['id']: self.block_election_status(block)
-                for block in blocks
-            }
+        entries = self.get_indexed_transactions([txid])
+        return self._get_blocks_status(txid, entries)
 
-            # NOTE: If there are multiple valid blocks with this transaction,
-            # something has gone wrong
-            if list(blocks_validity_status.values()).count(Bigchain.BLOCK_VALID) > 1:
-                block_ids = str([
-                    block for block in blocks_validity_status
-                    if blocks_validity_status[block] == Bigchain.BLOCK_VALID
-                ])
-                raise core_exceptions.CriticalDoubleInclusion(
-                    'Transaction {tx} is present in '
-                    'multiple valid blocks: {block_ids}'
-                    .format(tx=txid, block_ids=block_ids))
+    def _get_blocks_status(self, txid, entries):
+        """Return the statuses of the blocks of the entries of a
+        transaction, see :meth:`get_blocks_status_containing_tx`."""
+        if not entries:
+            return None
 
-            return blocks_validity_status
+        blocks_validity_status = {entry['block_id']: entry['status']
+                                  for entry in entries}
 
-        else:
-            return None
+        # NOTE: If there are multiple valid blocks with this transaction,
+        # something has gone wrong
+        if list(blocks_validity_status.values()).count(Bigchain.BLOCK_VALID) > 1:
+            block_ids = str([
+                block for block in blocks_validity_status
+                if blocks_validity_status[block] == Bigchain.BLOCK_VALID
+            ])
+            raise core_exceptions.CriticalDoubleInclusion(
+                'Transaction {tx} is present in '
+                'multiple valid blocks: {block_ids}'
+                .format(tx=txid, block_ids=block_ids))
+
+        return blocks_validity_status
+
+    def get_indexed_transactions(self, txids, exclude_block_id=None):
+        """Look up the transactions in the ``transactions`` table, that has
+        an entry per transaction and block containing it.
+
+        The status of a block is recorded in its entries by the election
+        pipeline once the block is decided. The status of the blocks that
+        are still undecided in the table is looked up in
+        :attr:`decided_elections`, or else elected from their votes.
+
+        The blocks written before the table existed are indexed by the
+        ``index_transactions`` migration (see :mod:`bigchaindb.migrations`).
+
+        Args:
+            txids (list): Transaction IDs
+            exclude_block_id (str): Exclude block from search
+
+        Returns:
+            list: The entries, with the current status of their block.
+        """
+        entries = [entry for entry in
+                   backend.query.get_indexed_transactions(self.connection,
+                                                          list(txids))
+                   if entry['block_id'] != exclude_block_id]
+        federation = self.federation
+        undecided = set()
+        for entry in entries:
+            if entry['status'] == self.BLOCK_UNDECIDED:
+                status = self.decided_elections.get(entry['block_id'], federation)
+                if status is None:
+                    undecided.add(entry['block_id'])
+                else:
+                    entry['status'] = status
+
+        if undecided:
+            blocks = list(backend.query.get_blocks_status(self.connection,
+                                                          list(undecided)))
+            votes = defaultdict(list)
+            for vote in backend.query.get_votes_by_block_ids(
+                    self.connection, [block['id'] for block in blocks]):
+                votes[vote['vote']['voting_for_block']].append(vote)
+            statuses = {block['id']: self.block_election_from_votes(
+                            block, votes[block['id']], federation)['status']
+                        for block in blocks}
+            for entry in entries:
+                if entry['block_id'] in undecided:
+                    entry['status'] = statuses.get(entry['block_id'],
+                                                   self.BLOCK_UNDECIDED)
+
+        return entries
 
     def get_asset_by_id(self, asset_id):
         """Returns the asset associated with an asset_id.
@@ -417,7 +544,10 @@ class Bigchain(object):
 
     @property
     def fastquery(self):
-        return fastquery.FastQuery(self.connection, self.me)
+        fq = self.__dict__.get('_fastquery')
+        if fq is None or fq.connection is not self.connection or fq.me != self.me:
+            fq = self._fastquery = fastquery.FastQuery(self.connection, self.me)
+        return fq
 
     def get_outputs_filtered(self, owner, spent=None):
         """Get a list of output links filtered on some criteria
@@ -440,15 +570,132 @@ class Bigchain(object):
         elif spent is False:
             return self.fastquery.filter_spent_outputs(outputs)
 
-    def get_transactions_filtered(self, asset_id, operation=None):
-        """Get a list of transactions filtered on some criteria
+    def get_valid_outputs(self, owner, spent=None):
+        """Get the outputs of the transactions in VALID blocks owned by
+        a public key, from the outputs table.
+
+        Unlike :meth:`get_outputs_filtered`, the outputs of transactions in
+        undecided blocks are not included, and an output is only spent
+        once the spending transaction is in a VALID block.
+
+        Args:
+            owner (str): base58 encoded public_key.
+            spent (bool): If ``True`` return only the spent outputs. If
+                          ``False`` return only unspent outputs. If spent is
+                          not specified (``None``) return all outputs.
+
+        Returns:
+            :obj:`list` of TransactionLink: list of ``txid`` s and ``output`` s
+            pointing to another transaction's condition
         """
-        txids = backend.query.get_txids_filtered(self.connection, asset_id,
-                                                 operation)
-        for txid in txids:
-            tx, status = self.get_transaction(txid, True)
-            if status == self.TX_VALID:
-                yield tx
+        outputs = backend.query.get_outputs_by_public_key(self.connection,
+                                                          owner, spent)
+        return [TransactionLink(output['transaction_id'], output['output_index'])
+                for output in outputs]
+
+    def store_block_outputs(self, block):
+        """Record the outputs of the transactions of a VALID block in the
+        outputs table, and mark the outputs they spend as spent.
+
+        This is idempotent, and the blocks can be stored in any order.
+
+        Args:
+            block (dict): the VALID block.
+        """
+        outputs, spends = [], []
+        for tx in block['block']['transactions']:
+            if tx['operation'] == Transaction.TRANSFER:
+                asset_id = tx['asset']['id']
+            else:
+                asset_id = tx['id']
+            for index, output in enumerate(tx['outputs']):
+                public_keys = condition_details_public_keys(
+                    output['condition']['details'])
+                outputs.append({'transaction_id': tx['id'],
+                                'output_index': index,
+                                'public_keys': public_keys,
+                                'amount': int(output['amount']),
+                                'asset_id': asset_id})
+            for input_ in tx['inputs']:
+                if input_['fulfills']:
+                    spends.append(dict(input_['fulfills'], spent_by=tx['id']))
+
+        if outputs:
+            backend.query.store_outputs(self.connection, outputs)
+        if spends:
+            backend.query.spend_outputs(self.connection, spends)
+
+    def get_transactions_filtered(self, asset_id, operation=None, *,
+                                  limit=None, after=None):
+        """Get the transactions of an asset that are in a valid block, in the
+        order of their ids.
+
+        The ids of the transactions are looked up by chunks; the status of
+        the blocks containing the transactions of a chunk, and the assets
+        and metadata of these transactions, are looked up at once.
+
+        Args:
+            asset_id (str): the id of the asset.
+            operation (str): only get the transactions of this operation,
+                ``CREATE`` or ``TRANSFER``.
+            limit (int): the maximum number of transactions to get.
+            after (str): only get the transactions with an id greater than
+                this one, i.e. the page after the one ending with the
+                transaction ``after``.
+
+        Returns:
+            A generator of :class:`~.models.Transaction`.
+        """
+        while limit is None or limit > 0:
+            txids = list(backend.query.get_txids_filtered(
+                self.connection, asset_id, operation, after=after,
+                limit=self.FILTERED_TXIDS_CHUNK_SIZE))
+            if not txids:
+                return
+            after = txids[-1]
+
+            txs = self.get_valid_transactions(txids)[:limit]
+            if limit is not None:
+                limit -= len(txs)
+            yield from txs
+            # a partial chunk is the last one
+            if len(txids) < self.FILTERED_TXIDS_CHUNK_SIZE:
+                return
+
+    def get_valid_transactions(self, txids):
+        """Get the transactions that are in a valid block, among the given
+        ones.
+
+        Args:
+            txids (list): the ids of the transactions.
+
+        Returns:
+            list: The :class:`~.models.Transaction` objects, in the order of
+            ``txids``.
+
+        Raises:
+            CriticalDoubleInclusion: if a transaction is in several valid
+                blocks.
+        """
+        valid = {}
+        for entry in self.get_indexed_transactions(txids):
+            if entry['status'] != self.BLOCK_VALID:
+                continue
+            txid = entry['transaction_id']
+            if txid in valid:
+                raise core_exceptions.CriticalDoubleInclusion(
+                    'Transaction {tx} is present in '
+                    'multiple valid blocks: {block_ids}'
+                    .format(tx=txid, block_ids=str([valid[txid][0], entry['block_id']])))
+            valid[txid] = entry['block_id'], entry['transaction']
+
+        # couple the assets and metadata of all the transactions at once
+        tx_dicts = {'block': {'transactions': [valid[txid][1] for txid in txids
+                                               if txid in valid]}}
+        tx_dicts = Block.couple_assets(tx_dicts, self.get_assets(Block.get_asset_ids(tx_dicts)))
+        tx_dicts = Block.couple_metadata(tx_dicts, self.get_metadata(Block.get_txn_ids(tx_dicts)))
+        return [Transaction.from_dict(tx_dict)
+                for tx_dict in tx_dicts['block']['transactions']]
 
     def create_block(self, validated_transactions):
         """Creates a block given a list of `validated_transactions`.
@@ -509,19 +756,12 @@ class Bigchain(object):
             block (Block): block to write to bigchain.
         """
 
-        # Decouple assets from block
-        assets, block_dict = block.decouple_assets()
-        metadatas, block_dict = block.decouple_metadata(block_dict)
-
-        # write the assets
-        if assets:
-            self.write_assets(assets)
+        # Decouple assets and metadata from block
+        assets, metadatas, block_dict = block.decouple()
 
-        if metadatas:
-            self.write_metadata(metadatas)
-
-        # write the block
-        return backend.query.write_block(self.connection, block_dict)
+        # write the assets, the metadata and the block
+        return backend.query.write_decoupled_block(
+            self.connection, block_dict, assets, metadatas)
 
     def prepare_genesis_block(self):
         """Prepare a genesis block."""
@@ -557,6 +797,8 @@ class Bigchain(object):
 
         block = self.prepare_genesis_block()
         self.write_block(block)
+        # the genesis block is never voted on, so it is never elected
+        self.store_block_outputs(block.to_dict())
 
         return block
 
@@ -609,14 +851,38 @@ class Bigchain(object):
             block = block.to_dict()
         votes = list(backend.query.get_votes_by_block_id(self.connection,
                                                          block['id']))
-        return self.consensus.voting.block_election(block, votes,
-                                                    self.federation)
+        return self.block_election_from_votes(block, votes)
+
+    def block_election_from_votes(self, block, votes, federation=None):
+        """Tally the given votes on a block, and record its status in
+        :attr:`decided_elections` if it is decided.
+
+        Args:
+            block (dict): the block, only its id and voters are needed.
+            votes (list): the votes on the block.
+            federation (set): the federation, if already computed.
+
+        Returns:
+            dict: the results of the election.
+        """
+        if federation is None:
+            federation = self.federation
+        result = self.consensus.voting.block_election(block, votes, federation)
+        self.decided_elections.add(block['id'], federation, result['status'])
+        return result
 
     def block_election_status(self, block):
         """Tally the votes on a block, and return the status:
            valid, invalid, or undecided.
+
+        The status of a decided block is final, so it is looked up in
+        :attr:`decided_elections` first.
         """
-        return self.block_election(block)['status']
+        block_id = block['id'] if type(block) == dict else block.id
+        status = self.decided_elections.get(block_id, self.federation)
+        if status is None:
+            status = self.block_election(block)['status']
+        return status
 
     def get_assets(self, asset_ids):
         """Return a list of assets that match the asset_ids
@@ -0,0 +1,94 @@
+"""One-off migrations of the data of a database initialized by an earlier
+version of BigchainDB.
+
+The migrations are run by ``bigchaindb upgrade``, and by ``bigchaindb start``
+when the database already exists. Each one is recorded once applied, and a
+new database is created with all of them recorded (see
+:func:`bigchaindb.backend.schema.init_database`). They can be interrupted and
+run again.
+"""
+
+import logging
+from itertools import islice
+
+from bigchaindb import backend
+from bigchaindb.backend.schema import MIGRATIONS
+
+
+logger = logging.getLogger(__name__)
+
+# The number of blocks migrated at once.
+BLOCKS_CHUNK_SIZE = 100
+
+
+def iter_blocks(connection):
+    """Iterate over all the blocks by chunks of ``BLOCKS_CHUNK_SIZE``."""
+    blocks = iter(backend.query.get_blocks(connection))
+    while True:
+        chunk = list(islice(blocks, BLOCKS_CHUNK_SIZE))
+        if not chunk:
+            return
+        yield chunk
+
+
+def index_transactions(bigchain):
+    """Index the transactions of the blocks written before the
+    ``transactions`` table existed, along with the status of the blocks
+    that are decided.
+    """
+    for blocks in iter_blocks(bigchain.connection):
+        backend.query.write_transactions_index(bigchain.connection, blocks)
+        for block in blocks:
+            status = bigchain.block_election_status(block)
+            if status != bigchain.BLOCK_UNDECIDED:
+                backend.query.update_transactions_status(bigchain.connection,
+                                                         block['id'], status)
+
+
+def store_outputs(bigchain):
+    """Record the outputs of the transactions of the VALID blocks, and of
+    the genesis block, written before the ``outputs`` table existed.
+    """
+    for blocks in iter_blocks(bigchain.connection):
+        for block in blocks:
+            transactions = block['block']['transactions']
+            genesis = (len(transactions) == 1 and
+                       transactions[0]['operation'] == 'GENESIS')
+            if genesis or (bigchain.block_election_status(block) ==
+                           bigchain.BLOCK_VALID):
+                bigchain.store_block_outputs(block)
+
+
+MIGRATE = {
+    'index_transactions': index_transactions,
+    'store_outputs': store_outputs,
+}
+
+
+def is_applied(connection, name):
+    """Tell whether a migration was applied to the database."""
+    return any(migration['id'] == name for migration in
+               backend.query.get_migrations(connection))
+
+
+def run_migrations(bigchain):
+    """Apply the migrations that were not applied to the database yet.
+
+    Args:
+        bigchain (:class:`~bigchaindb.Bigchain`): the instance whose
+            connection is migrated.
+
+    Returns:
+        list: the names of the migrations that were applied.
+    """
+    applied = {migration['id'] for migration in
+               backend.query.get_migrations(bigchain.connection)}
+    migrated = []
+    for name in MIGRATIONS:
+        if name in applied:
+            continue
+        logger.info('Applying the migration `%s`', name)
+        MIGRATE[name](bigchain)
+        backend.query.write_migration(bigchain.connection, name)
+        migrated.append(name)
+    return migrated
@@ -1,24 +1,31 @@
+from collections import defaultdict
 from copy import deepcopy
 
+from bigchaindb import backend
+from bigchaindb import exceptions as core_exceptions
 from bigchaindb.common.crypto import hash_data, PublicKey, PrivateKey
 from bigchaindb.common.exceptions import (InvalidHash, InvalidSignature,
                                           DoubleSpend, InputDoesNotExist,
                                           TransactionNotInValidBlock,
                                           AssetIdMismatch, AmountError,
                                           SybilError, DuplicateTransaction)
-from bigchaindb.common.transaction import Transaction
-from bigchaindb.common.utils import (gen_timestamp, serialize,
-                                     validate_txn_obj, validate_key)
+from bigchaindb.common.transaction import (Transaction, TransactionLink,
+                                           SignatureBatch)
+from bigchaindb.common.utils import gen_timestamp, serialize
 from bigchaindb.common.schema import validate_transaction_schema
-from bigchaindb.backend.schema import validate_language_key
+from bigchaindb.backend.schema import validate_transaction_keys
 
 
 class Transaction(Transaction):
-    def validate(self, bigchain):
+    def validate(self, bigchain, signatures=None):
         """Validate transaction spend
 
         Args:
             bigchain (Bigchain): an instantiated bigchaindb.Bigchain object.
+            signatures (:class:`~bigchaindb.common.transaction.SignatureBatch`,
+                optional): if given, the signatures of the inputs are added
+                to the batch instead of being verified right away. It is
+                then up to the caller to verify the batch.
 
         Returns:
             The transaction (Transaction) if the transaction is valid else it
@@ -30,6 +37,11 @@ class Transaction(Transaction):
         """
         input_conditions = []
 
+        # The conditions of the outputs are only parsed when needed, make
+        # sure they can be before accepting them.
+        for output in self.outputs:
+            output.validate_condition()
+
         if self.operation == Transaction.TRANSFER:
             # store the inputs so that we can check if the asset ids match
             input_txs = []
@@ -77,18 +89,22 @@ class Transaction(Transaction):
                                    ' in the outputs `{}`')
                                   .format(input_amount, output_amount))
 
-        if not self.inputs_valid(input_conditions):
+        if signatures is not None:
+            signatures.add(self, input_conditions)
+        elif not self.inputs_valid(input_conditions):
             raise InvalidSignature('Transaction signature is invalid.')
 
         return self
 
     @classmethod
     def from_dict(cls, tx_body):
-        super().validate_id(tx_body)
-        validate_transaction_schema(tx_body)
-        validate_txn_obj('asset', tx_body['asset'], 'data', validate_key)
-        validate_txn_obj('metadata', tx_body, 'metadata', validate_key)
-        validate_language_key(tx_body['asset'], 'data')
+        # NOTE: The body is serialized only once. The serialization without
+        #       the `id` is hashed to validate the `id`, and is then reused for
+        #       the schema validation: the schema allows a `null` id, and the
+        #       actual `id` is now known to be a valid hexdigest.
+        tx_serialized = super().validate_id(tx_body)
+        validate_transaction_schema(tx_body, tx_serialized)
+        validate_transaction_keys(tx_body)
         return super().from_dict(tx_body)
 
     @classmethod
@@ -138,8 +154,17 @@ class Block(object):
             nodes' public keys supposed to vote on the Block.
         signature (str): A cryptographic signature ensuring the
             integrity and validity of the creator of a Block.
+
+    Note:
+        The serialization of the body of the Block (the payload of its
+        signature) and its id are computed once and cached. Rebinding any of
+        ``transactions``, ``node_pubkey``, ``timestamp`` or ``voters``
+        invalidates the cache; mutating them in place (e.g. appending a
+        transaction) requires calling :meth:`invalidate` explicitly.
     """
 
+    _BODY_ATTRIBUTES = ('transactions', 'node_pubkey', 'timestamp', 'voters')
+
     def __init__(self, transactions=None, node_pubkey=None, timestamp=None,
                  voters=None, signature=None):
         """The Block model is mainly used for (de)serialization and integrity
@@ -174,13 +199,58 @@ class Block(object):
         self.node_pubkey = node_pubkey
         self.signature = signature
 
+    def __setattr__(self, name, value):
+        if name in self._BODY_ATTRIBUTES:
+            self.invalidate()
+        super().__setattr__(name, value)
+
     def __eq__(self, other):
+        if isinstance(other, Block):
+            return (self.id == other.id and
+                    self.signature == other.signature)
         try:
             other = other.to_dict()
         except AttributeError:
             return False
         return self.to_dict() == other
 
+    def invalidate(self):
+        """Drop the cached serialization and id of the Block, to be called
+        after mutating its body in place.
+        """
+        self.__dict__.pop('_serialized_body', None)
+
+    def _body_dict(self):
+        if len(self.transactions) == 0:
+            raise ValueError('Empty block creation is not allowed')
+
+        return {
+            'timestamp': self.timestamp,
+            'transactions': [tx.to_dict() for tx in self.transactions],
+            'node_pubkey': self.node_pubkey,
+            'voters': self.voters,
+        }
+
+    def _serialize_body(self, block=None):
+        """Return the tuple (bytes, id) of the serialized body of the Block,
+        computing and caching it if needed.
+
+        Args:
+            block (dict): The body of the Block as a dict, if already
+                built by the caller.
+        """
+        try:
+            return self._serialized_body
+        except AttributeError:
+            pass
+
+        if block is None:
+            block = self._body_dict()
+        block_serialized = serialize(block)
+        self._serialized_body = (block_serialized.encode(),
+                                 hash_data(block_serialized))
+        return self._serialized_body
+
     def validate(self, bigchain):
         """Validate the Block.
 
@@ -192,7 +262,8 @@ class Block(object):
             The hash of the block (`id`) is validated on the `self.from_dict`
             method. This is because the `from_dict` is the only method in
             which we have the original json payload. The `id` provided by
-            this class is a mutable property that is generated on the fly.
+            this class is a property computed from the body of the block,
+            and cached until the body is changed.
 
         Returns:
             :class:`~.Block`: If valid, return a `Block` object. Else an
@@ -241,10 +312,20 @@ class Block(object):
         Raises:
             ValidationError: If an invalid transaction is found
         """
+        # The inputs spent by all the transactions are looked up together
+        # beforehand.
+        context = ValidationContext(bigchain, self.transactions)
+        # The signatures of all the transactions are collected and verified
+        # together once the other checks passed.
+        signatures = SignatureBatch()
         for tx in self.transactions:
-            # If a transaction is not valid, `validate_transactions` will
-            # throw an an exception and block validation will be canceled.
-            bigchain.validate_transaction(tx)
+            # If a transaction is not valid, `validate` will throw an
+            # exception and block validation will be canceled.
+            bigchain.validate_transaction(tx, context=context,
+                                          signatures=signatures)
+
+        if signatures.verify():
+            raise InvalidSignature('Transaction signature is invalid.')
 
     def sign(self, private_key):
         """Create a signature for the Block and overwrite `self.signature`.
@@ -256,10 +337,9 @@ class Block(object):
         Returns:
             :class:`~.Block`
         """
-        block_body = self.to_dict()
-        block_serialized = serialize(block_body['block'])
+        block_serialized, _ = self._serialize_body()
         private_key = PrivateKey(private_key)
-        self.signature = private_key.sign(block_serialized.encode()).decode()
+        self.signature = private_key.sign(block_serialized).decode()
         return self
 
     def is_signature_valid(self):
@@ -268,10 +348,9 @@ class Block(object):
         Returns:
             bool: Stating the validity of the Block's signature.
         """
-        block = self.to_dict()['block']
         # cc only accepts bytestring messages
-        block_serialized = serialize(block).encode()
-        public_key = PublicKey(block['node_pubkey'])
+        block_serialized, _ = self._serialize_body()
+        public_key = PublicKey(self.node_pubkey)
         try:
             # NOTE: CC throws a `ValueError` on some wrong signatures
             #       https://github.com/bigchaindb/cryptoconditions/issues/27
@@ -306,12 +385,16 @@ class Block(object):
 
         signature = block_body.get('signature')
 
-        return cls(transactions, block['node_pubkey'],
-                   block['timestamp'], block['voters'], signature)
+        block = cls(transactions, block['node_pubkey'],
+                    block['timestamp'], block['voters'], signature)
+        # The body of the block has just been serialized and hashed.
+        block._serialized_body = (block_serialized.encode(), block_id)
+        return block
 
     @property
     def id(self):
-        return self.to_dict()['id']
+        _, block_id = self._serialize_body()
+        return block_id
 
     def to_dict(self):
         """Transform the Block to a Python dictionary.
@@ -322,17 +405,8 @@ class Block(object):
         Raises:
             ValueError: If the Block doesn't contain any transactions.
         """
-        if len(self.transactions) == 0:
-            raise ValueError('Empty block creation is not allowed')
-
-        block = {
-            'timestamp': self.timestamp,
-            'transactions': [tx.to_dict() for tx in self.transactions],
-            'node_pubkey': self.node_pubkey,
-            'voters': self.voters,
-        }
-        block_serialized = serialize(block)
-        block_id = hash_data(block_serialized)
+        block = self._body_dict()
+        _, block_id = self._serialize_body(block)
 
         return {
             'id': block_id,
@@ -367,6 +441,36 @@ class Block(object):
         kwargs = from_dict_kwargs or {}
         return cls.from_dict(block_dict, **kwargs)
 
+    def decouple(self):
+        """Extracts the assets of the ``CREATE`` transactions and the metadata
+        of all the transactions of the block, in a single pass.
+
+        Unlike :meth:`decouple_assets` and :meth:`decouple_metadata`, the
+        block is not deep copied: the returned documents are new dicts
+        sharing the (unmodified) assets and metadata of the transactions.
+
+        Returns:
+            tuple: (assets, metadatas, block) with the assets and metadatas as
+            returned by :meth:`decouple_assets` and :meth:`decouple_metadata`
+            and the block being the dict of the block with neither.
+        """
+        block_dict = self.to_dict()
+        assets = []
+        metadatas = []
+        transactions = block_dict['block']['transactions']
+        for i, transaction in enumerate(transactions):
+            # shallow copy, the dict may be owned by the transaction
+            transaction = transactions[i] = dict(transaction)
+            if transaction['operation'] in [Transaction.CREATE,
+                                            Transaction.GENESIS]:
+                asset = transaction.pop('asset')
+                assets.append(dict(asset, id=transaction['id']))
+            metadata = transaction.pop('metadata')
+            if metadata:
+                metadatas.append({'id': transaction['id'],
+                                  'metadata': metadata})
+        return (assets, metadatas, block_dict)
+
     def decouple_assets(self, block_dict=None):
         """Extracts the assets from the ``CREATE`` transactions in the block.
 
@@ -520,3 +624,178 @@ class FastTransaction:
 
     def to_dict(self):
         return self.data
+
+
+class ValidationContext:
+    """Serves the lookups that :meth:`Transaction.validate` makes on a
+    :class:`~bigchaindb.Bigchain` from data prefetched in bulk.
+
+    The transactions spent by the inputs of a batch of transactions (e.g.
+    the transactions of a Block), their statuses and the transactions that
+    spend them already are fetched up front in a handful of queries, instead
+    of several queries per input.
+
+    Lookups outside of the prefetched data, as well as any other attribute,
+    are delegated to the wrapped :class:`~bigchaindb.Bigchain`.
+
+    Args:
+        bigchain (:class:`~bigchaindb.Bigchain`): An instance of Bigchain
+            used to perform database queries.
+        transactions (:obj:`list` of :class:`~.Transaction`): The
+            transactions that will be validated.
+    """
+
+    def __init__(self, bigchain, transactions):
+        self.bigchain = bigchain
+        self._links = {input_.fulfills
+                       for tx in transactions
+                       if tx.operation == Transaction.TRANSFER
+                       for input_ in tx.inputs}
+        self._spends = defaultdict(list)
+        self._block_ids = defaultdict(list)
+        self._block_txs = {}
+        self._blocks_status = {}
+        self._backlog_txs = {}
+        self._assets = {}
+        self._metadata = {}
+        self._resolved = {}
+        self._txids = set()
+        if self._links:
+            self._prefetch_spends()
+            self._prefetch_transactions()
+
+    def __getattr__(self, name):
+        return getattr(self.bigchain, name)
+
+    def _prefetch_spends(self):
+        links = [link.to_dict() for link in self._links]
+        seen = set()
+        for block_id, tx_dict in backend.query.get_spending_transactions(
+                self.bigchain.connection, links):
+            if (block_id, tx_dict['id']) in seen:
+                continue
+            seen.add((block_id, tx_dict['id']))
+            for input_ in tx_dict['inputs']:
+                link = TransactionLink.from_dict(input_['fulfills'])
+                if link in self._links:
+                    self._spends[link].append(tx_dict)
+
+    def _prefetch_transactions(self):
+        """Fetch the spent and spending transactions along with the data
+        needed to determine their statuses."""
+        connection = self.bigchain.connection
+        self._txids = {link.txid for link in self._links}
+        self._txids.update(tx_dict['id']
+                           for spends in self._spends.values()
+                           for tx_dict in spends)
+        txids = list(self._txids)
+
+        for entry in self.bigchain.get_indexed_transactions(txids):
+            txid = entry['transaction_id']
+            self._block_ids[txid].append(entry['block_id'])
+            self._block_txs[txid] = entry['transaction']
+            self._blocks_status[entry['block_id']] = entry['status']
+
+        # The transactions found in invalid blocks only, or in no blocks,
+        # are looked for in the backlog.
+        backlog_txids = [txid for txid in txids
+                         if all(self._blocks_status[block_id] ==
+                                self.bigchain.BLOCK_INVALID
+                                for block_id in self._block_ids[txid])]
+        if backlog_txids:
+            self._backlog_txs = {
+                tx_dict['id']: tx_dict
+                for tx_dict in backend.query.get_transactions_from_backlog(
+                    connection, backlog_txids)
+            }
+
+        asset_ids = [txid for txid, tx_dict in self._block_txs.items()
+                     if tx_dict['operation'] in [Transaction.CREATE,
+                                                 Transaction.GENESIS]]
+        if asset_ids:
+            self._assets = {asset.pop('id'): asset
+                            for asset in self.bigchain.get_assets(asset_ids)}
+        if self._block_txs:
+            self._metadata = {
+                metadata['id']: metadata.get('metadata')
+                for metadata in self.bigchain.get_metadata(
+                    list(self._block_txs))
+            }
+
+    def get_transaction(self, txid, include_status=False):
+        """Get the transaction with the specified `txid` (and optionally its
+        status), as :meth:`~bigchaindb.Bigchain.get_transaction` does.
+        """
+        if txid not in self._txids:
+            return self.bigchain.get_transaction(txid, include_status)
+
+        if txid not in self._resolved:
+            self._resolved[txid] = self._resolve_transaction(txid)
+
+        if include_status:
+            return self._resolved[txid]
+        else:
+            return self._resolved[txid][0]
+
+    def _resolve_transaction(self, txid):
+        blocks_validity_status = {block_id: self._blocks_status[block_id]
+                                  for block_id in self._block_ids[txid]}
+
+        # NOTE: If there are multiple valid blocks with this transaction,
+        # something has gone wrong
+        valid_block_ids = [block_id for block_id, status
+                           in blocks_validity_status.items()
+                           if status == self.bigchain.BLOCK_VALID]
+        if len(valid_block_ids) > 1:
+            raise core_exceptions.CriticalDoubleInclusion(
+                'Transaction {tx} is present in '
+                'multiple valid blocks: {block_ids}'
+                .format(tx=txid, block_ids=str(valid_block_ids)))
+
+        if any(status != self.bigchain.BLOCK_INVALID
+               for status in blocks_validity_status.values()):
+            tx_dict = dict(self._block_txs[txid])
+            if tx_dict['operation'] in [Transaction.CREATE,
+                                        Transaction.GENESIS]:
+                tx_dict['asset'] = self._assets[txid]
+            if 'metadata' not in tx_dict:
+                tx_dict['metadata'] = self._metadata.get(txid)
+            if valid_block_ids:
+                status = self.bigchain.TX_VALID
+            else:
+                status = self.bigchain.TX_UNDECIDED
+            return Transaction.from_dict(tx_dict), status
+
+        tx_dict = self._backlog_txs.get(txid)
+        if tx_dict:
+            return (Transaction.from_dict(tx_dict),
+                    self.bigchain.TX_IN_BACKLOG)
+        return None, None
+
+    def get_spent(self, txid, output):
+        """Check if a `txid` was already used as an input, as
+        :meth:`~bigchaindb.Bigchain.get_spent` does.
+        """
+        link = TransactionLink(txid, output)
+        if link not in self._links:
+            return self.bigchain.get_spent(txid, output)
+
+        num_valid_transactions = 0
+        non_invalid_transactions = []
+        for transaction in self._spends[link]:
+            txn, status = self.get_transaction(transaction['id'],
+                                               include_status=True)
+            if status == self.bigchain.TX_VALID:
+                num_valid_transactions += 1
+            # `txid` can only have been spent in at most on valid block.
+            if num_valid_transactions > 1:
+                raise core_exceptions.CriticalDoubleSpend(
+                    '`{}` was spent more than once. There is a problem'
+                    ' with the chain'.format(txid))
+            # if its not and invalid transaction
+            if status is not None:
+                non_invalid_transactions.append(
+                    dict(transaction, metadata=txn.metadata))
+
+        if non_invalid_transactions:
+            return Transaction.from_dict(non_invalid_transactions[0])
@@ -6,13 +6,16 @@ function.
 """
 
 import logging
+from time import time
 
 from multipipes import Pipeline, Node, Pipe
 
 import bigchaindb
 from bigchaindb import backend
 from bigchaindb.backend.changefeed import ChangeFeed
-from bigchaindb.models import Transaction
+from bigchaindb.models import Transaction, ValidationContext
+from bigchaindb.common.transaction import SignatureBatch
+from bigchaindb.common.utils import serialize
 from bigchaindb.common.exceptions import (ValidationError,
                                           GenesisBlockAlreadyExistsError)
 from bigchaindb import Bigchain
@@ -28,10 +31,25 @@ class BlockPipeline:
         Methods of this class will be executed in different processes.
     """
 
-    def __init__(self):
-        """Initialize the BlockPipeline creator"""
+    def __init__(self, batch_size=100, batch_timeout=0.1):
+        """Initialize the BlockPipeline creator
+
+        Args:
+            batch_size (int): the maximum number of transactions validated
+                together by :meth:`validate_txs`. It is capped to the
+                minimum size of a block.
+            batch_timeout (float): the maximum time, in seconds, a
+                transaction waits for a batch to fill up.
+        """
         self.bigchain = Bigchain()
+        self.policy = BlockSizePolicy(self.bigchain)
         self.txs = tx_collector()
+        self.txs_bytes = {}
+        self.block_start = None
+        self.batch_size = min(batch_size, self.policy.min_size)
+        self.batch_timeout = batch_timeout
+        self.batch = []
+        self.batch_start = None
 
     def filter_tx(self, tx):
         """Filter a transaction.
@@ -46,8 +64,101 @@ class BlockPipeline:
         if tx['assignee'] == self.bigchain.me:
             tx.pop('assignee')
             tx.pop('assignment_timestamp')
+            tx.pop('assignment_expiry', None)
             return tx
 
+    def batch_tx(self, tx, timeout=False):
+        """Group transactions in batches.
+
+        A batch is output when one of the following conditions is true:
+        - the size limit of the batch has been reached, or
+        - the first transaction of the batch waited `batch_timeout` seconds,
+          or a timeout happened.
+
+        Args:
+            tx (dict): the transaction to add, might be None if a timeout
+                happens.
+            timeout (bool): ``True`` if a timeout happened
+                (Default: ``False``).
+
+        Returns:
+            list: The batch of transactions, if a batch is ready, or
+            ``None``.
+        """
+        if tx:
+            if not self.batch:
+                self.batch_start = time()
+            self.batch.append(tx)
+
+        if self.batch and (len(self.batch) >= self.batch_size or timeout or
+                           time() - self.batch_start >= self.batch_timeout):
+            batch, self.batch = self.batch, []
+            return batch
+
+    def validate_txs(self, txs):
+        """Validate a batch of transactions.
+
+        This is the batched version of :meth:`validate_tx`: the transactions
+        already in the blockchain are looked up together, the inputs of the
+        transactions are prefetched together, their signatures are verified
+        together, and the transactions that are invalid or already in the
+        blockchain are deleted from the backlog together.
+
+        Args:
+            txs (list): the transactions (dict) to validate.
+
+        Returns:
+            list: The valid transactions
+            (:class:`~bigchaindb.models.Transaction`), or ``None`` if none
+            of them is valid.
+        """
+        transactions = []
+        for tx in txs:
+            try:
+                transactions.append(Transaction.from_dict(tx))
+            except ValidationError:
+                pass
+
+        # If transaction is in any VALID or UNDECIDED block we
+        # should not include it again
+        new_txids = set(self.bigchain.filter_new_transactions(
+            [tx.id for tx in transactions]))
+        to_delete = [tx.id for tx in transactions if tx.id not in new_txids]
+        transactions = [tx for tx in transactions if tx.id in new_txids]
+
+        context = ValidationContext(self.bigchain, transactions)
+        signatures = SignatureBatch()
+        checked_txs = []
+        for tx in transactions:
+            # If transaction is not valid it should not be included
+            try:
+                # Do not allow an externally submitted GENESIS transaction.
+                # See `validate_tx`.
+                if tx.operation == Transaction.GENESIS:
+                    raise GenesisBlockAlreadyExistsError('Duplicate GENESIS transaction')
+
+                self.bigchain.validate_transaction(tx, context=context,
+                                                   signatures=signatures)
+                checked_txs.append(tx)
+            except ValidationError as e:
+                logger.warning('Invalid tx: %s', e)
+                to_delete.append(tx.id)
+
+        # The signatures of the batch are verified together.
+        invalid_txids = set(tx.id for tx in signatures.verify())
+        valid_txs = []
+        for tx in checked_txs:
+            if tx.id in invalid_txids:
+                logger.warning('Invalid tx: Transaction signature is invalid.')
+                to_delete.append(tx.id)
+            else:
+                valid_txs.append(tx)
+
+        if to_delete:
+            self.bigchain.delete_transaction(*to_delete)
+
+        return valid_txs or None
+
     def validate_tx(self, tx):
         """Validate a transaction.
 
@@ -82,7 +193,7 @@ class BlockPipeline:
             if tx.operation == Transaction.GENESIS:
                 raise GenesisBlockAlreadyExistsError('Duplicate GENESIS transaction')
 
-            tx.validate(self.bigchain)
+            self.bigchain.validate_transaction(tx)
             return tx
         except ValidationError as e:
             logger.warning('Invalid tx: %s', e)
@@ -94,24 +205,58 @@ class BlockPipeline:
 
         This method accumulates transactions to put in a block and outputs
         a block when one of the following conditions is true:
-        - the size limit of the block has been reached, or
-        - a timeout happened.
+        - the size limit (in transactions or in bytes) of the block has been
+          reached, or
+        - the first transaction of the block waited for the block timeout.
+
+        The limits are decided by :attr:`policy`.
 
         Args:
             tx (:class:`~bigchaindb.models.Transaction`): the transaction
-                to validate, might be None if a timeout happens.
+                to validate, or a list of transactions (as output by
+                :meth:`validate_txs`), might be None if a timeout happens.
             timeout (bool): ``True`` if a timeout happened
-                (Default: ``False``).
+                (Default: ``False``). The pipeline times out after the
+                minimum block timeout, so that the block is closed in time
+                whatever the current block timeout is: a timeout alone does
+                not close the block.
 
         Returns:
             :class:`~bigchaindb.models.Block`: The block,
             if a block is ready, or ``None``.
         """
-        txs = self.txs.send(tx)
-        if len(txs) == 1000 or (timeout and txs):
-            block = self.bigchain.create_block(txs)
-            self.txs = tx_collector()
-            return block
+        for tx in (tx if isinstance(tx, list) else [tx]):
+            if tx and tx.id not in self.txs_bytes:
+                if not self.txs_bytes:
+                    self.block_start = time()
+                self.txs_bytes[tx.id] = len(serialize(tx.to_dict()))
+            self.txs.send(tx)
+
+        txs = self.txs.send(None)
+        # count the transactions that fit in a block
+        count, size = 0, 0
+        for tx in txs:
+            size += self.txs_bytes[tx.id]
+            if count == self.policy.size or (count and size > self.policy.max_bytes):
+                break
+            count += 1
+
+        if count < len(txs) or count == self.policy.size or \
+                (txs and time() - self.block_start >= self.policy.timeout):
+            return self._create_block(txs, count)
+
+    def _create_block(self, txs, count):
+        block = self.bigchain.create_block(txs[:count])
+
+        # the transactions that did not fit go to the next block
+        self.txs = tx_collector()
+        self.txs_bytes = {tx.id: self.txs_bytes[tx.id] for tx in txs[count:]}
+        for tx in txs[count:]:
+            self.txs.send(tx)
+        self.block_start = time()
+
+        self.policy.update(block)
+        return block
 
     def write(self, block):
         """Write the block to the Database.
@@ -144,6 +289,114 @@ class BlockPipeline:
         return block
 
 
+class BlockSizePolicy:
+    """Decide the limits of the blocks created by the block pipeline.
+
+    The limits are read from the ``block`` section of the configuration. If
+    ``block.adaptive`` is set, the size and the timeout of the blocks are
+    adapted to the load of the node by :meth:`update`.
+
+    Attributes:
+        size (int): the maximum number of transactions in a block.
+        max_bytes (int): the maximum size, in bytes, of the serialized
+            transactions of a block.
+        timeout (float): the maximum time, in seconds, a transaction waits
+            for its block to be closed.
+    """
+
+    def __init__(self, bigchain, config=None, update_interval=5):
+        """Initialize the policy.
+
+        Args:
+            bigchain (:class:`~bigchaindb.Bigchain`): the Bigchain instance
+                used to query the load of the node and to send statsd events.
+            config (dict): the block settings. Defaults to the ``block``
+                section of the configuration.
+            update_interval (float): the minimum time, in seconds, between
+                two adaptations of the limits.
+        """
+        config = config or bigchaindb.config['block']
+        self.bigchain = bigchain
+        self.adaptive = config['adaptive']
+        self.max_size = config['max_size']
+        self.max_bytes = config['max_bytes']
+        self.max_timeout = config['timeout']
+        if self.adaptive:
+            self.min_size = min(config['min_size'], self.max_size)
+            self.min_timeout = min(config['min_timeout'], self.max_timeout)
+        else:
+            self.min_size = self.max_size
+            self.min_timeout = self.max_timeout
+        self.size = self.max_size
+        self.timeout = self.max_timeout
+        self.update_interval = update_interval
+        self.last_update = 0
+        self.last_block = None
+
+    def update(self, block):
+        """Adapt the limits after a block has been created.
+
+        Blocks grow when the node falls behind, i.e. when the backlog holds
+        at least a block worth of transactions, or when the votes on the
+        previously observed block lagged more than the maximum timeout:
+        larger blocks spread the cost of voting over more transactions.
+        Blocks shrink when the traffic is light, i.e. when the backlog holds
+        less than a quarter of a block, to lower the commit latency.
+
+        The limits are adapted at most once every ``update_interval``
+        seconds, and the decisions are sent to statsd.
+
+        Args:
+            block (:class:`~bigchaindb.models.Block`): the block created.
+        """
+        if not self.adaptive:
+            return
+
+        now = time()
+        if now - self.last_update < self.update_interval:
+            return
+        self.last_update = now
+        previous_block, self.last_block = self.last_block, block
+
+        backlog = backend.query.count_backlog(self.bigchain.connection)
+        vote_lag = self.vote_lag(previous_block, now)
+
+        if backlog >= self.size or vote_lag > self.max_timeout:
+            self.size = min(self.size * 2, self.max_size)
+            self.timeout = min(self.timeout * 2, self.max_timeout)
+        elif backlog < self.size // 4:
+            self.size = max(self.size // 2, self.min_size)
+            self.timeout = max(self.timeout / 2, self.min_timeout)
+
+        logger.debug('Block size %s, timeout %s (backlog: %s, vote lag: %s)',
+                     self.size, self.timeout, backlog, vote_lag)
+        self.bigchain.statsd.gauge('pipelines.block.backlog', backlog)
+        self.bigchain.statsd.timing('pipelines.block.vote_lag',
+                                    vote_lag * 1000)
+        self.bigchain.statsd.gauge('pipelines.block.size', self.size)
+        self.bigchain.statsd.gauge('pipelines.block.timeout', self.timeout)
+
+    def vote_lag(self, block, now):
+        """Return the time, in seconds, the votes on a block took, or have
+        been taking so far if not all the voters voted yet.
+
+        Args:
+            block (:class:`~bigchaindb.models.Block`): the block, might be
+                ``None``.
+            now (float): the current time.
+        """
+        if block is None:
+            return 0
+
+        votes = list(backend.query.get_votes_by_block_id(
+            self.bigchain.connection, block.id))
+        if len(votes) < len(block.voters):
+            end = now
+        else:
+            end = max(int(vote['vote']['timestamp']) for vote in votes)
+        return max(end - int(block.timestamp), 0)
+
+
 def tx_collector():
     """A helper to deduplicate transactions"""
 
@@ -175,8 +428,9 @@ def create_pipeline():
     pipeline = Pipeline([
         Pipe(maxsize=1000),
         Node(block_pipeline.filter_tx),
-        Node(block_pipeline.validate_tx, fraction_of_cores=1),
-        Node(block_pipeline.create, timeout=1),
+        Node(block_pipeline.batch_tx, timeout=block_pipeline.batch_timeout),
+        Node(block_pipeline.validate_txs, fraction_of_cores=1),
+        Node(block_pipeline.create, timeout=block_pipeline.policy.min_timeout),
         Node(block_pipeline.write),
         Node(block_pipeline.delete_tx),
     ])
@@ -186,8 +440,14 @@ def create_pipeline():
 
 def get_changefeed():
     connection = backend.connect(**bigchaindb.config['database'])
+    # resume after the last change of the backlog seen by this node. The
+    # transactions it output but did not write in a block before a crash are
+    # not output again: the stale monitor reassigns them once their
+    # assignment expires.
+    checkpoint = 'block.{}'.format(bigchaindb.config['keypair']['public'])
     return backend.get_changefeed(connection, 'backlog',
-                                  ChangeFeed.INSERT | ChangeFeed.UPDATE)
+                                  ChangeFeed.INSERT | ChangeFeed.UPDATE,
+                                  checkpoint=checkpoint)
 
 
 def start():
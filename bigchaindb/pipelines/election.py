@@ -23,9 +23,10 @@ logger_results = logging.getLogger('pipeline.election.results')
 class Election:
     """Election class."""
 
-    def __init__(self, events_queue=None):
+    def __init__(self, events_queue=None, changefeed=None):
         self.bigchain = Bigchain()
         self.events_queue = events_queue
+        self.changefeed = changefeed
 
     def check_for_quorum(self, next_vote):
         """Checks if block has enough invalid votes to make a decision
@@ -43,6 +44,11 @@ class Election:
         next_block = self.bigchain.get_block(block_id)
 
         result = self.bigchain.block_election(next_block)
+        if result['status'] != self.bigchain.BLOCK_UNDECIDED:
+            backend.query.update_transactions_status(self.bigchain.connection,
+                                                     block_id, result['status'])
+        if result['status'] == self.bigchain.BLOCK_VALID:
+            self.bigchain.store_block_outputs(next_block)
         self.handle_block_events(result, block_id)
         if result['status'] == self.bigchain.BLOCK_INVALID:
             return Block.from_dict(next_block)
@@ -68,6 +74,25 @@ class Election:
             self.bigchain.write_transaction(tx)
         return invalid_block
 
+    def process_vote(self, next_vote):
+        """Check for quorum on the block of a vote, requeue its
+        transactions if it is invalid, then acknowledge the vote to the
+        changefeed, so that a vote is not missed if the node crashes
+        before the statuses and the outputs of the block are updated.
+
+        Args:
+            next_vote: The next vote.
+
+        Returns:
+            The block if it was voted invalid, ``None`` otherwise.
+        """
+        invalid_block = self.check_for_quorum(next_vote)
+        if invalid_block:
+            self.requeue_transactions(invalid_block)
+        if self.changefeed:
+            self.changefeed.ack()
+        return invalid_block
+
     def handle_block_events(self, result, block_id):
         if self.events_queue:
             if result['status'] == self.bigchain.BLOCK_UNDECIDED:
@@ -81,12 +106,12 @@ class Election:
             self.events_queue.put(event)
 
 
-def create_pipeline(events_queue=None):
-    election = Election(events_queue=events_queue)
+def create_pipeline(events_queue=None, changefeed=None):
+    election = Election(events_queue=events_queue, changefeed=changefeed)
 
+    # a single node, so that a vote is acknowledged once fully processed
     election_pipeline = Pipeline([
-        Node(election.check_for_quorum),
-        Node(election.requeue_transactions)
+        Node(election.process_vote),
     ])
 
     return election_pipeline
@@ -94,11 +119,16 @@ def create_pipeline(events_queue=None):
 
 def get_changefeed():
     connection = backend.connect(**bigchaindb.config['database'])
-    return backend.get_changefeed(connection, 'votes', ChangeFeed.INSERT)
+    # resume after the last vote seen by this node
+    checkpoint = 'election.{}'.format(bigchaindb.config['keypair']['public'])
+    return backend.get_changefeed(connection, 'votes', ChangeFeed.INSERT,
+                                  checkpoint=checkpoint, acks=True)
 
 
 def start(events_queue=None):
-    pipeline = create_pipeline(events_queue=events_queue)
-    pipeline.setup(indata=get_changefeed())
+    changefeed = get_changefeed()
+    pipeline = create_pipeline(events_queue=events_queue,
+                               changefeed=changefeed)
+    pipeline.setup(indata=changefeed)
     pipeline.start()
     return pipeline
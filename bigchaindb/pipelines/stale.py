@@ -1,7 +1,7 @@
 """This module monitors for stale transactions.
 
 It reassigns transactions which have been assigned a node but
-remain in the backlog past a certain amount of time.
+remain in the backlog past the expiry of their assignment.
 """
 
 import logging
@@ -25,33 +25,24 @@ class StaleTransactionMonitor:
 
         Args:
             timeout: how often to check for stale tx (in sec)
-            backlog_reassign_delay: How stale a transaction should
-                be before reassignment (in sec). If supplied, overrides
-                the Bigchain default value.
+            backlog_reassign_delay: How long a transaction is assigned to
+                a node (in sec). If supplied, overrides the Bigchain default
+                value.
         """
         self.bigchain = Bigchain(backlog_reassign_delay=backlog_reassign_delay)
         self.timeout = timeout
 
-    def check_transactions(self):
-        """Poll backlog for stale transactions
+    def reassign_transactions(self):
+        """Reassign the stale transactions of the backlog in bulk.
 
         Returns:
-            txs (list): txs to be re assigned
+            int: the number of reassigned transactions.
         """
         sleep(self.timeout)
-        for tx in self.bigchain.get_stale_transactions():
-            yield tx
-
-    def reassign_transactions(self, tx):
-        """Put tx back in backlog with new assignee
-
-        Returns:
-            transaction
-        """
-        # NOTE: Maybe this is to verbose?
-        logger.info('Reassigning transaction with id %s', tx['id'])
-        self.bigchain.reassign_transaction(tx)
-        return tx
+        reassigned = self.bigchain.reassign_stale_transactions()
+        if reassigned:
+            logger.info('Reassigned %s stale transactions', reassigned)
+        return reassigned
 
 
 def create_pipeline(timeout=5, backlog_reassign_delay=5):
@@ -63,8 +54,7 @@ def create_pipeline(timeout=5, backlog_reassign_delay=5):
                                   backlog_reassign_delay=backlog_reassign_delay)
 
     monitor_pipeline = Pipeline([
-        Node(stm.check_transactions),
-        Node(stm.reassign_transactions)
+        Node(stm.reassign_transactions),
     ])
 
     return monitor_pipeline
@@ -6,18 +6,56 @@ function.
 """
 
 import logging
+import ctypes
+import multiprocessing as mp
 from collections import Counter
 
 from multipipes import Pipeline, Node
 
 from bigchaindb import backend, Bigchain
-from bigchaindb.models import Transaction, Block, FastTransaction
+from bigchaindb.models import (Transaction, Block, FastTransaction,
+                               ValidationContext)
 from bigchaindb.common import exceptions
+from bigchaindb.common.transaction import SignatureBatch
 
 
 logger = logging.getLogger(__name__)
 
 
+class InvalidBlocks:
+    """A bounded set of the ids of the blocks already voted INVALID, shared
+    between the processes of the pipeline.
+
+    The ids are stored in shared memory, so that the processes validating
+    the transactions can skip the ones of a block that has already been
+    decided without any round trip. Once full, the oldest ids are
+    overwritten.
+    """
+
+    ID_SIZE = 64
+
+    def __init__(self, size=64):
+        self.size = size
+        self.ids = mp.Array(ctypes.c_char, self.ID_SIZE * size)
+        self.next = mp.Value(ctypes.c_int, 0)
+
+    def _key(self, block_id):
+        return str(block_id).encode()[:self.ID_SIZE].ljust(self.ID_SIZE, b'\0')
+
+    def add(self, block_id):
+        key = self._key(block_id)
+        with self.next.get_lock():
+            start = self.next.value * self.ID_SIZE
+            self.ids[start:start + self.ID_SIZE] = key
+            self.next.value = (self.next.value + 1) % self.size
+
+    def __contains__(self, block_id):
+        key = self._key(block_id)
+        ids = self.ids.raw
+        return any(ids[i:i + self.ID_SIZE] == key
+                   for i in range(0, len(ids), self.ID_SIZE))
+
+
 class Vote:
     """This class encapsulates the logic to vote on blocks.
 
@@ -25,8 +63,15 @@ class Vote:
         Methods of this class will be executed in different processes.
     """
 
-    def __init__(self):
-        """Initialize the Block voter."""
+    def __init__(self, chunks=None):
+        """Initialize the Block voter.
+
+        Args:
+            chunks (int): the number of chunks the transactions of a block
+                are split in by :meth:`split`. Defaults to the number of
+                cores, i.e. the number of processes running
+                :meth:`validate_chunk`.
+        """
 
         # Since cannot share a connection to RethinkDB using multiprocessing,
         # we need to create a temporary instance of BigchainDB that we use
@@ -36,14 +81,13 @@ class Vote:
         # by all the subprocesses
 
         self.bigchain = Bigchain()
-        self.last_voted_id = Bigchain().get_last_voted_block().id
+        self.last_voted_id = self.bigchain.get_last_voted_block().id
 
+        self.chunks = chunks or mp.cpu_count()
         self.counters = Counter()
-        self.blocks_validity_status = {}
-
-        dummy_tx = Transaction.create([self.bigchain.me],
-                                      [([self.bigchain.me], 1)]).to_dict()
-        self.invalid_dummy_tx = dummy_tx
+        # blocks voted INVALID before all their transactions were processed
+        self.decided = set()
+        self.invalid_blocks = InvalidBlocks()
 
     def validate_block(self, block_dict):
         if not self.bigchain.has_previous_vote(block_dict['id']):
@@ -52,21 +96,11 @@ class Vote:
                     'tx_construct': FastTransaction
                 })
             except (exceptions.InvalidHash):
-                # XXX: if a block is invalid we should skip the `validate_tx`
-                # step, but since we are in a pipeline we cannot just jump to
-                # another function. Hackish solution: generate an invalid
-                # transaction and propagate it to the next steps of the
-                # pipeline.
-                return block_dict['id'], [self.invalid_dummy_tx]
+                return block_dict['id'], None
             try:
                 block._validate_block(self.bigchain)
             except exceptions.ValidationError:
-                # XXX: if a block is invalid we should skip the `validate_tx`
-                # step, but since we are in a pipeline we cannot just jump to
-                # another function. Hackish solution: generate an invalid
-                # transaction and propagate it to the next steps of the
-                # pipeline.
-                return block.id, [self.invalid_dummy_tx]
+                return block.id, None
             return block.id, block_dict['block']['transactions']
 
     def ungroup(self, block_id, transactions):
@@ -75,24 +109,103 @@ class Vote:
         Args:
             block_id (str): the id of the block in progress.
             transactions (list(dict)): transactions of the block in
-                progress.
+                progress, or ``None`` if the block itself is invalid.
 
         Returns:
             ``None`` if the block has been already voted, an iterator that
             yields a transaction, block id, and the total number of
-            transactions contained in the block otherwise.
+            transactions contained in the block otherwise. An invalid block
+            is ungrouped as a single ``None`` transaction.
         """
 
+        if transactions is None:
+            yield None, block_id, 1
+            return
         num_tx = len(transactions)
         for tx in transactions:
             yield tx, block_id, num_tx
 
+    def split(self, block_id, transactions):
+        """Given a block, split the transactions in it in chunks.
+
+        Args:
+            block_id (str): the id of the block in progress.
+            transactions (list(dict)): transactions of the block in
+                progress, or ``None`` if the block itself is invalid.
+
+        Returns:
+            An iterator that yields a chunk of transactions, block id, and
+            the total number of transactions contained in the block. An
+            invalid block is split in a single ``None`` chunk.
+        """
+
+        if transactions is None:
+            yield None, block_id, 1
+            return
+        num_tx = len(transactions)
+        size = max(-(-num_tx // self.chunks), 1)
+        for i in range(0, num_tx, size):
+            yield transactions[i:i + size], block_id, num_tx
+
+    def validate_chunk(self, tx_dicts, block_id, num_tx):
+        """Validate a chunk of transactions of a block. Transactions must also
+           not be in any VALID block.
+
+        This is the batched version of :meth:`validate_tx`: the lookups of
+        the transactions are prefetched together, and their signatures are
+        verified together.
+
+        The chunk is not validated if the block has already been voted
+        INVALID.
+
+        Args:
+            tx_dicts (list(dict)): the transactions to validate, or ``None``
+                if the block itself is invalid
+            block_id (str): the id of block containing the transactions
+            num_tx (int): the total number of transactions to process
+
+        Returns:
+            Four values are returned, the validity of the transactions,
+            ``block_id``, ``num_tx``, and the number of transactions
+            processed.
+        """
+
+        if tx_dicts is None:
+            return False, block_id, num_tx, 1
+        if block_id in self.invalid_blocks:
+            return False, block_id, num_tx, len(tx_dicts)
+
+        try:
+            txs = [Transaction.from_dict(tx_dict) for tx_dict in tx_dicts]
+            new = self.bigchain.filter_new_transactions(
+                [tx.id for tx in txs], exclude_block_id=block_id)
+            if len(new) != len(txs):
+                raise exceptions.ValidationError('Tx already exists, %s',
+                                                 set(tx.id for tx in txs) - set(new))
+            context = ValidationContext(self.bigchain, txs)
+            signatures = SignatureBatch()
+            for tx in txs:
+                self.bigchain.validate_transaction(tx, context=context,
+                                                   signatures=signatures)
+            if signatures.verify():
+                raise exceptions.InvalidSignature('Transaction signature is invalid.')
+            valid = True
+        except exceptions.ValidationError as e:
+            valid = False
+            logger.warning('Invalid tx: %s', e)
+
+        return valid, block_id, num_tx, len(tx_dicts)
+
     def validate_tx(self, tx_dict, block_id, num_tx):
         """Validate a transaction. Transaction must also not be in any VALID
            block.
 
+        The transaction is not validated if the block has already been
+        voted INVALID.
+
         Args:
-            tx_dict (dict): the transaction to validate
+            tx_dict (dict): the transaction to validate, or ``None`` if the
+                block itself is invalid
             block_id (str): the id of block containing the transaction
             num_tx (int): the total number of transactions to process
 
@@ -101,6 +214,9 @@ class Vote:
             ``block_id``, ``num_tx``.
         """
 
+        if tx_dict is None or block_id in self.invalid_blocks:
+            return False, block_id, num_tx
+
         try:
             tx = Transaction.from_dict(tx_dict)
             new = self.bigchain.is_new_transaction(tx.id, exclude_block_id=block_id)
@@ -114,30 +230,45 @@ class Vote:
 
         return valid, block_id, num_tx
 
-    def vote(self, tx_validity, block_id, num_tx):
+    def vote(self, tx_validity, block_id, num_tx, num_validated=1):
         """Collect the validity of transactions and cast a vote when ready.
 
+        A block is voted INVALID as soon as one of its transactions is
+        invalid, the results for its remaining transactions are then
+        dropped. It is voted VALID once all its transactions are valid.
+
         Args:
-            tx_validity (bool): the validity of the transaction
-            block_id (str): the id of block containing the transaction
+            tx_validity (bool): the validity of the transaction(s)
+            block_id (str): the id of block containing the transaction(s)
             num_tx (int): the total number of transactions to process
+            num_validated (int): the number of transactions `tx_validity`
+                stands for (Default: 1).
 
         Returns:
             None, or a vote if a decision has been reached.
         """
 
-        self.counters[block_id] += 1
-        self.blocks_validity_status[block_id] = tx_validity and self.blocks_validity_status.get(block_id,
-                                                                                                True)
-
-        if self.counters[block_id] == num_tx:
-            vote = self.bigchain.vote(block_id,
-                                      self.last_voted_id,
-                                      self.blocks_validity_status[block_id])
-            self.last_voted_id = block_id
+        self.counters[block_id] += num_validated
+        done = self.counters[block_id] >= num_tx
+        if done:
             del self.counters[block_id]
-            del self.blocks_validity_status[block_id]
-            return vote, num_tx
+
+        if block_id in self.decided:
+            if done:
+                self.decided.remove(block_id)
+            return
+
+        if not tx_validity:
+            # let the validation of the remaining transactions be skipped
+            self.invalid_blocks.add(block_id)
+            if not done:
+                self.decided.add(block_id)
+        elif not done:
+            return
+
+        vote = self.bigchain.vote(block_id, self.last_voted_id, tx_validity)
+        self.last_voted_id = block_id
+        return vote, num_tx
 
     def write_vote(self, vote, num_tx):
         """Write vote to the database.
@@ -153,17 +284,30 @@ class Vote:
         return vote
 
 
-def create_pipeline():
+def create_pipeline(block_at_a_time=True):
     """Create and return the pipeline of operations to be distributed
     on different processes.
+
+    Args:
+        block_at_a_time (bool): if ``True``, the transactions of a block are
+            validated in a few chunks, one per process, otherwise they are
+            validated one by one (Default: ``True``).
     """
 
     voter = Vote()
 
-    return Pipeline([
-        Node(voter.validate_block),
-        Node(voter.ungroup),
-        Node(voter.validate_tx, fraction_of_cores=1),
+    if block_at_a_time:
+        validation = [
+            Node(voter.split),
+            Node(voter.validate_chunk, fraction_of_cores=1),
+        ]
+    else:
+        validation = [
+            Node(voter.ungroup),
+            Node(voter.validate_tx, fraction_of_cores=1),
+        ]
+
+    return Pipeline([Node(voter.validate_block)] + validation + [
         Node(voter.vote),
         Node(voter.write_vote)
     ])
@@ -5,7 +5,7 @@ import bigchaindb
 from bigchaindb import config_utils
 from bigchaindb.pipelines import vote, block, election, stale
 from bigchaindb.events import Exchange, EventTypes
-from bigchaindb.web import server, websocket_server
+from bigchaindb.web import server, async_server, finality, websocket_server
 
 
 logger = logging.getLogger(__name__)
@@ -63,9 +63,17 @@ def start():
     election.start(events_queue=exchange.get_publisher_queue())
 
     # start the web api
-    app_server = server.create_server(settings=bigchaindb.config['server'],
-                                      log_config=bigchaindb.config['log'])
-    p_webapi = mp.Process(name='webapi', target=app_server.run)
+    if bigchaindb.config['server'].get('engine') == 'aiohttp':
+        # The requests waiting for transactions to be decided are woken by
+        # the election events, which reach a single process: only the
+        # aiohttp engine serves all the requests from one process.
+        p_webapi = mp.Process(name='webapi', target=async_server.start,
+                              args=(bigchaindb.config['server'],
+                                    exchange.get_subscriber_queue(finality.EVENT_TYPES)))
+    else:
+        app_server = server.create_server(settings=bigchaindb.config['server'],
+                                          log_config=bigchaindb.config['log'])
+        p_webapi = mp.Process(name='webapi', target=app_server.run)
     p_webapi.start()
 
     logger.info('WebSocket server started')
@@ -111,6 +111,32 @@ def condition_details_has_owner(condition_details, owner):
     return False
 
 
+def condition_details_public_keys(condition_details):
+    """Return the public keys of the Ed25519 fulfillments in the condition
+    details, i.e. the owners :func:`condition_details_has_owner` checks.
+
+    Args:
+        condition_details (dict): dict with condition details
+
+    Returns:
+        list: the base58 public keys, in order and without duplicates.
+    """
+    if 'subconditions' in condition_details:
+        return condition_details_public_keys(condition_details['subconditions'])
+
+    if isinstance(condition_details, list):
+        public_keys = []
+        for subcondition in condition_details:
+            for public_key in condition_details_public_keys(subcondition):
+                if public_key not in public_keys:
+                    public_keys.append(public_key)
+        return public_keys
+
+    if 'public_key' in condition_details:
+        return [condition_details['public_key']]
+    return []
+
+
 def is_genesis_block(block):
     """Check if the block is the genesis block.
 
@@ -1,4 +1,6 @@
 import collections
+import functools
+import threading
 
 from bigchaindb.common.schema import SchemaValidationError, validate_vote_schema
 from bigchaindb.exceptions import CriticalDuplicateVote
@@ -10,6 +12,11 @@ VALID = 'valid'
 INVALID = 'invalid'
 UNDECIDED = 'undecided'
 
+# Number of decided block elections kept in memory by each process.
+DECIDED_ELECTIONS_CACHE_SIZE = 10000
+# Number of verified vote signatures kept in memory by each process.
+VERIFIED_VOTES_CACHE_SIZE = 100000
+
 
 class Voting:
     """Everything to do with verifying and counting votes for block election.
@@ -128,9 +135,8 @@ class Voting:
         if not (type(signature) == str and type(pk_base58) == str):
             raise ValueError('Malformed vote: %s' % vote)
 
-        public_key = PublicKey(pk_base58)
-        body = serialize(vote['vote']).encode()
-        return public_key.verify(body, signature)
+        body = serialize(vote['vote'])
+        return _verify_signature(pk_base58, body, signature)
 
     @classmethod
     def verify_vote_schema(cls, vote):
@@ -141,3 +147,63 @@ class Voting:
             return True
         except SchemaValidationError as e:
             return False
+
+
+@functools.lru_cache(maxsize=VERIFIED_VOTES_CACHE_SIZE)
+def _verify_signature(pk_base58, body, signature):
+    """Verify the signature of a serialized vote body.
+
+    The results are memoized: the votes on a block are counted every time
+    its status is requested, while the signature of a given vote never
+    needs to be verified more than once. The cache is keyed by the
+    signature along with the public key and the body it has to verify.
+    """
+    return PublicKey(pk_base58).verify(body.encode(), signature)
+
+
+class DecidedElections:
+    """A bounded cache of the statuses of the decided blocks, keyed by
+    block id.
+
+    Once a block is decided (VALID or INVALID) its status is final, so the
+    votes on it need not be fetched and counted again. The least recently
+    used statuses are evicted first. A status is only returned for the
+    keyring it was decided with.
+
+    Args:
+        size (int): the maximum number of statuses kept.
+    """
+
+    def __init__(self, size=DECIDED_ELECTIONS_CACHE_SIZE):
+        self.size = size
+        self._statuses = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._statuses)
+
+    def get(self, block_id, keyring):
+        """Return the status of the block, or ``None`` if it is unknown."""
+        with self._lock:
+            try:
+                status, decided_keyring = self._statuses[block_id]
+            except KeyError:
+                return None
+            if decided_keyring != keyring:
+                return None
+            self._statuses.move_to_end(block_id)
+            return status
+
+    def add(self, block_id, keyring, status):
+        """Record the status of the block if it is decided."""
+        if status == UNDECIDED:
+            return
+        with self._lock:
+            self._statuses[block_id] = status, frozenset(keyring)
+            self._statuses.move_to_end(block_id)
+            if len(self._statuses) > self.size:
+                self._statuses.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._statuses.clear()
@@ -0,0 +1,235 @@
+"""An asyncio HTTP server for the BigchainDB HTTP API.
+
+This is an alternative to running the Flask application with Gunicorn's
+synchronous workers, where every request holds a whole worker process while
+it waits on the database.
+
+The aiohttp server serves the very same Flask application (same routes, same
+views, same responses), calling it as a WSGI application:
+
+- the requests that only read (``GET``, ``HEAD``, ``OPTIONS``) are handled in
+  a pool of threads, so that one process can wait on many database queries
+  at once;
+- the requests that post transactions, which are dominated by the
+  (CPU-bound) decoding and validation of the transactions, are handled in a
+  pool of processes.
+
+The requests waiting for a transaction to be decided
+(``GET /api/v1/statuses?transaction_id=...&wait=...``) are woken by the
+blocks decided by the election pipeline, which all the threads share.
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import aiohttp
+from aiohttp import web
+from multidict import CIMultiDict
+
+from bigchaindb.web import server
+from bigchaindb.web.finality import FinalityNotifier
+
+
+logger = logging.getLogger(__name__)
+
+# The number of threads handling the read requests, if ``server.threads``
+# is not set. They mostly wait on the database.
+DEFAULT_THREADS = 32
+
+READ_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+# The Flask application of a process of the process pool.
+_worker_app = None
+
+
+def _wsgi_environ(method, path, query_string, headers, body, scheme,
+                  server_name, server_port, remote_addr):
+    environ = {
+        'REQUEST_METHOD': method,
+        'SCRIPT_NAME': '',
+        # WSGI strings are bytes decoded as latin-1
+        'PATH_INFO': path.encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': query_string,
+        'SERVER_NAME': server_name,
+        'SERVER_PORT': str(server_port),
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'REMOTE_ADDR': remote_addr or '',
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scheme,
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for name, value in headers:
+        key = name.upper().replace('-', '_')
+        if key not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            key = 'HTTP_' + key
+        if key in environ:
+            value = environ[key] + ',' + value
+        environ[key] = value
+    return environ
+
+
+def call_wsgi_app(app, request_data):
+    """Call the WSGI application ``app`` with a request.
+
+    Args:
+        app: a WSGI application.
+        request_data (tuple): the arguments of :func:`_wsgi_environ`.
+
+    Return:
+        A ``(status, headers, body)`` tuple, where ``status`` is the WSGI
+        status line, e.g. ``'200 OK'``.
+    """
+
+    response = []
+
+    def start_response(status, headers, exc_info=None):
+        response[:] = [status, headers]
+
+    app_iter = app(_wsgi_environ(*request_data), start_response)
+    try:
+        body = b''.join(app_iter)
+    finally:
+        if hasattr(app_iter, 'close'):
+            app_iter.close()
+    status, headers = response
+    return status, headers, body
+
+
+def _call_worker_app(request_data):
+    """Handle a request in a process of the process pool."""
+
+    global _worker_app
+    if _worker_app is None:
+        _worker_app = server.create_app(threads=1)
+    return call_wsgi_app(_worker_app, request_data)
+
+
+@asyncio.coroutine
+def _request_data(request):
+    body = yield from request.read()
+    host, _, port = (request.host or '').partition(':')
+    peername = request.transport.get_extra_info('peername') if request.transport else None
+    return (request.method,
+            request.path,
+            request.query_string,
+            list(request.headers.items()),
+            body,
+            request.scheme,
+            host or 'localhost',
+            port or ('443' if request.scheme == 'https' else '80'),
+            peername[0] if peername else None)
+
+
+@asyncio.coroutine
+def wsgi_handler(request):
+    """Handle a request of the HTTP API, in the thread pool if it only
+    reads, in the process pool otherwise."""
+
+    app = request.app
+    request_data = yield from _request_data(request)
+
+    if request.method in READ_METHODS:
+        result = app.loop.run_in_executor(app['thread_executor'],
+                                          call_wsgi_app,
+                                          app['flask_app'],
+                                          request_data)
+    else:
+        result = app.loop.run_in_executor(app['process_executor'],
+                                          _call_worker_app,
+                                          request_data)
+    status, headers, body = yield from result
+
+    code, _, reason = status.partition(' ')
+    # aiohttp computes the length of the body on its own
+    headers = CIMultiDict((name, value) for name, value in headers
+                          if name.lower() != 'content-length')
+    return web.Response(status=int(code), reason=reason or None,
+                        headers=headers, body=body)
+
+
+def init_app(*, threads=DEFAULT_THREADS, processes=None, read_preference=None,
+             max_staleness=None, cache_size=1024, events_queue=None,
+             loop=None):
+    """Init the application server.
+
+    Args:
+        threads (int): the number of threads handling the read requests.
+        processes (int): the number of processes handling the requests that
+            post transactions (default: the number of CPUs).
+        read_preference (str): the read preference of the read requests, see
+            :func:`bigchaindb.web.server.create_app`.
+        max_staleness (int): the maximum replication lag, in seconds, of the
+            secondaries that the read requests read from.
+        cache_size (int): the number of responses for immutable resources to
+            cache, in a cache shared by the threads.
+        events_queue (multiprocessing.Queue): the queue of the decided
+            blocks, subscribed to :data:`bigchaindb.web.finality.EVENT_TYPES`.
+            Without it, the requests do not wait for transactions to be
+            decided.
+
+    Return:
+        An aiohttp application.
+    """
+
+    app = web.Application(loop=loop)
+    notifier = None
+    if events_queue:
+        # Keep half of the threads for the requests that do not wait.
+        notifier = FinalityNotifier(max_waiters=max(threads // 2, 1))
+        notifier.start(events_queue)
+    # One Bigchain instance per thread, so that no thread waits on the pool.
+    app['flask_app'] = server.create_app(threads=threads,
+                                         read_preference=read_preference,
+                                         max_staleness=max_staleness,
+                                         cache_size=cache_size,
+                                         finality_notifier=notifier)
+    app['thread_executor'] = ThreadPoolExecutor(max_workers=threads)
+    app['process_executor'] = ProcessPoolExecutor(
+        max_workers=processes or multiprocessing.cpu_count())
+    app.router.add_route('*', '/{path:.*}', wsgi_handler)
+    app.on_shutdown.append(_shutdown_executors)
+    return app
+
+
+@asyncio.coroutine
+def _shutdown_executors(app):
+    app['thread_executor'].shutdown(wait=False)
+    app['process_executor'].shutdown(wait=False)
+
+
+def start(settings, events_queue=None, loop=None):
+    """Create and start the HTTP API server.
+
+    Args:
+        settings (dict): the ``server`` settings. ``bind`` is the
+            ``host:port`` to listen on, ``threads`` the number of threads
+            handling the read requests and ``workers`` the number of
+            processes handling the requests that post transactions.
+        events_queue (multiprocessing.Queue): the queue of the decided
+            blocks.
+    """
+
+    if not loop:
+        loop = asyncio.get_event_loop()
+
+    host, _, port = settings['bind'].rpartition(':')
+    # the values set from the environment are not coerced, as the defaults
+    # are `None`
+    threads = int(settings.get('threads') or DEFAULT_THREADS)
+    processes = int(settings['workers']) if settings.get('workers') else None
+    app = init_app(threads=threads,
+                   processes=processes,
+                   read_preference=settings.get('read_preference'),
+                   max_staleness=settings.get('max_staleness'),
+                   cache_size=settings.get('cache_size', 1024),
+                   events_queue=events_queue,
+                   loop=loop)
+    aiohttp.web.run_app(app, host=host, port=int(port))
@@ -0,0 +1,56 @@
+"""In-memory cache of the responses of the HTTP API for immutable resources.
+
+Once decided, a block, or a transaction of a valid block, never changes: the
+responses for them can be cached forever, by the clients (with ``ETag`` and
+``Cache-Control: immutable``) and by the server (with :class:`ResponseCache`).
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """A thread-safe LRU cache of response bodies.
+
+    The cache belongs to a process: each worker process of the HTTP server
+    has its own.
+    """
+
+    def __init__(self, maxsize=1024):
+        """Create a new cache.
+
+        Args:
+            maxsize (int): the maximum number of bodies to keep. ``0``
+                disables the cache.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._bodies = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the body cached for ``key``, or ``None``."""
+        with self._lock:
+            try:
+                body = self._bodies[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._bodies.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key, body):
+        """Cache the body for ``key``, evicting the least recently used
+        body if the cache is full."""
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._bodies[key] = body
+            self._bodies.move_to_end(key)
+            if len(self._bodies) > self.maxsize:
+                self._bodies.popitem(last=False)
+
+    def __len__(self):
+        return len(self._bodies)
@@ -0,0 +1,148 @@
+"""Wake the requests waiting for a transaction to be decided.
+
+The election pipeline publishes an event for every block it decides (see
+:mod:`bigchaindb.events`). A :class:`FinalityNotifier` consumes those events
+in a thread and wakes the requests to
+``GET /api/v1/statuses?transaction_id=...&wait=...`` that wait on one of the
+transactions of the block, so that they do not poll the database.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+from bigchaindb.events import EventTypes, POISON_PILL
+
+
+logger = logging.getLogger(__name__)
+
+# The events a notifier subscribes to.
+EVENT_TYPES = EventTypes.BLOCK_VALID | EventTypes.BLOCK_INVALID
+
+
+class Waiter:
+    """A request waiting for a transaction to be decided."""
+
+    def __init__(self):
+        self._woken = threading.Event()
+        self.valid = False
+
+    def wake(self, valid):
+        """Wake the request.
+
+        Args:
+            valid (bool): whether the block including the transaction was
+                voted valid.
+        """
+
+        self.valid = self.valid or valid
+        self._woken.set()
+
+    def wait(self, timeout):
+        """Wait until a block including the transaction is decided.
+
+        Args:
+            timeout (float): the maximum number of seconds to wait.
+
+        Return:
+            ``True`` if a block was decided, ``False`` if the timeout expired.
+        """
+
+        woken = self._woken.wait(timeout)
+        self._woken.clear()
+        return woken
+
+
+class FinalityNotifier:
+    """Dispatch the decided blocks to the requests waiting on their
+    transactions."""
+
+    def __init__(self, max_waiters=None):
+        """Create a new notifier.
+
+        Args:
+            max_waiters (int): the maximum number of requests waiting at
+                once (default: no limit). Each one holds a thread.
+        """
+
+        self.max_waiters = max_waiters
+        self._waiters = defaultdict(set)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def waiting(self, transaction_id):
+        """Register a request waiting for a transaction to be decided.
+
+        The request must read the status of the transaction once registered,
+        so that no block decided between the read and the wait is missed.
+
+        Args:
+            transaction_id (str): the id of the transaction.
+
+        Yield:
+            A :class:`Waiter`, or ``None`` if ``max_waiters`` requests are
+            already waiting.
+        """
+
+        waiter = Waiter()
+        with self._lock:
+            if self.max_waiters is not None and self._count >= self.max_waiters:
+                waiter = None
+            else:
+                self._waiters[transaction_id].add(waiter)
+                self._count += 1
+        try:
+            yield waiter
+        finally:
+            if waiter:
+                with self._lock:
+                    waiters = self._waiters[transaction_id]
+                    waiters.discard(waiter)
+                    if not waiters:
+                        del self._waiters[transaction_id]
+                    self._count -= 1
+
+    def notify(self, event):
+        """Wake the requests waiting on the transactions of a decided block.
+
+        Args:
+            event (:class:`~bigchaindb.events.Event`): a ``BLOCK_VALID`` or
+                ``BLOCK_INVALID`` event, holding the block.
+        """
+
+        if not event.data:
+            return
+        valid = event.type == EventTypes.BLOCK_VALID
+        with self._lock:
+            for tx in event.data['block']['transactions']:
+                for waiter in self._waiters.get(tx['id'], ()):
+                    waiter.wake(valid)
+
+    def listen(self, events_queue):
+        """Consume the events of a queue until it gets a poison pill.
+
+        Args:
+            events_queue (multiprocessing.Queue): a queue of the exchange,
+                subscribed to :data:`EVENT_TYPES`.
+        """
+
+        while True:
+            event = events_queue.get()
+            if event == POISON_PILL:
+                return
+            try:
+                self.notify(event)
+            except Exception:
+                logger.exception('Cannot dispatch the event %s', event)
+
+    def start(self, events_queue):
+        """Consume the events of a queue in a daemon thread."""
+
+        thread = threading.Thread(name='finality_notifier',
+                                  target=self.listen,
+                                  args=(events_queue,),
+                                  daemon=True)
+        thread.start()
+        return thread
@@ -4,6 +4,7 @@ The application is implemented in Flask and runs using Gunicorn.
 """
 
 import copy
+import functools
 import multiprocessing
 
 from flask import Flask
@@ -11,7 +12,9 @@ from flask_cors import CORS
 import gunicorn.app.base
 
 from bigchaindb import utils
+from bigchaindb import backend
 from bigchaindb import Bigchain
+from bigchaindb.web.cache import ResponseCache
 from bigchaindb.web.routes import add_routes
 from bigchaindb.web.strip_content_type_middleware import StripContentTypeMiddleware
 
@@ -54,13 +57,32 @@ class StandaloneApplication(gunicorn.app.base.BaseApplication):
         return self.application
 
 
-def create_app(*, debug=False, threads=1):
+def _read_bigchain(read_preference, max_staleness):
+    connection = backend.connect(read_preference=read_preference,
+                                 max_staleness=max_staleness)
+    return Bigchain(connection=connection)
+
+
+def create_app(*, debug=False, threads=1, read_preference=None,
+               max_staleness=None, cache_size=1024, finality_notifier=None):
     """Return an instance of the Flask application.
 
     Args:
         debug (bool): a flag to activate the debug mode for the app
             (default: False).
         threads (int): number of threads to use
+        read_preference (str): the read preference of the queries of the
+            read-only endpoints (default: ``primary``). Writes, the
+            validation of posted transactions, and the statuses, always use
+            the primary.
+        max_staleness (int): the maximum replication lag, in seconds, of
+            the secondaries that the read-only endpoints read from.
+        cache_size (int): the number of responses for immutable resources
+            (decided blocks and valid transactions) to cache (default: 1024).
+        finality_notifier (:class:`~bigchaindb.web.finality.FinalityNotifier`):
+            the notifier waking the requests that wait for a transaction to
+            be decided. Without it, the ``wait`` parameter of the statuses
+            endpoint is ignored.
     Return:
         an instance of the Flask application.
     """
@@ -73,6 +95,15 @@ def create_app(*, debug=False, threads=1):
     app.debug = debug
 
     app.config['bigchain_pool'] = utils.pool(Bigchain, size=threads)
+    if read_preference in (None, 'primary'):
+        app.config['bigchain_read_pool'] = app.config['bigchain_pool']
+    else:
+        app.config['bigchain_read_pool'] = utils.pool(
+            functools.partial(_read_bigchain, read_preference, max_staleness),
+            size=threads)
+
+    app.config['response_cache'] = ResponseCache(cache_size)
+    app.config['finality_notifier'] = finality_notifier
 
     add_routes(app)
 
@@ -100,10 +131,14 @@ def create_server(settings, log_config=None):
         # is largely CPU bound and parallisation across Python threads makes it
         # slower.
         settings['threads'] = 1
+    settings['threads'] = int(settings['threads'])
 
     settings['logger_class'] = 'bigchaindb.log.loggers.HttpServerLogger'
     settings['custom_log_config'] = log_config
     app = create_app(debug=settings.get('debug', False),
-                     threads=settings['threads'])
+                     threads=settings['threads'],
+                     read_preference=settings.get('read_preference'),
+                     max_staleness=settings.get('max_staleness'),
+                     cache_size=settings.get('cache_size', 1024))
     standalone = StandaloneApplication(app, options=settings)
     return standalone
@@ -35,7 +35,7 @@ class AssetListApi(Resource):
             # if the limit is not specified do not pass None to `text_search`
             del args['limit']
 
-        pool = current_app.config['bigchain_pool']
+        pool = current_app.config['bigchain_read_pool']
 
         with pool() as bigchain:
             assets = bigchain.text_search(**args)
@@ -1,8 +1,9 @@
 """Common classes and methods for API handlers
 """
+import json
 import logging
 
-from flask import jsonify, request
+from flask import current_app, jsonify, request
 
 from bigchaindb import config
 
@@ -25,6 +26,53 @@ def make_error(status_code, message=None):
     return response
 
 
+# a year is the maximum age that caches honor
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def _immutable_response(resource_id, body):
+    response = current_app.response_class(body, mimetype='application/json')
+    # the ids are hashes of the resources
+    response.set_etag(resource_id)
+    response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response.make_conditional(request)
+
+
+def get_immutable_response(kind, resource_id):
+    """Return the response for an immutable resource that the client, or
+    the response cache, already has.
+
+    Args:
+        kind (str): the kind of the resource, e.g. ``'block'``.
+        resource_id (str): the id of the resource, which is its ``ETag``.
+
+    Returns:
+        The cached response, or ``None`` if there is none. The cached
+        response is ``304 Not Modified`` if the client sent the ``ETag`` of
+        the resource in ``If-None-Match``.
+    """
+    # On a miss, the ETag alone does not prove that the resource exists and
+    # is decided: the view reads it, and `make_immutable_response` answers
+    # `304 Not Modified` then.
+    body = current_app.config['response_cache'].get((kind, resource_id))
+    if body is not None:
+        return _immutable_response(resource_id, body)
+
+
+def make_immutable_response(kind, resource_id, data):
+    """Cache and return the response for an immutable resource, i.e. a
+    decided block or a transaction of a valid block.
+
+    Args:
+        kind (str): the kind of the resource, e.g. ``'block'``.
+        resource_id (str): the id of the resource, which is its ``ETag``.
+        data (dict): the resource.
+    """
+    body = json.dumps(data).encode()
+    current_app.config['response_cache'].put((kind, resource_id), body)
+    return _immutable_response(resource_id, body)
+
+
 def base_ws_uri():
     """Base websocket URL that is advertised to external clients.
 
@@ -6,7 +6,8 @@ from flask import current_app
 from flask_restful import Resource, reqparse
 
 from bigchaindb import Bigchain
-from bigchaindb.web.views.base import make_error
+from bigchaindb.web.views.base import (get_immutable_response, make_error,
+                                       make_immutable_response)
 
 
 class BlockApi(Resource):
@@ -20,14 +21,22 @@ class BlockApi(Resource):
             A JSON string containing the data about the block.
         """
 
-        pool = current_app.config['bigchain_pool']
+        response = get_immutable_response('block', block_id)
+        if response:
+            return response
+
+        pool = current_app.config['bigchain_read_pool']
 
         with pool() as bigchain:
-            block = bigchain.get_block(block_id=block_id)
+            block, status = bigchain.get_block(block_id=block_id,
+                                               include_status=True)
 
         if not block:
             return make_error(404)
 
+        if status != Bigchain.BLOCK_UNDECIDED:
+            return make_immutable_response('block', block_id, block)
+
         return block
 
 
@@ -49,7 +58,7 @@ class BlockListApi(Resource):
         tx_id = args['transaction_id']
         status = args['status']
 
-        pool = current_app.config['bigchain_pool']
+        pool = current_app.config['bigchain_read_pool']
 
         with pool() as bigchain:
             block_statuses = bigchain.get_blocks_status_containing_tx(tx_id)
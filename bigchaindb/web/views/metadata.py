@@ -34,7 +34,7 @@ class MetadataApi(Resource):
         if not args['limit']:
             del args['limit']
 
-        pool = current_app.config['bigchain_pool']
+        pool = current_app.config['bigchain_read_pool']
 
         with pool() as bigchain:
             args['table'] = 'metadata'
@@ -1,13 +1,17 @@
 from flask import current_app
 from flask_restful import reqparse, Resource
 
+from bigchaindb import migrations
 from bigchaindb.web.views import parameters
 
 
 class OutputListApi(Resource):
     def get(self):
-        """API endpoint to retrieve a list of links to transaction
-        outputs.
+        """API endpoint to retrieve a list of links to the outputs of the
+        transactions in VALID blocks.
+
+        Until the outputs of the existing blocks are recorded by the
+        ``store_outputs`` migration, the outputs are looked up in the blocks.
 
             Returns:
                 A :obj:`list` of :cls:`str` of links to outputs.
@@ -18,9 +22,12 @@ class OutputListApi(Resource):
         parser.add_argument('spent', type=parameters.valid_bool)
         args = parser.parse_args(strict=True)
 
-        pool = current_app.config['bigchain_pool']
+        pool = current_app.config['bigchain_read_pool']
         with pool() as bigchain:
-            outputs = bigchain.get_outputs_filtered(args['public_key'],
-                                                    args['spent'])
+            if migrations.is_applied(bigchain.connection, 'store_outputs'):
+                get_outputs = bigchain.get_valid_outputs
+            else:
+                get_outputs = bigchain.get_outputs_filtered
+            outputs = get_outputs(args['public_key'], args['spent'])
             return [{'transaction_id': output.txid, 'output_index': output.output}
                     for output in outputs]
@@ -30,3 +30,17 @@ def valid_operation(op):
     if op == 'TRANSFER':
         return 'TRANSFER'
     raise ValueError('Operation must be "CREATE" or "TRANSFER')
+
+
+def valid_limit(limit):
+    limit = int(limit)
+    if limit > 0:
+        return limit
+    raise ValueError('Limit must be a positive integer')
+
+
+def valid_wait(wait):
+    wait = float(wait)
+    if wait >= 0:
+        return wait
+    raise ValueError('Wait must be a non-negative number of seconds')
@@ -2,12 +2,60 @@
 
 For more information please refer to the documentation: http://bigchaindb.com/http-api
 """
+import time
+
 from flask import current_app
 from flask_restful import Resource, reqparse
 
+from bigchaindb import Bigchain
+from bigchaindb.web.views import parameters
 from bigchaindb.web.views.base import make_error
 
 
+# The maximum number of seconds a request waits for a transaction to be
+# decided.
+MAX_WAIT = 60
+
+
+def wait_for_transaction(pool, notifier, tx_id, wait):
+    """Get the status of a transaction once it is decided.
+
+    Args:
+        pool: the pool of :class:`~bigchaindb.Bigchain` instances reading
+            from the primary: a transaction not found there was never
+            posted, while a secondary may not have replicated it yet.
+        notifier (:class:`~bigchaindb.web.finality.FinalityNotifier`): the
+            notifier of the decided blocks.
+        tx_id (str): the id of the transaction.
+        wait (float): the maximum number of seconds to wait.
+
+    Return:
+        The status of the transaction, ``None`` if it was not found.
+    """
+
+    deadline = time.monotonic() + wait
+
+    with notifier.waiting(tx_id) as waiter:
+        with pool() as bigchain:
+            status = bigchain.get_status(tx_id)
+
+        # Do not wait for transactions that were never posted (``None`` is
+        # read from the primary), nor when too many requests are waiting
+        # already.
+        if waiter is None or status in (None, Bigchain.TX_VALID):
+            return status
+
+        while waiter.wait(max(deadline - time.monotonic(), 0)):
+            if waiter.valid:
+                return Bigchain.TX_VALID
+            # A block including the transaction was voted invalid: the
+            # transaction is requeued in the backlog, unless it is invalid.
+            with pool() as bigchain:
+                status = bigchain.get_status(tx_id)
+
+    return status
+
+
 class StatusApi(Resource):
     def get(self):
         """API endpoint to get details about the status of a transaction or a block.
@@ -19,23 +67,31 @@ class StatusApi(Resource):
         parser = reqparse.RequestParser()
         parser.add_argument('transaction_id', type=str)
         parser.add_argument('block_id', type=str)
+        parser.add_argument('wait', type=parameters.valid_wait)
 
         args = parser.parse_args(strict=True)
         tx_id = args['transaction_id']
         block_id = args['block_id']
+        wait = min(args['wait'] or 0, MAX_WAIT)
 
         # logical xor - exactly one query argument required
         if bool(tx_id) == bool(block_id):
             return make_error(400, 'Provide exactly one query parameter. Choices are: block_id, transaction_id')
 
+        # The statuses are read from the primary, so that a transaction that
+        # was just posted is found.
         pool = current_app.config['bigchain_pool']
+        notifier = current_app.config.get('finality_notifier')
         status = None
 
-        with pool() as bigchain:
-            if tx_id:
-                status = bigchain.get_status(tx_id)
-            elif block_id:
-                _, status = bigchain.get_block(block_id=block_id, include_status=True)
+        if tx_id and wait and notifier:
+            status = wait_for_transaction(pool, notifier, tx_id, wait)
+        else:
+            with pool() as bigchain:
+                if tx_id:
+                    status = bigchain.get_status(tx_id)
+                elif block_id:
+                    _, status = bigchain.get_block(block_id=block_id, include_status=True)
 
         if not status:
             return make_error(404)
@@ -2,17 +2,64 @@
 
 For more information please refer to the documentation: http://bigchaindb.com/http-api
 """
-import logging
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from flask import current_app, request, jsonify
 from flask_restful import Resource, reqparse
 
 from bigchaindb.common.exceptions import SchemaValidationError, ValidationError
 from bigchaindb.models import Transaction
-from bigchaindb.web.views.base import make_error
+from bigchaindb.web.views.base import (get_immutable_response, make_error,
+                                       make_immutable_response)
 from bigchaindb.web.views import parameters
 
-logger = logging.getLogger(__name__)
+# The maximum number of transactions of a batch.
+BATCH_MAX_SIZE = 1000
+
+# The number of threads validating the transactions of a batch; the
+# validation of a transaction mostly waits on the database.
+BATCH_VALIDATION_THREADS = 8
+
+
+def decode_transaction(tx):
+    """Decode a transaction posted to the API.
+
+    Args:
+        tx (dict): the transaction.
+
+    Returns:
+        A ``(transaction, error)`` tuple, with either a :class:`Transaction`
+        or the message explaining why the transaction is invalid.
+    """
+    try:
+        return Transaction.from_dict(tx), None
+    except SchemaValidationError as e:
+        return None, 'Invalid transaction schema: {}'.format(e.__cause__.message)
+    except ValidationError as e:
+        return None, 'Invalid transaction ({}): {}'.format(type(e).__name__, e)
+
+
+def validate_transaction(bigchain, tx_obj):
+    """Return the message explaining why the transaction ``tx_obj`` is
+    invalid, or ``None`` if it is valid."""
+    try:
+        bigchain.validate_transaction(tx_obj)
+    except ValidationError as e:
+        return 'Invalid transaction ({}): {}'.format(type(e).__name__, e)
+
+
+def validate_pooled_transaction(pool, tx_obj):
+    """Like :func:`validate_transaction`, with an instance of the pool:
+    the connection of an instance must not be used by several threads at
+    once."""
+    with pool() as bigchain:
+        return validate_transaction(bigchain, tx_obj)
+
+
+def status_monitor(tx_id):
+    return '../statuses?transaction_id={}'.format(tx_id)
 
 
 class TransactionApi(Resource):
@@ -25,7 +72,11 @@ class TransactionApi(Resource):
         Return:
             A JSON string containing the data about the transaction.
         """
-        pool = current_app.config['bigchain_pool']
+        response = get_immutable_response('transaction', tx_id)
+        if response:
+            return response
+
+        pool = current_app.config['bigchain_read_pool']
 
         with pool() as bigchain:
             tx, status = bigchain.get_transaction(tx_id, include_status=True)
@@ -33,21 +84,39 @@ class TransactionApi(Resource):
         if not tx or status is not bigchain.TX_VALID:
             return make_error(404)
 
-        return tx.to_dict()
+        # a transaction of a valid block stays so
+        return make_immutable_response('transaction', tx_id, tx.to_dict())
 
 
 class TransactionListApi(Resource):
     def get(self):
+        """API endpoint to get the transactions of an asset.
+
+        Args:
+            asset_id (str): the id of the asset.
+            operation (str, optional): ``CREATE`` or ``TRANSFER``.
+            limit (int, optional): the maximum number of transactions.
+            after (str, optional): the id of the last transaction of the
+                previous page.
+
+        Return:
+            A JSON array of the transactions, in the order of their ids.
+        """
         parser = reqparse.RequestParser()
         parser.add_argument('operation', type=parameters.valid_operation)
         parser.add_argument('asset_id', type=parameters.valid_txid,
                             required=True)
+        parser.add_argument('limit', type=parameters.valid_limit)
+        parser.add_argument('after', type=parameters.valid_txid)
         args = parser.parse_args()
 
-        with current_app.config['bigchain_pool']() as bigchain:
-            txs = bigchain.get_transactions_filtered(**args)
+        pool = current_app.config['bigchain_read_pool']
 
-        return [tx.to_dict() for tx in txs]
+        # The whole page is read before the response starts, so that the
+        # errors of the backend get the status code they deserve.
+        with pool() as bigchain:
+            return [tx.to_dict()
+                    for tx in bigchain.get_transactions_filtered(**args)]
 
     def post(self):
         """API endpoint to push transactions to the Federation.
@@ -61,31 +130,16 @@ class TransactionListApi(Resource):
         # `content-type` header is not set to `application/json`
         tx = request.get_json(force=True)
 
-        try:
-            tx_obj = Transaction.from_dict(tx)
-        except SchemaValidationError as e:
-            return make_error(
-                400,
-                message='Invalid transaction schema: {}'.format(
-                    e.__cause__.message)
-            )
-        except ValidationError as e:
-            return make_error(
-                400,
-                'Invalid transaction ({}): {}'.format(type(e).__name__, e)
-            )
+        tx_obj, error = decode_transaction(tx)
+        if error:
+            return make_error(400, error)
 
         with pool() as bigchain:
             bigchain.statsd.incr('web.tx.post')
-            try:
-                bigchain.validate_transaction(tx_obj)
-            except ValidationError as e:
-                return make_error(
-                    400,
-                    'Invalid transaction ({}): {}'.format(type(e).__name__, e)
-                )
-            else:
-                bigchain.write_transaction(tx_obj)
+            error = validate_transaction(bigchain, tx_obj)
+            if error:
+                return make_error(400, error)
+            bigchain.write_transaction(tx_obj)
 
         response = jsonify(tx)
         response.status_code = 202
@@ -97,6 +151,116 @@ class TransactionListApi(Resource):
         # Flask is autocorrecting relative URIs. With the following command,
         # we're able to prevent this.
         response.autocorrect_location_header = False
-        status_monitor = '../statuses?transaction_id={}'.format(tx_obj.id)
-        response.headers['Location'] = status_monitor
+        response.headers['Location'] = status_monitor(tx_obj.id)
         return response
+
+
+class TransactionBatchApi(Resource):
+    def post(self):
+        """API endpoint to push a batch of transactions to the Federation.
+
+        The body of the request is either a JSON array of transactions, or
+        a stream of newline-delimited JSON transactions (NDJSON).
+
+        The transactions are validated independently of each other, and the
+        valid ones are written to the backlog at once.
+
+        Return:
+            A ``list`` with the outcome of each transaction of the batch, in
+            order: ``accepted`` along with the relative link to its status
+            monitor, or ``rejected`` along with the reason. The status code
+            is 400 when no transaction is accepted, with the same ``list``
+            rather than the error of a malformed batch.
+        """
+        pool = current_app.config['bigchain_pool']
+
+        try:
+            txs = parse_batch(request.get_data(as_text=True))
+        except ValueError as e:
+            return make_error(400, 'Invalid batch: {}'.format(e))
+        if not txs:
+            return make_error(400, 'Invalid batch: no transaction')
+        if len(txs) > BATCH_MAX_SIZE:
+            return make_error(
+                413, 'Invalid batch: more than {} transactions'.format(
+                    BATCH_MAX_SIZE))
+
+        results = []
+        candidates = []
+        for tx in txs:
+            result = {'id': None, 'status': 'rejected'}
+            results.append(result)
+            if isinstance(tx, ValueError):
+                result['message'] = 'Invalid JSON: {}'.format(tx)
+            elif not isinstance(tx, dict):
+                result['message'] = 'Invalid transaction: not a JSON object'
+            else:
+                result['id'] = tx.get('id')
+                tx_obj, result['message'] = decode_transaction(tx)
+                if tx_obj:
+                    candidates.append((result, tx_obj))
+
+        # Each thread takes an instance of the pool, and the request holds
+        # none meanwhile, so that the threads can get one.
+        with ThreadPoolExecutor(max_workers=BATCH_VALIDATION_THREADS) as executor:
+            errors = executor.map(partial(validate_pooled_transaction, pool),
+                                  [tx_obj for _, tx_obj in candidates])
+
+            accepted = {}
+            spent = set()
+            for (result, tx_obj), error in zip(candidates, errors):
+                fulfills = {input_.fulfills for input_ in tx_obj.inputs
+                            if input_.fulfills}
+                if not error and tx_obj.id not in accepted and spent & fulfills:
+                    error = ('Invalid transaction (DoubleSpend): an input is '
+                             'spent by a previous transaction of the batch')
+                if error:
+                    result['message'] = error
+                else:
+                    spent |= fulfills
+                    accepted[tx_obj.id] = tx_obj
+                    result.update(status='accepted',
+                                  location=status_monitor(tx_obj.id))
+                    del result['message']
+
+        with pool() as bigchain:
+            bigchain.statsd.incr('web.tx.post', len(txs))
+            if accepted:
+                bigchain.write_transactions(list(accepted.values()))
+
+        response = jsonify(results)
+        response.status_code = 202 if accepted else 400
+        # see `TransactionListApi.post`
+        response.autocorrect_location_header = False
+        return response
+
+
+def parse_batch(body):
+    """Parse the body of a batch of transactions.
+
+    Args:
+        body (str): a JSON array, or newline-delimited JSON documents.
+
+    Returns:
+        The list of the transactions of the batch, in which the lines of
+        NDJSON that are not valid JSON are replaced by the
+        :exc:`ValueError` raised when parsing them.
+
+    Raises:
+        ValueError: if the body is an invalid JSON array.
+    """
+    if body.lstrip().startswith('['):
+        txs = json.loads(body)
+        if not isinstance(txs, list):
+            raise ValueError('not an array')
+        return txs
+
+    txs = []
+    for line in body.splitlines():
+        if not line.strip():
+            continue
+        try:
+            txs.append(json.loads(line))
+        except ValueError as e:
+            txs.append(e)
+    return txs
@@ -20,7 +20,7 @@ class VotesApi(Resource):
 
         args = parser.parse_args(strict=True)
 
-        pool = current_app.config['bigchain_pool']
+        pool = current_app.config['bigchain_read_pool']
         with pool() as bigchain:
             votes = list(backend.query.get_votes_by_block_id(bigchain.connection, args['block_id']))
 
@@ -0,0 +1,59 @@
+"""Micro-benchmark of the decoding of transactions, ie
+``bigchaindb.models.Transaction.from_dict``, as done for every transaction
+received by the HTTP API and for every transaction of every block that is
+voted on.
+
+The single-pass decoding (one serialization of the body, shared by the
+hashing and by the schema validation) is compared with the previous
+multi-pass decoding.
+"""
+import sys
+import timeit
+
+from bigchaindb.common.crypto import generate_key_pair
+from bigchaindb.common.schema import (TX_SCHEMA_COMMON, TX_SCHEMA_CREATE,
+                                      TX_SCHEMA_TRANSFER, _validate_schema)
+from bigchaindb.common.transaction import Transaction as CommonTransaction
+from bigchaindb.common.utils import validate_txn_obj, validate_key
+from bigchaindb.backend.schema import validate_language_key
+from bigchaindb.models import Transaction
+
+
+def multi_pass_from_dict(tx_body):
+    CommonTransaction.validate_id(tx_body)
+    _validate_schema(TX_SCHEMA_COMMON, tx_body)
+    if tx_body['operation'] == 'TRANSFER':
+        _validate_schema(TX_SCHEMA_TRANSFER, tx_body)
+    else:
+        _validate_schema(TX_SCHEMA_CREATE, tx_body)
+    validate_txn_obj('asset', tx_body['asset'], 'data', validate_key)
+    validate_txn_obj('metadata', tx_body, 'metadata', validate_key)
+    validate_language_key(tx_body['asset'], 'data')
+    return CommonTransaction.from_dict(tx_body)
+
+
+def transactions():
+    priv, pub = generate_key_pair()
+    create = Transaction.create([pub], [([pub], 10)],
+                                asset={'name': 'benchmark',
+                                       'nested': {'language': 'en'}},
+                                metadata={'n': 1})
+    create.sign([priv])
+    transfer = Transaction.transfer(create.to_inputs(), [([pub], 10)],
+                                    asset_id=create.id)
+    transfer.sign([priv])
+    return {'CREATE': create.to_dict(), 'TRANSFER': transfer.to_dict()}
+
+
+def main(number=10000):
+    for operation, tx_body in transactions().items():
+        for name, decode in (('multi-pass', multi_pass_from_dict),
+                             ('single-pass', Transaction.from_dict)):
+            seconds = min(timeit.repeat(lambda: decode(tx_body),
+                                        number=number, repeat=3))
+            print('{:<8} {:<11} {:8.1f} us/tx'.format(
+                operation, name, seconds / number * 1e6))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -69,42 +69,72 @@ def test_changefeed_delete(mock_cursor_next, mock_changefeed_data):
 
 @pytest.mark.bdb
 @mock.patch('bigchaindb.backend.mongodb.changefeed._FEED_STOP', True)
-@mock.patch('pymongo.collection.Collection.find_one')
 @mock.patch('pymongo.cursor.Cursor.next')
-def test_changefeed_update(mock_cursor_next, mock_cursor_find_one,
-                           mock_changefeed_data):
+def test_changefeed_update(mock_cursor_next, mock_changefeed_data):
     from bigchaindb.backend import get_changefeed, connect
     from bigchaindb.backend.changefeed import ChangeFeed
 
     conn = connect()
     mock_cursor_next.side_effect = [mock.DEFAULT] + mock_changefeed_data
-    mock_cursor_find_one.return_value = mock_changefeed_data[2]['o']
+    conn.db.backlog.insert_one(
+        dict(mock_changefeed_data[2]['o'], _id='some-id'))
 
     outpipe = Pipe()
     changefeed = get_changefeed(conn, 'backlog', ChangeFeed.UPDATE)
     changefeed.outqueue = outpipe
     changefeed.run_forever()
 
-    assert outpipe.get()['msg'] == 'seems like we have an update here'
+    assert outpipe.get() == {'msg': 'seems like we have an update here'}
+    assert outpipe.qsize() == 0
+
+
+@pytest.mark.bdb
+@mock.patch('bigchaindb.backend.mongodb.changefeed._FEED_STOP', True)
+@mock.patch('bigchaindb.backend.mongodb.changefeed.statsd.StatsClient')
+@mock.patch('pymongo.cursor.Cursor.next')
+def test_changefeed_batches_updates(mock_cursor_next, mock_stats_client):
+    from bigchaindb.backend import get_changefeed, connect
+    from bigchaindb.backend.changefeed import ChangeFeed
+
+    conn = connect()
+    conn.db.backlog.insert_many([{'_id': 'a', 'id': 'a'},
+                                 {'_id': 'b', 'id': 'b'}])
+    updates = [{'op': 'u', 'o': {}, 'o2': {'_id': _id}, 'ts': ts}
+               for ts, _id in enumerate(['a', 'b', 'a', 'deleted'])]
+    inserted = {'op': 'i', 'o': {'id': 'c'}, 'ts': 10}
+    mock_cursor_next.side_effect = \
+        [mock.DEFAULT] + updates[:2] + [inserted] + updates[2:]
+
+    outpipe = Pipe()
+    changefeed = get_changefeed(conn, 'backlog',
+                                ChangeFeed.INSERT | ChangeFeed.UPDATE)
+    changefeed.outqueue = outpipe
+    changefeed.run_forever()
+
+    # the order of the records is kept, and the documents deleted since are
+    # skipped
+    assert [outpipe.get()['id'] for _ in range(4)] == ['a', 'b', 'c', 'a']
     assert outpipe.qsize() == 0
-    assert mock_cursor_find_one.called_once_with(
-        {'_id': mock_changefeed_data[2]['o']},
-        {'_id': False}
-    )
+    # one query per group of consecutive updates
+    incr = mock_stats_client.return_value.incr
+    assert incr.call_args_list.count(
+        mock.call('changefeed.backlog.records')) == 5
+    assert incr.call_args_list.count(
+        mock.call('changefeed.backlog.queries')) == 2
 
 
 @pytest.mark.bdb
 @mock.patch('bigchaindb.backend.mongodb.changefeed._FEED_STOP', True)
-@mock.patch('pymongo.collection.Collection.find_one')
 @mock.patch('pymongo.cursor.Cursor.next')
-def test_changefeed_multiple_operations(mock_cursor_next, mock_cursor_find_one,
+def test_changefeed_multiple_operations(mock_cursor_next,
                                         mock_changefeed_data):
     from bigchaindb.backend import get_changefeed, connect
     from bigchaindb.backend.changefeed import ChangeFeed
 
     conn = connect()
     mock_cursor_next.side_effect = [mock.DEFAULT] + mock_changefeed_data
-    mock_cursor_find_one.return_value = mock_changefeed_data[2]['o']
+    conn.db.backlog.insert_one(
+        dict(mock_changefeed_data[2]['o'], _id='some-id'))
 
     outpipe = Pipe()
     changefeed = get_changefeed(conn, 'backlog',
@@ -136,6 +166,81 @@ def test_changefeed_prefeed(mock_cursor_next, mock_changefeed_data):
     assert outpipe.qsize() == 4
 
 
+@pytest.mark.bdb
+@mock.patch('bigchaindb.backend.mongodb.changefeed._FEED_STOP', True)
+@mock.patch('pymongo.cursor.Cursor.next')
+def test_changefeed_checkpoint(mock_cursor_next):
+    from bson.timestamp import Timestamp
+    from bigchaindb.backend import get_changefeed, connect
+    from bigchaindb.backend.changefeed import ChangeFeed
+
+    conn = connect()
+    records = [{'op': 'i', 'o': {'id': i}, 'ts': Timestamp(100, i)}
+               for i in range(3)]
+    mock_cursor_next.side_effect = [mock.DEFAULT] + records
+
+    changefeed = get_changefeed(conn, 'backlog', ChangeFeed.INSERT,
+                                checkpoint='block.me')
+    changefeed.outqueue = Pipe()
+    changefeed.run_forever()
+
+    # the position after the last record is persisted
+    checkpoint = conn.db.changefeed_checkpoints.find_one({'id': 'block.me'})
+    assert checkpoint['ts'] == Timestamp(100, 2)
+
+    # and a restarted changefeed resumes from there
+    mock_cursor_next.side_effect = None
+    mock_cursor_next.return_value = {'ts': Timestamp(1, 0)}
+    changefeed = get_changefeed(conn, 'backlog', ChangeFeed.INSERT,
+                                checkpoint='block.me')
+    changefeed.outqueue = Pipe()
+    with mock.patch('bigchaindb.backend.mongodb.changefeed.run_changefeed',
+                    return_value=[]) as run_changefeed:
+        changefeed.run_forever()
+    run_changefeed.assert_called_once_with(conn, 'backlog',
+                                           Timestamp(100, 2),
+                                           yield_idle=True)
+
+
+@pytest.mark.bdb
+@mock.patch('bigchaindb.backend.mongodb.changefeed._FEED_STOP', True)
+@mock.patch('pymongo.cursor.Cursor.next')
+def test_changefeed_checkpoint_acks(mock_cursor_next):
+    from bson.timestamp import Timestamp
+    from bigchaindb.backend import get_changefeed, connect
+    from bigchaindb.backend.changefeed import ChangeFeed
+
+    conn = connect()
+    records = [{'op': 'i', 'o': {'id': i}, 'ts': Timestamp(100, i)}
+               for i in range(3)]
+    mock_cursor_next.side_effect = [mock.DEFAULT] + records
+
+    changefeed = get_changefeed(conn, 'votes', ChangeFeed.INSERT,
+                                prefeed=[{'id': 'prefeed'}],
+                                checkpoint='election.me', acks=True)
+    changefeed.outqueue = Pipe()
+    changefeed.run_forever()
+
+    # the records output are not acknowledged yet
+    checkpoints = conn.db.changefeed_checkpoints
+    assert checkpoints.find_one({'id': 'election.me'}) is None
+
+    # the prefeed does not move the checkpoint
+    changefeed.ack()
+    assert checkpoints.find_one({'id': 'election.me'}) is None
+
+    with mock.patch('bigchaindb.backend.mongodb.changefeed.'
+                    'CHECKPOINT_INTERVAL', 0):
+        changefeed.ack()
+    assert checkpoints.find_one({'id': 'election.me'})['ts'] == \
+        Timestamp(100, 0)
+
+    changefeed.ack()
+    changefeed.ack()
+    assert checkpoints.find_one({'id': 'election.me'})['ts'] == \
+        Timestamp(100, 2)
+
+
 @pytest.mark.bdb
 def test_connection_failure():
     from bigchaindb.backend.exceptions import ConnectionError
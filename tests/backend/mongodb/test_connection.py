@@ -9,6 +9,14 @@ from pymongo.database import Database
 pytestmark = pytest.mark.bdb
 
 
+@pytest.fixture(autouse=True)
+def clear_clients():
+    from bigchaindb.backend.mongodb.connection import clients
+    clients.clear()
+    yield
+    clients.clear()
+
+
 @pytest.fixture
 def mock_cmd_line_opts():
     return {'argv': ['mongod', '--dbpath=/data', '--replSet=bigchain-rs'],
@@ -111,6 +119,63 @@ def test_connection_with_credentials(mock_authenticate):
     assert mock_authenticate.call_count == 2
 
 
+@mock.patch('bigchaindb.backend.mongodb.connection.initialize_replica_set')
+@mock.patch('pymongo.MongoClient')
+def test_connections_share_the_client_of_the_process(mock_client,
+                                                     mock_init_repl_set):
+    from bigchaindb.backend import connect
+    from bigchaindb.backend.mongodb.connection import clients
+
+    stats = clients.pool_stats()
+    conn_a, conn_b = connect(), connect(max_pool_size=10)
+    conn_c = connect()
+
+    assert conn_a.conn is conn_c.conn
+    assert conn_a.conn is not conn_b.conn
+    assert mock_client.call_count == 2
+    assert mock_init_repl_set.call_count == 2
+    assert mock_client.call_args[1]['maxpoolsize'] == 10
+    assert clients.pool_stats()['clients'] == 2
+    assert clients.pool_stats()['created'] == stats['created'] + 2
+    assert clients.pool_stats()['reused'] == stats['reused'] + 1
+
+
+@mock.patch('bigchaindb.backend.mongodb.connection.initialize_replica_set')
+@mock.patch('pymongo.MongoClient')
+def test_connection_read_preference(mock_client, mock_init_repl_set):
+    from bigchaindb.backend import connect
+
+    connect().conn
+    assert 'readpreference' not in mock_client.call_args[1]
+
+    connect(read_preference='secondaryPreferred', max_staleness=120).conn
+    assert mock_client.call_args[1]['readpreference'] == 'secondaryPreferred'
+    assert mock_client.call_args[1]['maxstalenessseconds'] == 120
+
+
+@mock.patch('bigchaindb.backend.mongodb.connection.initialize_replica_set')
+@mock.patch('pymongo.MongoClient')
+def test_connection_reconnects_after_fork(mock_client, mock_init_repl_set):
+    import os
+    from bigchaindb.backend import connect
+    from bigchaindb.backend.mongodb.connection import clients
+
+    mock_client.side_effect = lambda *args, **kwargs: mock.Mock()
+    conn = connect()
+    parent_client = conn.conn
+    assert conn.conn is parent_client
+
+    with mock.patch('os.getpid', return_value=os.getpid() + 1):
+        child_client = conn.conn
+        assert child_client is not parent_client
+        assert conn.conn is child_client
+        assert clients.pool_stats()['clients'] == 1
+
+    # the client of the parent is left alone for the parent to use
+    assert not parent_client.close.called
+    assert mock_client.call_count == 2
+
+
 def test_check_replica_set_not_enabled(mongodb_connection):
     from bigchaindb.backend.mongodb.connection import _check_replica_set
     from bigchaindb.common.exceptions import ConfigurationError
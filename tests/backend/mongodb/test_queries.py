@@ -21,6 +21,21 @@ def test_write_transaction(signed_create_tx):
     assert tx_db == signed_create_tx.to_dict()
 
 
+def test_write_transactions(signed_create_tx, signed_transfer_tx):
+    from bigchaindb.backend import connect, query
+    conn = connect()
+
+    query.write_transaction(conn, signed_create_tx.to_dict())
+    # the transactions already in the backlog are skipped
+    query.write_transactions(conn, [signed_create_tx.to_dict(),
+                                    signed_transfer_tx.to_dict()])
+
+    assert conn.db.backlog.count() == 2
+    tx_db = conn.db.backlog.find_one({'id': signed_transfer_tx.id},
+                                     {'_id': False})
+    assert tx_db == signed_transfer_tx.to_dict()
+
+
 def test_update_transaction(signed_create_tx):
     from bigchaindb.backend import connect, query
     conn = connect()
@@ -77,6 +92,61 @@ def test_get_stale_transactions(signed_create_tx):
     assert stale_txs[0]['id'] == 'stale'
 
 
+def test_reassign_stale_transactions(signed_create_tx):
+    import time
+    from bigchaindb.backend import connect, query
+    conn = connect()
+
+    now = time.time()
+    txs = []
+    for txid, assignee, expiry in (('stale_a', 'a', now - 10),
+                                   ('stale_b', 'b', now - 10),
+                                   ('stale_c', 'c', now - 10),
+                                   ('leased_a', 'a', now + 60)):
+        tx = signed_create_tx.to_dict()
+        tx.update({'id': txid, 'assignee': assignee,
+                   'assignment_timestamp': expiry - 30,
+                   'assignment_expiry': expiry})
+        txs.append(tx)
+    conn.db.backlog.insert_many(txs)
+
+    reassigned = query.reassign_stale_transactions(
+        conn, {'a': 'b', 'b': 'a'}, 'z', 30)
+
+    assert reassigned == 3
+    backlog = {tx['id']: tx for tx in conn.db.backlog.find()}
+    assert {txid: tx['assignee'] for txid, tx in backlog.items()} == {
+        'stale_a': 'b', 'stale_b': 'a', 'stale_c': 'z', 'leased_a': 'a'}
+    for txid in ('stale_a', 'stale_b', 'stale_c'):
+        tx = backlog[txid]
+        assert tx['assignment_timestamp'] >= now
+        assert tx['assignment_expiry'] == tx['assignment_timestamp'] + 30
+
+
+def test_reassign_transactions_without_assignment_expiry(signed_create_tx):
+    import time
+    from bigchaindb.backend import connect, query
+    conn = connect()
+
+    # transactions assigned before the assignments had an expiry
+    now = time.time()
+    txs = []
+    for txid, assignee in (('old_a', 'a'), ('old_c', 'c')):
+        tx = signed_create_tx.to_dict()
+        tx.update({'id': txid, 'assignee': assignee,
+                   'assignment_timestamp': now})
+        txs.append(tx)
+    conn.db.backlog.insert_many(txs)
+
+    reassigned = query.reassign_stale_transactions(conn, {'a': 'b'}, 'z', 30)
+
+    assert reassigned == 2
+    backlog = {tx['id']: tx for tx in conn.db.backlog.find()}
+    assert backlog['old_a']['assignee'] == 'b'
+    assert backlog['old_c']['assignee'] == 'z'
+    assert all('assignment_expiry' in tx for tx in backlog.values())
+
+
 def test_get_transaction_from_block(user_pk):
     from bigchaindb.backend import connect, query
     from bigchaindb.models import Transaction, Block
@@ -110,6 +180,21 @@ def test_get_transaction_from_backlog(create_tx):
     assert tx_db == create_tx.to_dict()
 
 
+def test_get_transactions_from_backlog(create_tx, signed_create_tx):
+    from bigchaindb.backend import connect, query
+    conn = connect()
+
+    # insert transactions
+    conn.db.backlog.insert_one(create_tx.to_dict())
+    conn.db.backlog.insert_one(signed_create_tx.to_dict())
+
+    # query the backlog
+    txs_db = list(query.get_transactions_from_backlog(
+        conn, [create_tx.id, 'missing']))
+
+    assert txs_db == [create_tx.to_dict()]
+
+
 def test_get_block_status_from_transaction(create_tx):
     from bigchaindb.backend import connect, query
     from bigchaindb.models import Block
@@ -279,6 +364,192 @@ def test_write_block(signed_create_tx):
 
     assert block_db == block.to_dict()
 
+    # the transactions of the block are indexed
+    entries = list(conn.db.transactions.find({}, {'_id': False}))
+    assert entries == [{'transaction_id': signed_create_tx.id,
+                        'block_id': block.id,
+                        'status': 'undecided',
+                        'transaction': signed_create_tx.to_dict()}]
+
+
+def test_write_decoupled_block(signed_create_tx):
+    from bigchaindb.backend import connect, query
+    from bigchaindb.models import Block
+    conn = connect()
+
+    block = Block(transactions=[signed_create_tx])
+    assets, metadata, block_dict = block.decouple()
+
+    # writing the block a second time, e.g. when retrying, is a no-op
+    for _ in range(2):
+        query.write_decoupled_block(conn, deepcopy(block_dict),
+                                    deepcopy(assets), deepcopy(metadata))
+
+    assert list(conn.db.bigchain.find({}, {'_id': False})) == [block_dict]
+    assert list(conn.db.assets.find({}, {'_id': False})) == assets
+    assert list(conn.db.metadata.find({}, {'_id': False})) == metadata
+    entries = list(conn.db.transactions.find({}, {'_id': False}))
+    assert [entry['transaction_id'] for entry in entries] == \
+        [signed_create_tx.id]
+
+
+def test_get_indexed_transactions(signed_create_tx, signed_transfer_tx):
+    from bigchaindb.backend import connect, query
+    from bigchaindb.models import Block
+    conn = connect()
+
+    # write two blocks with the same transaction
+    block1 = Block(transactions=[signed_create_tx])
+    query.write_block(conn, block1.to_dict())
+    block2 = Block(transactions=[signed_create_tx, signed_transfer_tx],
+                   timestamp='1')
+    query.write_block(conn, block2.to_dict())
+
+    entries = list(query.get_indexed_transactions(conn, [signed_create_tx.id]))
+    assert sorted(entry['block_id'] for entry in entries) == \
+        sorted([block1.id, block2.id])
+    assert all(entry['transaction'] == signed_create_tx.to_dict()
+               for entry in entries)
+
+    entries = list(query.get_indexed_transactions(
+        conn, [signed_create_tx.id, signed_transfer_tx.id]))
+    assert len(entries) == 3
+
+
+def test_write_transactions_index(signed_create_tx, signed_transfer_tx):
+    from bigchaindb.backend import connect, query
+    from bigchaindb.models import Block
+    conn = connect()
+
+    block1 = Block(transactions=[signed_create_tx])
+    query.write_block(conn, block1.to_dict())
+    block2 = Block(transactions=[signed_transfer_tx], timestamp='1')
+    conn.db.bigchain.insert_one(block2.to_dict())
+
+    # the entries that already exist are skipped
+    query.write_transactions_index(conn, [block1.to_dict(), block2.to_dict()])
+
+    entries = list(conn.db.transactions.find({}, {'_id': False}))
+    assert sorted((entry['transaction_id'], entry['block_id'])
+                  for entry in entries) == \
+        sorted([(signed_create_tx.id, block1.id),
+                (signed_transfer_tx.id, block2.id)])
+
+
+def test_insert_many_unordered_only_skips_duplicate_keys():
+    from pymongo.errors import BulkWriteError
+    from bigchaindb.backend.exceptions import OperationError
+    from bigchaindb.backend.mongodb.query import _insert_many_unordered
+
+    def failing_conn(write_errors):
+        conn = mock.Mock()
+        try:
+            raise BulkWriteError({'writeErrors': write_errors})
+        except BulkWriteError as exc:
+            error = OperationError()
+            error.__cause__ = exc
+        conn.run.side_effect = error
+        return conn
+
+    assert _insert_many_unordered(
+        failing_conn([{'code': 11000}, {'code': 11000}]), 'backlog', [{}]) is None
+
+    with pytest.raises(OperationError):
+        _insert_many_unordered(
+            failing_conn([{'code': 11000}, {'code': 121}]), 'backlog', [{}])
+
+
+def test_get_blocks_status(signed_create_tx):
+    from bigchaindb.backend import connect, query
+    from bigchaindb.models import Block
+    conn = connect()
+
+    block = Block(transactions=[signed_create_tx], voters=['aaa'])
+    query.write_block(conn, block.to_dict())
+
+    blocks = list(query.get_blocks_status(conn, [block.id, 'b']))
+    assert len(blocks) == 1
+    assert blocks[0]['id'] == block.id
+    assert blocks[0]['block'] == {'voters': ['aaa']}
+
+
+def test_get_blocks(signed_create_tx, signed_transfer_tx):
+    from bigchaindb.backend import connect, query
+    from bigchaindb.models import Block
+    conn = connect()
+
+    block1 = Block(transactions=[signed_create_tx])
+    query.write_block(conn, block1.to_dict())
+    block2 = Block(transactions=[signed_transfer_tx])
+    query.write_block(conn, block2.to_dict())
+
+    blocks = list(query.get_blocks(conn))
+    assert sorted(blocks, key=lambda block: block['id']) == \
+        sorted([block1.to_dict(), block2.to_dict()],
+               key=lambda block: block['id'])
+
+
+def test_write_migration():
+    from bigchaindb.backend import connect, query
+    from bigchaindb.backend.schema import MIGRATIONS
+    conn = connect()
+
+    # the migrations are recorded when the database is initialized
+    assert sorted(migration['id'] for migration in
+                  query.get_migrations(conn)) == sorted(MIGRATIONS)
+
+    query.write_migration(conn, 'test')
+    query.write_migration(conn, 'test')
+    assert conn.db.migrations.count({'id': 'test'}) == 1
+    conn.db.migrations.delete_one({'id': 'test'})
+
+
+def test_update_transactions_status(signed_create_tx, signed_transfer_tx):
+    from bigchaindb.backend import connect, query
+    from bigchaindb.models import Block
+    conn = connect()
+
+    block1 = Block(transactions=[signed_create_tx, signed_transfer_tx])
+    query.write_block(conn, block1.to_dict())
+    block2 = Block(transactions=[signed_create_tx], timestamp='1')
+    query.write_block(conn, block2.to_dict())
+
+    query.update_transactions_status(conn, block1.id, 'invalid')
+
+    statuses = {(entry['block_id'], entry['transaction_id']): entry['status']
+                for entry in conn.db.transactions.find()}
+    assert statuses == {
+        (block1.id, signed_create_tx.id): 'invalid',
+        (block1.id, signed_transfer_tx.id): 'invalid',
+        (block2.id, signed_create_tx.id): 'undecided',
+    }
+
+
+def test_store_and_spend_outputs():
+    from bigchaindb.backend import connect, query
+    conn = connect()
+
+    # an output can be spent before it is stored
+    query.spend_outputs(conn, [{'transaction_id': 'a', 'output_index': 1,
+                                'spent_by': 'b'}])
+    outputs = [{'transaction_id': 'a', 'output_index': index,
+                'public_keys': ['pk1', 'pk2'][:index + 1], 'amount': 1,
+                'asset_id': 'a'} for index in range(2)]
+    query.store_outputs(conn, outputs)
+    # storing is idempotent
+    query.store_outputs(conn, outputs)
+
+    assert conn.db.outputs.count() == 2
+    res = query.get_outputs_by_public_key(conn, 'pk1')
+    assert sorted(res, key=lambda output: output['output_index']) == [
+        outputs[0], dict(outputs[1], spent_by='b')]
+    assert list(query.get_outputs_by_public_key(conn, 'pk2')) == [
+        dict(outputs[1], spent_by='b')]
+    assert list(query.get_outputs_by_public_key(conn, 'pk1', spent=False)) == \
+        [outputs[0]]
+    assert list(query.get_outputs_by_public_key(conn, 'pk1', spent=True)) == \
+        [dict(outputs[1], spent_by='b')]
+
 
 def test_get_block(signed_create_tx):
     from bigchaindb.backend import connect, query
@@ -383,6 +654,33 @@ def test_get_last_voted_block_id(genesis_block, signed_create_tx, b):
         query.get_last_voted_block_id(conn, b.me)
 
 
+def test_write_vote_advances_the_voting_tip(genesis_block, b):
+    from bigchaindb.backend import connect, query
+    conn = connect()
+
+    # the voting tip is built on the first read
+    assert query.get_last_voted_block_id(conn, b.me) == genesis_block.id
+    assert conn.db.voting_tips.find_one({'_id': b.me})['block_id'] == \
+        genesis_block.id
+
+    query.write_vote(conn, b.vote('block1', genesis_block.id, True))
+    query.write_vote(conn, b.vote('block2', 'block1', True))
+    assert conn.db.voting_tips.find_one({'_id': b.me})['block_id'] == \
+        'block2'
+
+    # a vote that does not extend the tip leaves it untouched
+    query.write_vote(conn, b.vote('block3', 'block1', True))
+    assert conn.db.voting_tips.find_one({'_id': b.me})['block_id'] == \
+        'block2'
+
+    # the votes written without advancing the tip are followed, and the tip
+    # is repaired
+    conn.db.votes.insert_one(b.vote('block4', 'block2', True))
+    assert query.get_last_voted_block_id(conn, b.me) == 'block4'
+    assert conn.db.voting_tips.find_one({'_id': b.me})['block_id'] == \
+        'block4'
+
+
 def test_get_txids_filtered(signed_create_tx, signed_transfer_tx):
     from bigchaindb.backend import connect, query
     from bigchaindb.models import Block, Transaction
@@ -410,6 +708,44 @@ def test_get_txids_filtered(signed_create_tx, signed_transfer_tx):
     assert txids == {signed_transfer_tx.id}
 
 
+def test_get_txids_filtered_by_pages(signed_create_tx, signed_transfer_tx):
+    from bigchaindb.backend import connect, query
+    from bigchaindb.models import Block
+    conn = connect()
+
+    # the create transaction is in two blocks
+    for txs in ([signed_create_tx], [signed_create_tx, signed_transfer_tx]):
+        conn.db.bigchain.insert_one(Block(transactions=txs).to_dict())
+
+    txids = sorted([signed_create_tx.id, signed_transfer_tx.id])
+    asset_id = signed_create_tx.id
+
+    assert list(query.get_txids_filtered(conn, asset_id)) == txids
+    assert list(query.get_txids_filtered(conn, asset_id, limit=1)) == txids[:1]
+    assert list(query.get_txids_filtered(conn, asset_id,
+                                         after=txids[0])) == txids[1:]
+    assert list(query.get_txids_filtered(conn, asset_id,
+                                         after=txids[1])) == []
+
+
+def test_get_txids_filtered_skips_the_previous_pages(signed_create_tx):
+    from pymongo.collection import Collection
+    from bigchaindb.backend import connect, query
+    conn = connect()
+
+    asset_id = signed_create_tx.id
+    with mock.patch.object(Collection, 'aggregate', autospec=True,
+                           side_effect=Collection.aggregate) as aggregate:
+        assert list(query.get_txids_filtered(conn, asset_id,
+                                             after=asset_id)) == []
+
+    (_, pipeline), kwargs = aggregate.call_args
+    # the blocks are filtered before they are unwound, grouped and sorted
+    assert pipeline[0]['$match']['$and'][1] == {
+        'block.transactions.id': {'$gt': asset_id}}
+    assert kwargs == {'allowDiskUse': True}
+
+
 @mock.patch('bigchaindb.backend.mongodb.changefeed._FEED_STOP', True)
 def test_get_new_blocks_feed(b, create_tx):
     from bigchaindb.backend import query
@@ -489,6 +825,30 @@ def test_get_votes_for_blocks_by_voter():
     assert list(res) == [votes[0], votes[2]]
 
 
+def test_get_votes_by_block_ids():
+    from bigchaindb.backend import connect, query
+
+    conn = connect()
+    votes = [
+        {
+            'node_pubkey': 'a',
+            'vote': {'voting_for_block': 'block1'},
+        },
+        {
+            'node_pubkey': 'b',
+            'vote': {'voting_for_block': 'block1'},
+        },
+        {
+            'node_pubkey': 'a',
+            'vote': {'voting_for_block': 'block2'},
+        },
+    ]
+    for vote in votes:
+        conn.db.votes.insert_one(vote.copy())
+    res = query.get_votes_by_block_ids(conn, ['block1', 'block3'])
+    assert list(res) == votes[:2]
+
+
 def test_write_assets():
     from bigchaindb.backend import connect, query
     conn = connect()
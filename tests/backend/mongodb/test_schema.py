@@ -19,18 +19,20 @@ def test_init_creates_db_tables_and_indexes():
 
     collection_names = conn.conn[dbname].collection_names()
     assert sorted(collection_names) == ['assets', 'backlog', 'bigchain',
-                                        'metadata', 'votes']
+                                        'metadata', 'migrations', 'outputs',
+                                        'transactions', 'votes']
 
     indexes = conn.conn[dbname]['bigchain'].index_information().keys()
     assert sorted(indexes) == ['_id_', 'asset_id', 'block_id', 'block_timestamp',
                                'inputs', 'outputs', 'transaction_id']
 
     indexes = conn.conn[dbname]['backlog'].index_information().keys()
-    assert sorted(indexes) == ['_id_', 'assignee__transaction_timestamp',
+    assert sorted(indexes) == ['_id_', 'assignee__assignment_expiry',
                                'transaction_id']
 
     indexes = conn.conn[dbname]['votes'].index_information().keys()
-    assert sorted(indexes) == ['_id_', 'block_and_voter']
+    assert sorted(indexes) == ['_id_', 'block_and_voter',
+                               'voter_and_previous_block']
 
     indexes = conn.conn[dbname]['assets'].index_information().keys()
     assert sorted(indexes) == ['_id_', 'asset_id', 'text']
@@ -38,6 +40,15 @@ def test_init_creates_db_tables_and_indexes():
     indexes = conn.conn[dbname]['metadata'].index_information().keys()
     assert sorted(indexes) == ['_id_', 'text', 'transaction_id']
 
+    indexes = conn.conn[dbname]['transactions'].index_information().keys()
+    assert sorted(indexes) == ['_id_', 'block_id', 'transaction_and_block']
+
+    indexes = conn.conn[dbname]['outputs'].index_information().keys()
+    assert sorted(indexes) == ['_id_', 'output', 'public_keys']
+
+    indexes = conn.conn[dbname]['migrations'].index_information().keys()
+    assert sorted(indexes) == ['_id_', 'migration_id']
+
 
 def test_init_database_fails_if_db_exists():
     import bigchaindb
@@ -70,7 +81,8 @@ def test_create_tables():
 
     collection_names = conn.conn[dbname].collection_names()
     assert sorted(collection_names) == ['assets', 'backlog', 'bigchain',
-                                        'metadata', 'votes']
+                                        'metadata', 'migrations', 'outputs',
+                                        'transactions', 'votes']
 
 
 def test_create_secondary_indexes():
@@ -94,12 +106,53 @@ def test_create_secondary_indexes():
 
     # Backlog table
     indexes = conn.conn[dbname]['backlog'].index_information().keys()
-    assert sorted(indexes) == ['_id_', 'assignee__transaction_timestamp',
+    assert sorted(indexes) == ['_id_', 'assignee__assignment_expiry',
                                'transaction_id']
 
     # Votes table
     indexes = conn.conn[dbname]['votes'].index_information().keys()
-    assert sorted(indexes) == ['_id_', 'block_and_voter']
+    assert sorted(indexes) == ['_id_', 'block_and_voter',
+                               'voter_and_previous_block']
+
+    # Transactions table
+    indexes = conn.conn[dbname]['transactions'].index_information().keys()
+    assert sorted(indexes) == ['_id_', 'block_id', 'transaction_and_block']
+
+    indexes = conn.conn[dbname]['outputs'].index_information().keys()
+    assert sorted(indexes) == ['_id_', 'output', 'public_keys']
+
+    indexes = conn.conn[dbname]['migrations'].index_information().keys()
+    assert sorted(indexes) == ['_id_', 'migration_id']
+
+
+def test_create_missing_tables():
+    import bigchaindb
+    from bigchaindb import backend
+    from bigchaindb.backend import schema
+
+    conn = backend.connect()
+    dbname = bigchaindb.config['database']['name']
+
+    # a database initialized before the transactions, outputs and migrations
+    # tables existed
+    conn.conn.drop_database(dbname)
+    schema.create_database(conn, dbname)
+    for table_name in ('bigchain', 'backlog', 'votes', 'assets', 'metadata'):
+        conn.conn[dbname].create_collection(table_name)
+    conn.conn[dbname]['bigchain'].insert_one({'id': 'block'})
+
+    schema.create_missing_tables(conn, dbname)
+    # and again, when nothing is missing
+    schema.create_missing_tables(conn, dbname)
+
+    collection_names = conn.conn[dbname].collection_names()
+    assert sorted(collection_names) == ['assets', 'backlog', 'bigchain',
+                                        'metadata', 'migrations', 'outputs',
+                                        'transactions', 'votes']
+    assert conn.conn[dbname]['bigchain'].count() == 1
+
+    indexes = conn.conn[dbname]['transactions'].index_information().keys()
+    assert sorted(indexes) == ['_id_', 'block_id', 'transaction_and_block']
 
 
 def test_drop(dummy_db):
@@ -25,7 +25,9 @@ def test_init_creates_db_tables_and_indexes():
         'block_timestamp')) is True
 
     assert conn.run(r.db(dbname).table('backlog').index_list().contains(
-        'assignee__transaction_timestamp')) is True
+        'assignee__assignment_expiry')) is True
+    assert conn.run(r.db(dbname).table('backlog').index_list().contains(
+        'assignment_expiry')) is True
 
 
 @pytest.mark.bdb
@@ -65,7 +67,10 @@ def test_create_tables():
     assert conn.run(r.db(dbname).table_list().contains('votes')) is True
     assert conn.run(r.db(dbname).table_list().contains('assets')) is True
     assert conn.run(r.db(dbname).table_list().contains('metadata')) is True
-    assert len(conn.run(r.db(dbname).table_list())) == 5
+    assert conn.run(r.db(dbname).table_list().contains('transactions')) is True
+    assert conn.run(r.db(dbname).table_list().contains('outputs')) is True
+    assert conn.run(r.db(dbname).table_list().contains('migrations')) is True
+    assert len(conn.run(r.db(dbname).table_list())) == 8
 
 
 @pytest.mark.bdb
@@ -94,12 +99,45 @@ def test_create_secondary_indexes():
 
     # Backlog table
     assert conn.run(r.db(dbname).table('backlog').index_list().contains(
-        'assignee__transaction_timestamp')) is True
+        'assignee__assignment_expiry')) is True
+    assert conn.run(r.db(dbname).table('backlog').index_list().contains(
+        'assignment_expiry')) is True
 
     # Votes table
     assert conn.run(r.db(dbname).table('votes').index_list().contains(
         'block_and_voter')) is True
 
+    # Transactions table
+    assert conn.run(r.db(dbname).table('transactions').index_list().contains(
+        'transaction_id', 'block_id')) is True
+
+    # Outputs table
+    assert conn.run(r.db(dbname).table('outputs').index_list().contains(
+        'public_keys')) is True
+
+
+@pytest.mark.bdb
+def test_create_missing_tables():
+    conn = backend.connect()
+    dbname = bigchaindb.config['database']['name']
+
+    # a database initialized before the transactions, outputs and migrations
+    # tables existed
+    conn.run(r.db_drop(dbname))
+    schema.create_database(conn, dbname)
+    for table_name in ('bigchain', 'backlog', 'votes', 'assets', 'metadata'):
+        conn.run(r.db(dbname).table_create(table_name))
+
+    schema.create_missing_tables(conn, dbname)
+    # and again, when nothing is missing
+    schema.create_missing_tables(conn, dbname)
+
+    assert len(conn.run(r.db(dbname).table_list())) == 8
+    assert conn.run(r.db(dbname).table('transactions').index_list().contains(
+        'transaction_id', 'block_id')) is True
+    assert conn.run(r.db(dbname).table('outputs').index_list().contains(
+        'public_keys')) is True
+
 
 def test_drop(dummy_db):
     conn = backend.connect()
@@ -5,6 +5,7 @@ from pytest import mark, raises
     ('create_database', 1),
     ('create_tables', 1),
     ('create_indexes', 1),
+    ('create_missing_tables', 1),
     ('drop_database', 1),
 ))
 def test_schema(schema_func_name, args_qty):
@@ -16,18 +17,33 @@ def test_schema(schema_func_name, args_qty):
 
 @mark.parametrize('query_func_name,args_qty', (
     ('write_transaction', 1),
+    ('write_transactions', 1),
     ('count_blocks', 0),
+    ('get_migrations', 0),
+    ('write_migration', 1),
     ('count_backlog', 0),
     ('get_genesis_block', 0),
     ('delete_transaction', 1),
     ('get_stale_transactions', 1),
+    ('reassign_stale_transactions', 3),
     ('get_blocks_status_from_transaction', 1),
+    ('get_blocks_status', 1),
+    ('get_blocks', 0),
+    ('write_transactions_index', 1),
+    ('get_indexed_transactions', 1),
+    ('update_transactions_status', 2),
+    ('store_outputs', 1),
+    ('spend_outputs', 1),
+    ('get_outputs_by_public_key', 1),
     ('get_transaction_from_backlog', 1),
+    ('get_transactions_from_backlog', 1),
     ('get_txids_filtered', 1),
     ('get_asset_by_id', 1),
     ('get_owned_ids', 1),
     ('get_votes_by_block_id', 1),
+    ('get_votes_by_block_ids', 1),
     ('write_block', 1),
+    ('write_decoupled_block', 3),
     ('get_block', 1),
     ('write_vote', 1),
     ('get_last_voted_block_id', 1),
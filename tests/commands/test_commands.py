@@ -18,6 +18,7 @@ def test_make_sure_we_dont_remove_any_command():
     assert parser.parse_args(['export-my-pubkey']).command
     assert parser.parse_args(['init']).command
     assert parser.parse_args(['drop']).command
+    assert parser.parse_args(['upgrade']).command
     assert parser.parse_args(['start']).command
     assert parser.parse_args(['set-shards', '1']).command
     assert parser.parse_args(['set-replicas', '1']).command
@@ -163,6 +164,27 @@ def test__run_init(mocker):
     bigchain_mock.return_value.create_genesis_block.assert_called_once_with()
 
 
+def test__run_upgrade(mocker):
+    from bigchaindb import config
+    from bigchaindb.commands.bigchaindb import _run_upgrade
+    bigchain_mock = mocker.patch(
+        'bigchaindb.commands.bigchaindb.bigchaindb.Bigchain')
+    create_tables_mock = mocker.patch(
+        'bigchaindb.commands.bigchaindb.schema.create_missing_tables',
+        autospec=True,
+        spec_set=True,
+    )
+    run_migrations_mock = mocker.patch(
+        'bigchaindb.commands.bigchaindb.migrations.run_migrations',
+        autospec=True,
+        spec_set=True,
+    )
+    _run_upgrade()
+    create_tables_mock.assert_called_once_with(
+        bigchain_mock.return_value.connection, config['database']['name'])
+    run_migrations_mock.assert_called_once_with(bigchain_mock.return_value)
+
+
 @patch('bigchaindb.backend.schema.drop_database')
 def test_drop_db_when_assumed_yes(mock_db_drop):
     from bigchaindb.commands.bigchaindb import run_drop
@@ -340,8 +362,11 @@ def test_run_start_when_db_already_exists(mocker,
 
     monkeypatch.setattr(
         'bigchaindb.commands.bigchaindb._run_init', mock_run_init)
+    mocked_upgrade = mocker.patch(
+        'bigchaindb.commands.bigchaindb._run_upgrade')
     run_start(run_start_args)
     mocked_setup_logging.assert_called_once_with(user_log_config=config['log'])
+    mocked_upgrade.assert_called_once_with()
     assert mocked_start.called
 
 
@@ -65,6 +65,21 @@ def test_validate_transaction_fails():
         validate_transaction_schema({})
 
 
+def test_validate_transaction_serialized(signed_transfer_tx):
+    from bigchaindb.common.transaction import Transaction
+    tx_dict = signed_transfer_tx.to_dict()
+    tx_serialized = Transaction.validate_id(tx_dict)
+    validate_transaction_schema(tx_dict, tx_serialized)
+
+
+def test_validate_transaction_specific_constraints(signed_transfer_tx):
+    tx_dict = signed_transfer_tx.to_dict()
+    tx_dict['inputs'] = []
+    with raises(SchemaValidationError) as exc:
+        validate_transaction_schema(tx_dict)
+    assert '[] is too short' in str(exc.value)
+
+
 def test_validate_failure_inconsistent():
     with patch('jsonschema.validate'):
         with raises(SchemaValidationError):
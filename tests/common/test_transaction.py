@@ -59,8 +59,27 @@ def test_input_deserialization_with_invalid_fulfillment_uri(user_pub):
         'fulfillment': 'an invalid fulfillment',
         'fulfills': None,
     }
+    input_ = Input.from_dict(ffill)
     with raises(InvalidSignature):
-        Input.from_dict(ffill)
+        input_.fulfillment
+
+
+def test_input_deserialization_is_lazy(ffill_uri, user_pub):
+    from unittest.mock import patch
+    from bigchaindb.common.transaction import Input
+    from cryptoconditions import Fulfillment
+
+    ffill = {
+        'owners_before': [user_pub],
+        'fulfillment': ffill_uri,
+        'fulfills': None,
+    }
+    with patch('cryptoconditions.Fulfillment.from_uri') as from_uri:
+        input_ = Input.from_dict(ffill)
+        assert input_.to_dict() == ffill
+    assert not from_uri.called
+
+    assert input_.fulfillment == Fulfillment.from_uri(ffill_uri)
 
 
 def test_input_deserialization_with_unsigned_fulfillment(ffill_uri, user_pub):
@@ -118,6 +137,63 @@ def test_output_deserialization(user_Ed25519, user_pub):
     assert cond == expected
 
 
+def test_output_deserialization_is_lazy(user_Ed25519, user_pub):
+    from unittest.mock import patch
+    from bigchaindb.common.transaction import Output
+
+    cond = {
+        'condition': {
+            'uri': user_Ed25519.condition_uri,
+            'details': {
+                'type': 'ed25519-sha-256',
+                'public_key': b58encode(user_Ed25519.public_key),
+            },
+        },
+        'public_keys': [user_pub],
+        'amount': '1',
+    }
+    with patch('bigchaindb.common.transaction._fulfillment_from_details') \
+            as from_details:
+        output = Output.from_dict(cond)
+        assert output.to_dict() == cond
+    assert not from_details.called
+
+    assert output.fulfillment.condition_uri == user_Ed25519.condition_uri
+    assert output.to_dict() == cond
+
+
+def test_output_validate_condition(user_pub):
+    from bigchaindb.common.transaction import Output
+    from cryptoconditions.exceptions import UnsupportedTypeError
+
+    output = Output.from_dict({
+        'condition': {'uri': 'a', 'details': {'type': 'a'}},
+        'public_keys': [user_pub],
+        'amount': '1',
+    })
+    with raises(UnsupportedTypeError):
+        output.validate_condition()
+
+
+def test_output_validate_condition_uri(user_pub, user2_Ed25519):
+    from bigchaindb.common.exceptions import ConditionUriMismatch
+    from bigchaindb.common.transaction import Output
+
+    output = Output.from_dict({
+        'condition': {
+            'uri': user2_Ed25519.condition_uri,
+            'details': {
+                'type': 'ed25519-sha-256',
+                'public_key': user_pub,
+            },
+        },
+        'public_keys': [user_pub],
+        'amount': '1',
+    })
+    with raises(ConditionUriMismatch):
+        output.validate_condition()
+
+
 def test_output_hashlock_serialization():
     from bigchaindb.common.transaction import Output
     from cryptoconditions import PreimageSha256
@@ -641,6 +717,107 @@ def test_validate_inputs_of_transfer_tx_with_invalid_params(
         transfer_tx.inputs_valid([utx.outputs[0]])
 
 
+def test_signature_batch(user_pub, user_priv, user2_pub, user2_priv):
+    from bigchaindb.common.transaction import SignatureBatch, Transaction
+
+    tx = Transaction.create([user_pub], [([user_pub], 1), ([user2_pub], 1)])
+    tx = tx.sign([user_priv])
+    threshold_tx = Transaction.create([user_pub, user2_pub],
+                                      [([user_pub, user2_pub], 1)])
+    threshold_tx = threshold_tx.sign([user_priv, user2_priv])
+    transfer_tx = Transaction.transfer(tx.to_inputs(), [([user2_pub], 2)],
+                                       asset_id=tx.id)
+    transfer_tx = transfer_tx.sign([user_priv, user2_priv])
+
+    batch = SignatureBatch()
+    batch.add(tx)
+    batch.add(threshold_tx)
+    batch.add(transfer_tx, tx.outputs)
+
+    assert len(batch) == 3
+    assert batch.verify() == []
+
+
+def test_signature_batch_reports_invalid_transactions(user_pub, user_priv,
+                                                      user2_pub, user2_priv):
+    from bigchaindb.common.transaction import SignatureBatch, Transaction
+
+    tx = Transaction.create([user_pub], [([user_pub], 1)]).sign([user_priv])
+    tx2 = Transaction.create([user2_pub], [([user2_pub], 1)])
+    tx2 = tx2.sign([user2_priv])
+    tampered_tx = Transaction.create([user_pub], [([user_pub], 1)],
+                                     metadata={'msg': 'original'})
+    tampered_tx = tampered_tx.sign([user_priv])
+    tampered_tx.metadata = {'msg': 'tampered'}
+    unsigned_tx = Transaction.create([user_pub], [([user_pub], 1)])
+    transfer_tx = Transaction.transfer(tx.to_inputs(), [([user2_pub], 1)],
+                                       asset_id=tx.id)
+    transfer_tx = transfer_tx.sign([user_priv])
+
+    batch = SignatureBatch()
+    batch.add(tx)
+    batch.add(tampered_tx)
+    batch.add(tx2)
+    batch.add(unsigned_tx)
+    # the transfer is checked against the wrong output
+    batch.add(transfer_tx, tx2.outputs)
+
+    assert batch.verify() == [tampered_tx, unsigned_tx, transfer_tx]
+
+
+def test_signature_batch_with_invalid_params(transfer_tx):
+    from bigchaindb.common.transaction import SignatureBatch
+
+    with raises(ValueError):
+        SignatureBatch().add(transfer_tx, [])
+    with raises(TypeError):
+        SignatureBatch().add(transfer_tx, None)
+
+
+def test_verify_batch(user_pub, user_priv):
+    from bigchaindb.common.crypto import PrivateKey, verify_batch
+
+    public_key = b58decode(user_pub)
+    signature = b58decode(PrivateKey(user_priv).sign(b'message').decode())
+    items = [
+        (public_key, b'message', signature),
+        (public_key, b'tampered', signature),
+        (public_key, b'message', signature),
+        (b'not a key', b'message', signature),
+    ]
+
+    assert verify_batch(items) == [True, False, True, False]
+    assert verify_batch([]) == []
+
+
+def test_signed_message_is_cached(utx, user_priv):
+    from bigchaindb.common.transaction import Transaction
+
+    tx_dict = Transaction._remove_signatures(utx.to_dict())
+    tx_dict['id'] = None
+    expected = Transaction._to_str(tx_dict)
+
+    assert utx._signed_message() == expected
+    assert utx._signed_message() is utx._signed_message()
+    assert str(utx) == expected
+
+    utx.sign([user_priv])
+    assert utx._signed_message() == expected
+    assert str(utx) != expected
+    assert utx.inputs_valid() is True
+
+
+def test_signed_message_cache_is_cleared(utx, user_input, user2_output):
+    message = utx._signed_message()
+
+    utx.add_output(user2_output)
+    with_output = utx._signed_message()
+    assert with_output != message
+
+    utx.add_input(user_input)
+    assert utx._signed_message() not in (message, with_output)
+
+
 def test_create_create_transaction_single_io(user_output, user_pub, data):
     from bigchaindb.common.transaction import Transaction
     from .utils import validate_transaction_model
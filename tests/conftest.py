@@ -139,6 +139,7 @@ def _configure_bigchaindb(request, certs_dir):
             'backend': 'mongodb',
             'connection_timeout': 5000,
             'max_tries': 3,
+            'max_pool_size': 100,
             'ssl': True,
             'ca_cert': os.environ.get('BIGCHAINDB_DATABASE_CA_CERT', certs_dir + '/ca.crt'),
             'crlfile': os.environ.get('BIGCHAINDB_DATABASE_CRLFILE', certs_dir + '/crl.pem'),
@@ -190,12 +191,17 @@ def _setup_database(_configure_bigchaindb):
 
 @pytest.fixture
 def _bdb(_setup_database, _configure_bigchaindb):
-    from bigchaindb import config
+    from bigchaindb import config, Bigchain
     from bigchaindb.backend import connect
     from bigchaindb.backend.admin import get_config
-    from bigchaindb.backend.schema import TABLES
+    from bigchaindb.backend import query
+    from bigchaindb.backend.schema import MIGRATIONS, TABLES
     from .utils import flush_db, update_table_config
     conn = connect()
+    # the migrations are recorded when the database is initialized, some
+    # tests create it again without them
+    for name in MIGRATIONS:
+        query.write_migration(conn, name)
     # TODO remove condition once the mongodb implementation is done
     if config['database']['backend'] == 'rethinkdb':
         table_configs_before = {
@@ -204,6 +210,7 @@ def _bdb(_setup_database, _configure_bigchaindb):
     yield
     dbname = config['database']['name']
     flush_db(conn, dbname)
+    Bigchain.decided_elections.clear()
     # TODO remove condition once the mongodb implementation is done
     if config['database']['backend'] == 'rethinkdb':
         for t, c in table_configs_before.items():
@@ -185,6 +185,29 @@ class TestBigchainApi(object):
         with pytest.raises(CriticalDoubleInclusion):
             b.get_blocks_status_containing_tx(tx.id)
 
+    @pytest.mark.genesis
+    def test_block_election_status_is_cached_once_decided(self, b):
+        from unittest.mock import patch
+        from bigchaindb.models import Transaction
+
+        tx = Transaction.create([b.me], [([b.me], 1)]).sign([b.me_private])
+        block = b.create_block([tx])
+        b.write_block(block)
+        assert b.block_election_status(block) == b.BLOCK_UNDECIDED
+        assert b.decided_elections.get(block.id, b.federation) is None
+
+        b.write_vote(b.vote(block.id, b.get_last_voted_block().id, True))
+        assert b.block_election_status(block) == b.BLOCK_VALID
+        assert b.decided_elections.get(block.id, b.federation) == b.BLOCK_VALID
+
+        with patch('bigchaindb.backend.query.get_votes_by_block_id') as get_votes, \
+                patch('bigchaindb.backend.query.get_votes_by_block_ids') as get_votes_bulk:
+            assert b.block_election_status(block) == b.BLOCK_VALID
+            assert b.get_transaction(tx.id, include_status=True)[1] == b.TX_VALID
+            assert b.filter_new_transactions([tx.id]) == []
+        assert not get_votes.called
+        assert not get_votes_bulk.called
+
     @pytest.mark.genesis
     def test_get_transaction_in_invalid_and_valid_block(self, monkeypatch, b):
         from bigchaindb.models import Transaction
@@ -397,6 +420,9 @@ class TestBigchainApi(object):
         assert len(block['block']['transactions']) == 1
         assert block['block']['transactions'][0]['operation'] == 'GENESIS'
         assert block['block']['transactions'][0]['inputs'][0]['fulfills'] is None
+        # the genesis block is never elected, its outputs are recorded
+        assert [link.txid for link in b.get_valid_outputs(b.me)] == \
+            [block['block']['transactions'][0]['id']]
 
     @pytest.mark.genesis
     def test_create_genesis_block_fails_if_table_not_empty(self, b):
@@ -616,6 +642,24 @@ class TestTransactionValidation(object):
         with pytest.raises(InputDoesNotExist):
             b.validate_transaction(signed_transfer_tx)
 
+    def test_output_condition_uri_mismatch(self, b, user_pk):
+        from bigchaindb.common.crypto import generate_key_pair
+        from bigchaindb.common.exceptions import ConditionUriMismatch
+        from bigchaindb.common.transaction import Output
+        from bigchaindb.models import Transaction
+
+        _, other_pk = generate_key_pair()
+        tx = Transaction.create([b.me], [([user_pk], 1)])
+        output = tx.outputs[0].to_dict()
+        # the uri locks the output to another key than its details
+        output['condition']['uri'] = \
+            Output.generate([other_pk], 1).to_dict()['condition']['uri']
+        tx.outputs[0] = Output.from_dict(output)
+        tx = Transaction.from_dict(tx.sign([b.me_private]).to_dict())
+
+        with pytest.raises(ConditionUriMismatch):
+            b.validate_transaction(tx)
+
     @pytest.mark.usefixtures('inputs')
     def test_non_create_valid_input_wrong_owner(self, b, user_pk):
         from bigchaindb.common.crypto import generate_key_pair
@@ -791,6 +835,44 @@ class TestBlockValidation(object):
         with pytest.raises(SybilError):
             b.validate_block(block)
 
+    def test_validation_context(self, b, user_pk, user_sk, genesis_block):
+        from bigchaindb.common import crypto
+        from bigchaindb.models import Transaction, ValidationContext
+
+        user2_sk, user2_pk = crypto.generate_key_pair()
+
+        tx_create = Transaction.create([b.me], [([user_pk], 1), ([user_pk], 1)],
+                                       metadata={'msg': 'create'})
+        tx_create = tx_create.sign([b.me_private])
+        block = b.create_block([tx_create])
+        b.write_block(block)
+        b.write_vote(b.vote(block.id, genesis_block.id, True))
+
+        inputs = tx_create.to_inputs()
+        tx_spent = Transaction.transfer([inputs[0]], [([user2_pk], 1)],
+                                        asset_id=tx_create.id)
+        tx_spent = tx_spent.sign([user_sk])
+        b.write_transaction(tx_spent)
+
+        tx_transfer = Transaction.transfer(inputs, [([user2_pk], 2)],
+                                           asset_id=tx_create.id)
+        tx_transfer = tx_transfer.sign([user_sk])
+
+        context = ValidationContext(b, [tx_transfer])
+
+        with patch('bigchaindb.backend.query.get_spending_transactions') as spends:
+            for txid, output in [(tx_create.id, 0), (tx_create.id, 1)]:
+                assert context.get_spent(txid, output) == \
+                    b.get_spent(txid, output)
+                assert context.get_transaction(txid, True) == \
+                    b.get_transaction(txid, True)
+            assert not spends.called
+
+        # lookups outside of the prefetched data fall back to Bigchain
+        assert context.get_transaction(tx_spent.id, True) == \
+            (tx_spent, b.TX_IN_BACKLOG)
+        assert context.TX_VALID == b.TX_VALID
+
 
 class TestMultipleInputs(object):
     def test_transfer_single_owner_single_input(self, b, inputs, user_pk,
@@ -1238,6 +1320,38 @@ def test_get_outputs_filtered(filter_spent, filter_unspent):
     assert out == get_outputs.return_value
 
 
+@pytest.mark.bdb
+def test_store_block_outputs_and_get_valid_outputs(b, user_pk, user_sk,
+                                                   user2_pk):
+    from bigchaindb.common.transaction import TransactionLink
+    from bigchaindb.models import Transaction
+
+    tx_create = Transaction.create([user_pk], [([user_pk], 1), ([user_pk], 2)])
+    tx_create = tx_create.sign([user_sk])
+    tx_transfer = Transaction.transfer(tx_create.to_inputs([0]),
+                                       [([user_pk, user2_pk], 1)],
+                                       asset_id=tx_create.id)
+    tx_transfer = tx_transfer.sign([user_sk])
+
+    # the spending block may be decided first
+    b.store_block_outputs(b.create_block([tx_transfer]).to_dict())
+    b.store_block_outputs(b.create_block([tx_create]).to_dict())
+
+    create_links = [TransactionLink(tx_create.id, 0),
+                    TransactionLink(tx_create.id, 1)]
+    transfer_link = TransactionLink(tx_transfer.id, 0)
+
+    def key(link):
+        return link.txid, link.output
+
+    assert sorted(b.get_valid_outputs(user_pk), key=key) == \
+        sorted(create_links + [transfer_link], key=key)
+    assert sorted(b.get_valid_outputs(user_pk, spent=False), key=key) == \
+        sorted([create_links[1], transfer_link], key=key)
+    assert b.get_valid_outputs(user_pk, spent=True) == [create_links[0]]
+    assert b.get_valid_outputs(user2_pk) == [transfer_link]
+
+
 @pytest.mark.bdb
 def test_cant_spend_same_input_twice_in_tx(b, genesis_block):
     """Recreate duplicated fulfillments bug
@@ -1319,3 +1433,50 @@ def test_is_new_transaction(b, genesis_block):
     # Tx is new because it's only found in an invalid block
     assert b.is_new_transaction(tx.id)
     assert b.is_new_transaction(tx.id, exclude_block_id=block.id)
+
+
+@pytest.mark.bdb
+def test_filter_new_transactions(b, genesis_block):
+    from bigchaindb.models import Transaction
+
+    txs = []
+    for n in range(1, 4):
+        tx = Transaction.create([b.me], [([b.me], n)])
+        txs.append(tx.sign([b.me_private]))
+    txids = [tx.id for tx in txs]
+
+    # Txs are new because they are not in any block
+    assert b.filter_new_transactions(txids) == txids
+
+    valid_block = b.create_block([txs[0]])
+    b.write_block(valid_block)
+    b.write_vote(b.vote(valid_block.id, genesis_block.id, True))
+    invalid_block = b.create_block([txs[1]])
+    b.write_block(invalid_block)
+    b.write_vote(b.vote(invalid_block.id, valid_block.id, False))
+
+    assert b.filter_new_transactions(txids) == txids[1:]
+    assert b.filter_new_transactions(
+        txids, exclude_block_id=valid_block.id) == txids
+
+
+@pytest.mark.bdb
+def test_get_votes_by_block_ids(b, genesis_block):
+    from bigchaindb.backend import query
+    from bigchaindb.models import Transaction
+
+    blocks = []
+    for n in range(1, 4):
+        tx = Transaction.create([b.me], [([b.me], n)]).sign([b.me_private])
+        blocks.append(b.create_block([tx]))
+        b.write_block(blocks[-1])
+    votes = [b.vote(block.id, genesis_block.id, True) for block in blocks]
+    for vote in votes:
+        b.write_vote(vote)
+
+    def key(vote):
+        return vote['vote']['voting_for_block']
+
+    res = query.get_votes_by_block_ids(b.connection,
+                                       [blocks[0].id, blocks[2].id, 'a' * 64])
+    assert sorted(res, key=key) == sorted([votes[0], votes[2]], key=key)
@@ -54,7 +54,8 @@ class MultipipesStepper:
     def add_input(self, prefix, node, next):
         """Add an input task; Reads from the outqueue of the Node"""
         name = '%s_%s' % (prefix, node.name)
-        next_name = '%s_%s' % (prefix, next.name)
+        if next:
+            next_name = '%s_%s' % (prefix, next.name)
 
         if node.name == 'changefeed':
             self.processes.append(node)
@@ -68,7 +69,7 @@ class MultipipesStepper:
 
         def inner(**kwargs):
             r = f(**kwargs)
-            if r is not None:
+            if r is not None and next:
                 self._enqueue(next_name, r)
             return r
 
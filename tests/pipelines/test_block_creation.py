@@ -72,7 +72,8 @@ def test_create_block(b, user_pk):
         tx = tx.sign([b.me_private])
         block_maker.create(tx)
 
-    # force the output triggering a `timeout`
+    # force the output triggering a `timeout` once the block timed out
+    block_maker.policy.timeout = 0
     block_doc = block_maker.create(None, timeout=True)
 
     assert len(block_doc.transactions) == 100
@@ -146,7 +147,8 @@ def test_delete_tx(b, user_pk):
         # make sure the tx appears in the backlog
         b.write_transaction(tx)
 
-    # force the output triggering a `timeout`
+    # force the output triggering a `timeout` once the block timed out
+    block_maker.policy.timeout = 0
     block_doc = block_maker.create(None, timeout=True)
 
     for tx in block_doc.to_dict()['block']['transactions']:
@@ -236,3 +238,200 @@ def test_duplicate_genesis_transaction(b, genesis_block, genesis_tx):
     from bigchaindb.pipelines import block
     block_maker = block.BlockPipeline()
     assert block_maker.validate_tx(genesis_tx.to_dict()) is None
+
+
+def test_batch_tx(create_tx, signed_create_tx, signed_transfer_tx):
+    from bigchaindb.pipelines.block import BlockPipeline
+
+    block_maker = BlockPipeline(batch_size=2, batch_timeout=60)
+
+    # the batch is output once full
+    assert block_maker.batch_tx(create_tx.to_dict()) is None
+    assert block_maker.batch_tx(signed_create_tx.to_dict()) == \
+        [create_tx.to_dict(), signed_create_tx.to_dict()]
+
+    # or when a timeout happens
+    assert block_maker.batch_tx(None, timeout=True) is None
+    assert block_maker.batch_tx(signed_transfer_tx.to_dict()) is None
+    assert block_maker.batch_tx(None, timeout=True) == \
+        [signed_transfer_tx.to_dict()]
+
+    # or when its first transaction waited long enough
+    block_maker.batch_timeout = 0
+    assert block_maker.batch_tx(create_tx.to_dict()) == [create_tx.to_dict()]
+
+
+@pytest.mark.bdb
+def test_validate_txs(b, user_pk):
+    from bigchaindb.models import Transaction
+    from bigchaindb.pipelines.block import BlockPipeline
+
+    block_maker = BlockPipeline()
+
+    txs = []
+    for _ in range(3):
+        tx = Transaction.create([b.me], [([b.me], 1)],
+                                metadata={'msg': random.random()})
+        txs.append(tx.sign([b.me_private]))
+
+    # txs[0] is already in the chain, txs[1] spends an input that does not
+    # exist
+    block_maker.write(b.create_block([txs[0]]))
+    txs[1] = Transaction.transfer(txs[1].to_inputs(), [([user_pk], 1)],
+                                  asset_id=txs[1].id)
+    txs[1] = txs[1].sign([b.me_private])
+    for tx in txs:
+        b.write_transaction(tx)
+
+    with patch.object(b.__class__, 'delete_transaction') as delete_transaction:
+        assert block_maker.validate_txs([tx.to_dict() for tx in txs]) == txs[2:]
+    delete_transaction.assert_called_once_with(txs[0].id, txs[1].id)
+
+    assert block_maker.validate_txs([txs[0].to_dict()]) is None
+
+
+@pytest.mark.bdb
+def test_validate_txs_verifies_the_signatures_together(b):
+    from bigchaindb.models import Transaction
+    from bigchaindb.pipelines.block import BlockPipeline
+
+    block_maker = BlockPipeline()
+
+    txs = []
+    for _ in range(3):
+        tx = Transaction.create([b.me], [([b.me], 1)],
+                                metadata={'msg': random.random()})
+        txs.append(tx.sign([b.me_private]))
+
+    with patch('bigchaindb.common.transaction.SignatureBatch.verify',
+               return_value=[txs[1]]) as verify, \
+            patch.object(b.__class__, 'filter_new_transactions',
+                         return_value=[tx.id for tx in txs]), \
+            patch.object(b.__class__, 'delete_transaction') as delete_transaction:
+        assert block_maker.validate_txs([tx.to_dict() for tx in txs]) == [txs[0], txs[2]]
+
+    verify.assert_called_once_with()
+    delete_transaction.assert_called_once_with(txs[1].id)
+
+
+def test_create_block_from_batches(b, user_pk):
+    from bigchaindb.models import Transaction
+    from bigchaindb.pipelines.block import BlockPipeline
+
+    block_maker = BlockPipeline()
+
+    txs = []
+    for _ in range(1100):
+        tx = Transaction.create([b.me], [([user_pk], 1)],
+                                metadata={'msg': random.random()})
+        txs.append(tx.sign([b.me_private]))
+
+    assert block_maker.create(txs[:600]) is None
+    # a block is output as soon as it is full
+    block_doc = block_maker.create(txs[600:])
+    assert block_doc.transactions == txs[:1000]
+
+    # force the output triggering a `timeout` once the block timed out
+    block_maker.policy.timeout = 0
+    block_doc = block_maker.create(None, timeout=True)
+    assert block_doc.transactions == txs[1000:]
+
+
+def test_create_block_max_bytes(b, user_pk):
+    from bigchaindb.common.utils import serialize
+    from bigchaindb.models import Transaction
+    from bigchaindb.pipelines.block import BlockPipeline
+
+    block_maker = BlockPipeline()
+
+    txs = []
+    for _ in range(10):
+        tx = Transaction.create([b.me], [([user_pk], 1)],
+                                metadata={'msg': random.random()})
+        txs.append(tx.sign([b.me_private]))
+    block_maker.policy.max_bytes = sum(len(serialize(tx.to_dict()))
+                                       for tx in txs[:3])
+
+    block_doc = block_maker.create(txs)
+    assert block_doc.transactions == txs[:3]
+    # the remaining transactions go to the next blocks
+    assert block_maker.create(None).transactions[0] == txs[3]
+
+
+def test_create_block_max_latency(b, user_pk, monkeypatch):
+    from bigchaindb.models import Transaction
+    from bigchaindb.pipelines.block import BlockPipeline
+
+    block_maker = BlockPipeline()
+
+    tx = Transaction.create([b.me], [([user_pk], 1)])
+    tx = tx.sign([b.me_private])
+
+    monkeypatch.setattr('bigchaindb.pipelines.block.time', lambda: 1000)
+    assert block_maker.create(tx) is None
+    monkeypatch.setattr('bigchaindb.pipelines.block.time', lambda: 1001)
+    assert block_maker.create(None).transactions == [tx]
+
+
+def test_create_block_timeout_waits_for_the_block_timeout(b, user_pk, monkeypatch):
+    from bigchaindb.models import Transaction
+    from bigchaindb.pipelines.block import BlockPipeline
+
+    block_maker = BlockPipeline()
+    block_maker.policy.timeout = 1
+
+    tx = Transaction.create([b.me], [([user_pk], 1)])
+    tx = tx.sign([b.me_private])
+
+    monkeypatch.setattr('bigchaindb.pipelines.block.time', lambda: 1000)
+    assert block_maker.create(tx) is None
+    # the pipeline times out after the minimum timeout, the block is only
+    # closed once it is as old as the current timeout
+    monkeypatch.setattr('bigchaindb.pipelines.block.time', lambda: 1000.5)
+    assert block_maker.create(None, timeout=True) is None
+    monkeypatch.setattr('bigchaindb.pipelines.block.time', lambda: 1001)
+    assert block_maker.create(None, timeout=True).transactions == [tx]
+
+
+@pytest.mark.parametrize('backlog,vote_lag,size,timeout', [
+    (5000, 0, 1000, 2),
+    (200, 0, 500, 1),
+    (500, 10, 1000, 2),
+    (10, 0, 250, 0.5),
+])
+def test_adaptive_block_size_policy(b, backlog, vote_lag, size, timeout):
+    from bigchaindb.pipelines.block import BlockSizePolicy
+
+    config = {'max_size': 1000, 'max_bytes': 1024, 'timeout': 2,
+              'adaptive': True, 'min_size': 100, 'min_timeout': 0.1}
+    policy = BlockSizePolicy(b, config)
+    policy.size, policy.timeout = 500, 1
+
+    with patch('bigchaindb.backend.query.count_backlog') as count_backlog, \
+            patch.object(policy, 'vote_lag') as vote_lag_, \
+            patch.object(b, 'statsd') as statsd:
+        count_backlog.return_value = backlog
+        vote_lag_.return_value = vote_lag
+        policy.update(None)
+
+        assert (policy.size, policy.timeout) == (size, timeout)
+        statsd.gauge.assert_any_call('pipelines.block.size', size)
+
+        # the limits are not adapted again right away
+        count_backlog.return_value = 0
+        policy.update(None)
+        assert (policy.size, policy.timeout) == (size, timeout)
+
+
+def test_block_size_policy_not_adaptive(b):
+    from bigchaindb.pipelines.block import BlockSizePolicy
+
+    config = {'max_size': 1000, 'max_bytes': 1024, 'timeout': 2,
+              'adaptive': False, 'min_size': 100, 'min_timeout': 0.1}
+    policy = BlockSizePolicy(b, config)
+    assert (policy.min_size, policy.min_timeout) == (1000, 2)
+
+    with patch('bigchaindb.backend.query.count_backlog') as count_backlog:
+        policy.update(None)
+    assert not count_backlog.called
+    assert (policy.size, policy.timeout) == (1000, 2)
@@ -83,6 +83,7 @@ def test_check_for_quorum_invalid_prev_node(b, user_pk):
 
 @pytest.mark.bdb
 def test_check_for_quorum_valid(b, user_pk):
+    from bigchaindb.backend import query
     from bigchaindb.models import Transaction
 
     # simulate a federation with four voters
@@ -116,6 +117,13 @@ def test_check_for_quorum_valid(b, user_pk):
     # since this block is valid, should go nowhere
     assert e.check_for_quorum(votes[-1]) is None
 
+    # the status of the block is recorded in the transactions table
+    entries = query.get_indexed_transactions(b.connection, [tx1.id])
+    assert [entry['status'] for entry in entries] == [b.BLOCK_VALID]
+
+    # and the outputs of its transactions are recorded
+    assert b.get_valid_outputs(user_pk) == [tx1.to_inputs()[0].fulfills]
+
 
 @patch('bigchaindb.core.Bigchain.get_block')
 def test_invalid_vote(get_block, b):
@@ -143,6 +151,30 @@ def test_check_requeue_transaction(b, user_pk):
     assert backlog_tx == tx1
 
 
+@patch.object(election.Election, 'requeue_transactions')
+@patch.object(election.Election, 'check_for_quorum')
+def test_process_vote_acknowledges_the_vote(check_for_quorum,
+                                            requeue_transactions):
+    from unittest.mock import Mock, call
+
+    calls = Mock()
+    calls.attach_mock(requeue_transactions, 'requeue_transactions')
+    e = election.Election(changefeed=calls.changefeed)
+
+    check_for_quorum.return_value = None
+    assert e.process_vote('vote') is None
+    assert calls.mock_calls == [call.changefeed.ack()]
+
+    # the vote is acknowledged once the transactions are requeued
+    calls.reset_mock()
+    check_for_quorum.return_value = invalid_block = Mock()
+    assert e.process_vote('vote') is invalid_block
+    assert calls.mock_calls == [
+        call.requeue_transactions(invalid_block),
+        call.changefeed.ack(),
+    ]
+
+
 @patch.object(Pipeline, 'start')
 def test_start(mock_start):
     # TODO: `block.election` is just a wrapper around `block.create_pipeline`,
@@ -181,8 +213,9 @@ def test_full_pipeline(b, user_pk):
     invalid_block = b.create_block(txs)
     b.write_block(invalid_block)
 
-    pipeline = election.create_pipeline()
-    pipeline.setup(indata=election.get_changefeed(), outdata=outpipe)
+    changefeed = election.get_changefeed()
+    pipeline = election.create_pipeline(changefeed=changefeed)
+    pipeline.setup(indata=changefeed, outdata=outpipe)
     pipeline.start()
     time.sleep(1)
 
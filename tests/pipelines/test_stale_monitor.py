@@ -9,64 +9,65 @@ import pytest
 
 
 @pytest.mark.bdb
-def test_get_stale(b, user_pk):
+def test_reassign_transactions(b, user_pk):
+    from bigchaindb.backend import query
     from bigchaindb.models import Transaction
+    # test with single node
     tx = Transaction.create([b.me], [([user_pk], 1)])
     tx = tx.sign([b.me_private])
+    b.backlog_reassign_delay = 0
     b.write_transaction(tx)
 
     stm = stale.StaleTransactionMonitor(timeout=0.001,
                                         backlog_reassign_delay=0.001)
-    tx_stale = stm.check_transactions()
+    assert stm.reassign_transactions() == 1
+
+    reassigned_tx = list(query.get_stale_transactions(b.connection, 0))[0]
+    assert reassigned_tx['assignee'] == b.me
+    assert reassigned_tx['assignment_expiry'] == \
+        reassigned_tx['assignment_timestamp'] + 0.001
 
-    for _tx in tx_stale:
-        _tx.pop('assignee')
-        _tx.pop('assignment_timestamp')
-        assert tx.to_dict() == _tx
+    # the renewed assignment is not stale yet
+    stm.bigchain.backlog_reassign_delay = 60
+    assert stm.reassign_transactions() == 1
+    assert stm.reassign_transactions() == 0
 
 
 @pytest.mark.bdb
-def test_reassign_transactions(b, user_pk):
+def test_reassign_transactions_federation(b, user_pk):
     from bigchaindb.backend import query
     from bigchaindb.models import Transaction
-    # test with single node
-    tx = Transaction.create([b.me], [([user_pk], 1)])
-    tx = tx.sign([b.me_private])
-    b.write_transaction(tx)
-
-    stm = stale.StaleTransactionMonitor(timeout=0.001,
-                                        backlog_reassign_delay=0.001)
-    # This worked previously because transaction['assignee'] was only used if
-    # bigchain.nodes_except_me was not empty.
-    tx_dict = tx.to_dict()
-    tx_dict['assignee'] = b.me
-    stm.reassign_transactions(tx_dict)
 
-    # test with federation
+    b.nodes_except_me = ['aaa', 'bbb']
+    b.backlog_reassign_delay = 0
     tx = Transaction.create([b.me], [([user_pk], 1)])
     tx = tx.sign([b.me_private])
     b.write_transaction(tx)
+    tx = list(query.get_stale_transactions(b.connection, 0))[0]
+    assert tx['assignee'] == b.get_assignee(tx['id'])
 
     stm = stale.StaleTransactionMonitor(timeout=0.001,
                                         backlog_reassign_delay=0.001)
-    stm.bigchain.nodes_except_me = ['aaa', 'bbb', 'ccc']
-    tx = list(query.get_stale_transactions(b.connection, 0))[0]
-    stm.reassign_transactions(tx)
+    stm.bigchain.nodes_except_me = ['aaa', 'bbb']
+    stm.reassign_transactions()
 
     reassigned_tx = list(query.get_stale_transactions(b.connection, 0))[0]
     assert reassigned_tx['assignment_timestamp'] > tx['assignment_timestamp']
+    assert reassigned_tx['assignee'] == \
+        b.get_next_assignee(tx['assignee'])
     assert reassigned_tx['assignee'] != tx['assignee']
 
     # test with node not in federation
-    tx = Transaction.create([b.me], [([user_pk], 1)])
+    tx = Transaction.create([b.me], [([user_pk], 2)])
     tx = tx.sign([b.me_private])
-    stm.bigchain.nodes_except_me = ['lol']
+    b.nodes_except_me = ['lol']
     b.write_transaction(tx)
-    stm.bigchain.nodes_except_me = []
 
-    tx = list(query.get_stale_transactions(b.connection, 0))[0]
-    stm.reassign_transactions(tx)
-    assert tx['assignee'] != 'lol'
+    stm.reassign_transactions()
+    reassigned_tx, = [tx_ for tx_ in
+                      query.get_stale_transactions(b.connection, 0)
+                      if tx_['id'] == tx.id]
+    assert reassigned_tx['assignee'] == b.me
 
 
 @pytest.mark.bdb
@@ -110,9 +111,8 @@ def test_full_pipeline(monkeypatch, user_pk):
     pipeline.setup(indata=inpipe, outdata=outpipe)
     pipeline.start()
 
-    # to terminate
-    for _ in range(100):
-        outpipe.get()
+    # all the transactions are reassigned at once
+    assert outpipe.get() == 100
 
     pipeline.terminate()
 
@@ -8,7 +8,6 @@ def test_stepping_changefeed_produces_update(b, steps):
     tx = input_single_create(b)
 
     # timeouts are 0 so will reassign immediately
-    steps.stale_check_transactions()
     steps.stale_reassign_transactions()
 
     # We expect 2 changefeed events
@@ -25,7 +24,6 @@ def test_stepping_changefeed_produces_update(b, steps):
 def test_dupe_tx_in_block(b, steps):
     tx = input_single_create(b)
     for i in range(2):
-        steps.stale_check_transactions()
         steps.stale_reassign_transactions()
         steps.block_changefeed()
         steps.block_filter_tx()
@@ -41,5 +39,7 @@ def input_single_create(b):
     from bigchaindb.common.transaction import Transaction
     metadata = {'r': random.random()}
     tx = Transaction.create([b.me], [([b.me], 1)], metadata).sign([b.me_private])
+    # the assignment expires immediately
+    b.backlog_reassign_delay = 0
     b.write_transaction(tx)
     return tx
@@ -92,6 +92,20 @@ def test_vote_ungroup_returns_a_set_of_results(b):
     assert len(txs) == 10
 
 
+@pytest.mark.genesis
+def test_vote_split_returns_chunks(b):
+    from bigchaindb.pipelines import vote
+
+    block = dummy_block(b)
+    vote_obj = vote.Vote(chunks=4)
+    chunks = list(vote_obj.split(block.id, block.transactions))
+
+    assert [len(chunk) for chunk, _, _ in chunks] == [3, 3, 3, 1]
+    assert [tx for chunk, _, _ in chunks for tx in chunk] == block.transactions
+    assert all(block_id == block.id and num_tx == 10
+               for _, block_id, num_tx in chunks)
+
+
 @pytest.mark.genesis
 def test_vote_validate_block(b):
     from bigchaindb.pipelines import vote
@@ -113,9 +127,7 @@ def test_vote_validate_block(b):
 
     vote_obj = vote.Vote()
     validation = vote_obj.validate_block(block.to_dict())
-    assert validation[0] == block.id
-    for tx1, tx2 in zip(validation[1], [vote_obj.invalid_dummy_tx]):
-        assert tx1 == tx2
+    assert validation == (block.id, None)
 
 
 @pytest.mark.genesis
@@ -127,9 +139,9 @@ def test_validate_block_with_invalid_id(b):
     block['id'] = 'an invalid id'
 
     vote_obj = vote.Vote()
-    block_id, invalid_dummy_tx = vote_obj.validate_block(block)
+    block_id, transactions = vote_obj.validate_block(block)
     assert block_id == block['id']
-    assert invalid_dummy_tx == [vote_obj.invalid_dummy_tx]
+    assert transactions is None
 
 
 @pytest.mark.genesis
@@ -140,8 +152,8 @@ def test_validate_block_with_duplicated_transactions(b):
     block = b.create_block([tx, tx]).to_dict()
 
     vote_obj = vote.Vote()
-    block_id, invalid_dummy_tx = vote_obj.validate_block(block)
-    assert invalid_dummy_tx == [vote_obj.invalid_dummy_tx]
+    block_id, transactions = vote_obj.validate_block(block)
+    assert transactions is None
 
 
 @pytest.mark.genesis
@@ -153,9 +165,19 @@ def test_validate_block_with_invalid_signature(b):
     block['signature'] = 'an invalid signature'
 
     vote_obj = vote.Vote()
-    block_id, invalid_dummy_tx = vote_obj.validate_block(block)
+    block_id, transactions = vote_obj.validate_block(block)
     assert block_id == block['id']
-    assert invalid_dummy_tx == [vote_obj.invalid_dummy_tx]
+    assert transactions is None
+
+
+def test_invalid_block_is_ungrouped_and_split_as_none(b):
+    from bigchaindb.pipelines import vote
+
+    vote_obj = vote.Vote()
+    assert list(vote_obj.ungroup('a', None)) == [(None, 'a', 1)]
+    assert list(vote_obj.split('a', None)) == [(None, 'a', 1)]
+    assert vote_obj.validate_tx(None, 'a', 1) == (False, 'a', 1)
+    assert vote_obj.validate_chunk(None, 'a', 1) == (False, 'a', 1, 1)
 
 
 @pytest.mark.genesis
@@ -196,6 +218,112 @@ def test_vote_accumulates_transactions(b):
     assert validation == (False, 456, 10)
 
 
+@pytest.mark.genesis
+def test_vote_validate_chunk(b):
+    from bigchaindb.pipelines import vote
+
+    vote_obj = vote.Vote()
+
+    txs = [dummy_tx(b) for _ in range(3)]
+    tx_dicts = [tx.to_dict() for tx in txs]
+
+    validation = vote_obj.validate_chunk(tx_dicts, 123, 10)
+    assert validation == (True, 123, 10, 3)
+
+    txs[1].inputs[0].fulfillment.signature = 64*b'z'
+    tx_dicts = [tx.to_dict() for tx in txs]
+    validation = vote_obj.validate_chunk(tx_dicts, 456, 10)
+    assert validation == (False, 456, 10, 3)
+
+
+@pytest.mark.genesis
+def test_vote_chunk_no_double_inclusion(b):
+    from bigchaindb.pipelines import vote
+
+    tx = dummy_tx(b)
+    block = b.create_block([tx])
+    r = vote.Vote().validate_chunk([tx.to_dict()], block.id, 1)
+    assert r == (True, block.id, 1, 1)
+
+    b.write_block(block)
+    r = vote.Vote().validate_chunk([tx.to_dict()], 'other_block_id', 1)
+    assert r == (False, 'other_block_id', 1, 1)
+
+
+def test_invalid_blocks_set():
+    from bigchaindb.pipelines.vote import InvalidBlocks
+
+    invalid_blocks = InvalidBlocks(size=2)
+    invalid_blocks.add('a' * 64)
+    invalid_blocks.add(123)
+    assert 'a' * 64 in invalid_blocks
+    assert 123 in invalid_blocks
+    assert 'b' * 64 not in invalid_blocks
+
+    # the oldest id is overwritten
+    invalid_blocks.add('b' * 64)
+    assert 'a' * 64 not in invalid_blocks
+    assert 'b' * 64 in invalid_blocks
+
+
+@pytest.mark.bdb
+def test_invalid_block_voting_short_circuits(b, genesis_block, monkeypatch):
+    from bigchaindb.pipelines import vote
+
+    monkeypatch.setattr('time.time', lambda: 1111111111)
+    vote_obj = vote.Vote(chunks=5)
+    block = dummy_block(b).to_dict()
+    txs = block['block']['transactions']
+    chunks = list(vote_obj.split(block['id'], txs))
+
+    # the first result of a valid chunk casts no vote
+    assert vote_obj.vote(True, block['id'], 10, 2) is None
+
+    # the first invalid chunk casts the INVALID vote right away
+    vote_doc, num_tx = vote_obj.vote(False, block['id'], 10, 2)
+    assert num_tx == 10
+    assert vote_doc['vote']['is_block_valid'] is False
+    assert vote_obj.last_voted_id == block['id']
+
+    # the remaining chunks of the block are not validated anymore
+    with patch('bigchaindb.models.Transaction.from_dict') as from_dict:
+        results = [vote_obj.validate_chunk(*chunk) for chunk in chunks[2:]]
+        assert not from_dict.called
+    assert results == [(False, block['id'], 10, 2)] * 3
+    with patch('bigchaindb.models.Transaction.from_dict') as from_dict:
+        assert vote_obj.validate_tx(txs[-1], block['id'], 10) == \
+            (False, block['id'], 10)
+        assert not from_dict.called
+
+    # and their results are dropped
+    assert [vote_obj.vote(*result) for result in results] == [None] * 3
+    assert vote_obj.counters == {}
+    assert vote_obj.decided == set()
+
+
+@pytest.mark.bdb
+def test_valid_block_voting_by_chunks(b, genesis_block, monkeypatch):
+    from bigchaindb.pipelines import vote
+
+    monkeypatch.setattr('time.time', lambda: 1111111111)
+    vote_obj = vote.Vote(chunks=3)
+    block = dummy_block(b).to_dict()
+    txs = block['block']['transactions']
+
+    votes = [vote_obj.vote(*vote_obj.validate_chunk(chunk, block_id, num_tx))
+             for chunk, block_id, num_tx in vote_obj.split(block['id'], txs)]
+
+    # a single vote is cast once all the chunks are validated
+    assert votes[:-1] == [None, None]
+    vote_doc, num_tx = votes[-1]
+    assert num_tx == 10
+    assert vote_doc['vote'] == {'voting_for_block': block['id'],
+                                'previous_block': genesis_block.id,
+                                'is_block_valid': True,
+                                'invalid_reason': None,
+                                'timestamp': '1111111111'}
+
+
 @pytest.mark.bdb
 def test_valid_block_voting_sequential(b, genesis_block, monkeypatch):
     from bigchaindb.backend import query
@@ -227,7 +355,9 @@ def test_valid_block_voting_sequential(b, genesis_block, monkeypatch):
 
 
 @pytest.mark.bdb
-def test_valid_block_voting_multiprocessing(b, genesis_block, monkeypatch):
+@pytest.mark.parametrize('block_at_a_time', [True, False])
+def test_valid_block_voting_multiprocessing(b, genesis_block, monkeypatch,
+                                            block_at_a_time):
     from bigchaindb.backend import query
     from bigchaindb.common import crypto, utils
     from bigchaindb.pipelines import vote
@@ -236,7 +366,7 @@ def test_valid_block_voting_multiprocessing(b, genesis_block, monkeypatch):
     outpipe = Pipe()
 
     monkeypatch.setattr('time.time', lambda: 1111111111)
-    vote_pipeline = vote.create_pipeline()
+    vote_pipeline = vote.create_pipeline(block_at_a_time=block_at_a_time)
     vote_pipeline.setup(indata=inpipe, outdata=outpipe)
 
     block = dummy_block(b)
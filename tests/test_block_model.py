@@ -149,6 +149,53 @@ class TestBlockModel(object):
         public_key = PublicKey(b.me)
         assert public_key.verify(expected_block_serialized, block.signature)
 
+    def test_block_serialization_is_cached(self, b, monkeypatch):
+        from bigchaindb import models
+        from bigchaindb.models import Block, Transaction
+
+        transactions = [Transaction.create([b.me], [([b.me], 1)])]
+        block = Block(transactions, b.me, voters=['Qaaa'])
+        block_id = block.id
+
+        def fail(value):
+            raise AssertionError('the block was serialized again')
+
+        monkeypatch.setattr(models, 'serialize', fail)
+        block.sign(b.me_private)
+        assert block.id == block_id
+        assert block.to_dict()['id'] == block_id
+        assert block.is_signature_valid()
+
+    def test_block_serialization_cache_is_invalidated(self, b):
+        from bigchaindb.models import Block, Transaction
+
+        tx1 = Transaction.create([b.me], [([b.me], 1)])
+        tx2 = Transaction.create([b.me], [([b.me], 2)])
+        block = Block([tx1], b.me, '1', ['Qaaa'])
+        block_id = block.id
+
+        block.voters = ['Qbbb']
+        assert block.id != block_id
+        assert block.id == Block([tx1], b.me, '1', ['Qbbb']).id
+
+        block_id = block.id
+        block.transactions.append(tx2)
+        assert block.id == block_id
+        block.invalidate()
+        assert block.id == Block([tx1, tx2], b.me, '1', ['Qbbb']).id
+
+    def test_block_deserialization_seeds_the_cache(self, b, monkeypatch):
+        from bigchaindb import models
+        from bigchaindb.models import Block, Transaction
+
+        transactions = [Transaction.create([b.me], [([b.me], 1)])]
+        block_body = Block(transactions, b.me).sign(b.me_private).to_dict()
+
+        block = Block.from_dict(block_body)
+        monkeypatch.setattr(models, 'hash_data', None)
+        assert block.id == block_body['id']
+        assert block.is_signature_valid()
+
     def test_block_dupe_tx(self, b):
         from bigchaindb.models import Transaction
         from bigchaindb.common.exceptions import DuplicateTransaction
@@ -157,6 +204,19 @@ class TestBlockModel(object):
         with raises(DuplicateTransaction):
             block._validate_block(b)
 
+    def test_block_transactions_are_validated_by_the_consensus_rules(self, b):
+        from unittest.mock import patch
+        from bigchaindb.models import Transaction
+        from bigchaindb.common.exceptions import ValidationError
+        tx = Transaction.create([b.me], [([b.me], 1)]).sign([b.me_private])
+        block = b.create_block([tx])
+        with patch.object(b.consensus, 'validate_transaction',
+                          side_effect=ValidationError('plugin')) as validate:
+            with raises(ValidationError):
+                block._validate_block_transactions(b)
+        assert validate.call_args[0] == (b, tx)
+        assert validate.call_args[1]['signatures'] is not None
+
     def test_decouple_assets(self, b):
         from bigchaindb.models import Block, Transaction
 
@@ -194,6 +254,29 @@ class TestBlockModel(object):
         assert block.transactions[3].to_dict() == \
             block_dict['block']['transactions'][3]
 
+    def test_decouple(self, b):
+        from bigchaindb.models import Block, Transaction
+
+        create = Transaction.create([b.me], [([b.me], 1)],
+                                    asset={'msg': '1'}, metadata={'m': 1})
+        create.sign([b.me_private])
+        transfer = Transaction.transfer(create.to_inputs(), [([b.me], 1)],
+                                        asset_id=create.id)
+        transfer.sign([b.me_private])
+        block = Block([create, transfer])
+        expected_assets, expected_block = block.decouple_assets()
+        expected_metadata, expected_block = \
+            block.decouple_metadata(expected_block)
+
+        assets, metadata, block_dict = block.decouple()
+
+        assert assets == expected_assets
+        assert metadata == expected_metadata
+        assert block_dict == expected_block
+        # the transactions of the block are left untouched
+        assert create.asset == {'data': {'msg': '1'}}
+        assert create.metadata == {'m': 1}
+
     def test_couple_assets(self, b):
         from bigchaindb.models import Block, Transaction
 
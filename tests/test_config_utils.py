@@ -231,6 +231,7 @@ def test_autoconfigure_read_both_from_file_and_env(monkeypatch, request, certs_d
         'name': DATABASE_NAME,
         'connection_timeout': 5000,
         'max_tries': 3,
+        'max_pool_size': 100,
         'replicaset': 'bigchain-rs',
         'ssl': False,
         'login': None,
@@ -249,6 +250,7 @@ def test_autoconfigure_read_both_from_file_and_env(monkeypatch, request, certs_d
         'name': DATABASE_NAME,
         'connection_timeout': 5000,
         'max_tries': 3,
+        'max_pool_size': 100,
         'replicaset': 'bigchain-rs',
         'ssl': True,
         'login': None,
@@ -275,6 +277,11 @@ def test_autoconfigure_read_both_from_file_and_env(monkeypatch, request, certs_d
             'loglevel': logging.getLevelName(
                 log_config['handlers']['console']['level']).lower(),
             'workers': None,
+            'threads': None,
+            'engine': 'gunicorn',
+            'read_preference': 'primary',
+            'max_staleness': 90,
+            'cache_size': 1024,
         },
         'wsserver': {
             'scheme': WSSERVER_SCHEME,
@@ -291,6 +298,14 @@ def test_autoconfigure_read_both_from_file_and_env(monkeypatch, request, certs_d
         },
         'keyring': KEYRING.split(':'),
         'backlog_reassign_delay': 5,
+        'block': {
+            'max_size': 1000,
+            'max_bytes': 15 * 1024 * 1024,
+            'timeout': 1.0,
+            'adaptive': False,
+            'min_size': 100,
+            'min_timeout': 0.1,
+        },
         'log': {
             'file': LOG_FILE,
             'error_file': log_config['handlers']['errors']['filename'],
@@ -315,7 +330,8 @@ def test_autoconfigure_env_precedence(monkeypatch):
     monkeypatch.setattr('bigchaindb.config_utils.file_config', lambda *args, **kwargs: file_config)
     monkeypatch.setattr('os.environ', {'BIGCHAINDB_DATABASE_NAME': 'test-dbname',
                                        'BIGCHAINDB_DATABASE_PORT': '4242',
-                                       'BIGCHAINDB_SERVER_BIND': 'localhost:9985'})
+                                       'BIGCHAINDB_SERVER_BIND': 'localhost:9985',
+                                       'BIGCHAINDB_SERVER_THREADS': '16'})
 
     import bigchaindb
     from bigchaindb import config_utils
@@ -326,6 +342,7 @@ def test_autoconfigure_env_precedence(monkeypatch):
     assert bigchaindb.config['database']['name'] == 'test-dbname'
     assert bigchaindb.config['database']['port'] == 4242
     assert bigchaindb.config['server']['bind'] == 'localhost:9985'
+    assert bigchaindb.config['server']['threads'] == '16'
 
 
 def test_autoconfigure_explicit_file(monkeypatch):
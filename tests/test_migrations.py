@@ -0,0 +1,81 @@
+import pytest
+
+
+pytestmark = [pytest.mark.bdb, pytest.mark.usefixtures('inputs')]
+
+
+@pytest.fixture
+def unmigrated(b):
+    """Remove the data derived from the blocks, as in a database
+    initialized by an earlier version."""
+    from bigchaindb.backend.mongodb.connection import MongoDBConnection
+
+    if not isinstance(b.connection, MongoDBConnection):
+        pytest.skip('the tables are emptied with MongoDB')
+
+    b.connection.db.transactions.delete_many({})
+    b.connection.db.outputs.delete_many({})
+    b.connection.db.migrations.delete_many({})
+
+
+def test_index_transactions(b, user_pk, unmigrated, monkeypatch):
+    from bigchaindb import backend
+    from bigchaindb.migrations import run_migrations
+    from bigchaindb.models import Transaction
+
+    monkeypatch.setattr('bigchaindb.migrations.BLOCKS_CHUNK_SIZE', 1)
+
+    tx = Transaction.create([b.me], [([user_pk], 1)]).sign([b.me_private])
+    assert b.get_transaction(tx.id) is None
+    block = b.create_block([tx])
+    b.write_block(block)
+    b.connection.db.transactions.delete_many({'block_id': block.id})
+    vote = b.vote(block.id, b.get_last_voted_block().id, True)
+    b.write_vote(vote)
+
+    assert run_migrations(b) == ['index_transactions', 'store_outputs']
+
+    # the blocks are indexed with their status
+    entries = list(backend.query.get_indexed_transactions(b.connection,
+                                                          [tx.id]))
+    assert [(entry['block_id'], entry['status']) for entry in entries] == \
+        [(block.id, b.BLOCK_VALID)]
+    assert b.get_transaction(tx.id, include_status=True) == (tx, b.TX_VALID)
+    # including the transactions in the blocks of the `inputs` fixture
+    assert b.get_outputs_filtered(user_pk)
+
+    # and they are not migrated again
+    assert run_migrations(b) == []
+
+
+def test_store_outputs(b, genesis_block, unmigrated):
+    from bigchaindb.common.crypto import generate_key_pair
+    from bigchaindb.migrations import is_applied, run_migrations
+    from bigchaindb.models import Transaction
+
+    _, alice_pk = generate_key_pair()
+
+    valid_tx = Transaction.create([b.me], [([alice_pk], 1)])
+    valid_tx = valid_tx.sign([b.me_private])
+    valid_block = b.create_block([valid_tx])
+    b.write_block(valid_block)
+    b.write_vote(b.vote(valid_block.id, b.get_last_voted_block().id, True))
+    invalid_tx = Transaction.create([b.me], [([alice_pk], 2)])
+    invalid_tx = invalid_tx.sign([b.me_private])
+    invalid_block = b.create_block([invalid_tx])
+    b.write_block(invalid_block)
+    b.write_vote(b.vote(invalid_block.id, valid_block.id, False))
+    undecided_tx = Transaction.create([b.me], [([alice_pk], 3)])
+    undecided_tx = undecided_tx.sign([b.me_private])
+    b.write_block(b.create_block([undecided_tx]))
+
+    assert not is_applied(b.connection, 'store_outputs')
+    assert b.get_valid_outputs(alice_pk) == []
+
+    run_migrations(b)
+
+    assert is_applied(b.connection, 'store_outputs')
+    assert b.get_valid_outputs(alice_pk) == [valid_tx.to_inputs()[0].fulfills]
+    # the genesis block is never elected
+    assert [link.txid for link in b.get_valid_outputs(b.me)] == \
+        [genesis_block.transactions[0].id]
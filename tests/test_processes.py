@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from multiprocessing import Process
 from bigchaindb.pipelines import vote, block, election, stale
@@ -25,6 +25,28 @@ def test_processes_start(mock_exchange_run, mock_exchange, mock_process, mock_vo
         events_queue=mock_exchange.return_value)
 
 
+@patch.object(stale, 'start')
+@patch.object(election, 'start')
+@patch.object(block, 'start')
+@patch.object(vote, 'start')
+@patch('bigchaindb.processes.mp.Process')
+@patch('bigchaindb.events.Exchange.get_publisher_queue', spec_set=True, autospec=True)
+@patch('bigchaindb.events.Exchange.run', spec_set=True, autospec=True)
+def test_processes_start_aiohttp_server(mock_exchange_run, mock_exchange,
+                                        mock_process, mock_vote, mock_block,
+                                        mock_election, mock_stale,
+                                        monkeypatch):
+    import bigchaindb
+    from bigchaindb import processes
+    from bigchaindb.web import async_server
+
+    monkeypatch.setitem(bigchaindb.config['server'], 'engine', 'aiohttp')
+    processes.start()
+
+    mock_process.assert_any_call(name='webapi', target=async_server.start,
+                                 args=(bigchaindb.config['server'], ANY))
+
+
 @patch.object(Process, 'start')
 def test_start_events_plugins(mock_process, monkeypatch):
 
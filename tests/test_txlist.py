@@ -2,6 +2,8 @@
 
 This test module defines it's own fixture which is used by all the tests.
 """
+from unittest.mock import patch
+
 import pytest
 
 
@@ -62,3 +64,43 @@ def test_get_txlist_by_asset(b, txlist):
 def test_get_txlist_by_operation(b, txlist):
     res = b.get_transactions_filtered(txlist.create1.id, operation='CREATE')
     assert set(tx.id for tx in res) == {txlist.create1.id}
+
+
+@pytest.mark.bdb
+def test_get_txlist_by_pages(b, txlist):
+    txids = sorted([txlist.transfer1.id, txlist.create1.id])
+
+    res = b.get_transactions_filtered(txlist.create1.id, limit=1)
+    assert [tx.id for tx in res] == txids[:1]
+    res = b.get_transactions_filtered(txlist.create1.id, limit=1,
+                                      after=txids[0])
+    assert [tx.id for tx in res] == txids[1:]
+    res = b.get_transactions_filtered(txlist.create1.id, after=txids[1])
+    assert list(res) == []
+
+
+@pytest.mark.bdb
+def test_get_txlist_looks_up_the_transactions_by_chunks(b, txlist,
+                                                        monkeypatch):
+    from bigchaindb.backend import query
+
+    txids = sorted([txlist.transfer1.id, txlist.create1.id])
+    monkeypatch.setattr(b, 'FILTERED_TXIDS_CHUNK_SIZE', 1)
+
+    with patch.object(query, 'get_txids_filtered',
+                      wraps=query.get_txids_filtered) as mock_get_txids:
+        res = b.get_transactions_filtered(txlist.create1.id)
+        assert [tx.id for tx in res] == txids
+
+    # one chunk per id (the ids of create1, transfer1 and of the double
+    # spend, in an undecided block), and the last empty one: a full chunk
+    # may not be the last one
+    assert mock_get_txids.call_count == 4
+
+    # a partial chunk is the last one
+    monkeypatch.setattr(b, 'FILTERED_TXIDS_CHUNK_SIZE', 2)
+    with patch.object(query, 'get_txids_filtered',
+                      wraps=query.get_txids_filtered) as mock_get_txids:
+        res = b.get_transactions_filtered(txlist.create1.id)
+        assert [tx.id for tx in res] == txids
+    assert mock_get_txids.call_count == 2
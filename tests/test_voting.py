@@ -189,6 +189,19 @@ def test_verify_vote_signature_passes(b):
     assert not Voting.verify_vote_signature(vote)
 
 
+def test_verify_vote_signature_is_memoized(b):
+    vote = b.vote('block', 'a', True)
+    with patch('bigchaindb.voting.PublicKey') as public_key:
+        public_key.return_value.verify.return_value = True
+        assert Voting.verify_vote_signature(vote)
+        assert Voting.verify_vote_signature(dict(vote))
+    assert public_key.return_value.verify.call_count == 1
+
+    # the same signature on another body is verified again
+    vote['vote']['is_block_valid'] = False
+    assert not Voting.verify_vote_signature(vote)
+
+
 ################################################################################
 # Tests for vote schema
 
@@ -202,6 +215,34 @@ def test_verify_vote_schema(b):
     assert not Voting.verify_vote_schema(vote)
 
 
+################################################################################
+# Tests for the cache of decided elections
+
+
+def test_decided_elections():
+    from bigchaindb.voting import DecidedElections
+
+    elections = DecidedElections(size=2)
+    elections.add('a', {'x'}, VALID)
+    elections.add('b', {'x'}, INVALID)
+    elections.add('c', {'x'}, UNDECIDED)
+    assert len(elections) == 2
+    assert elections.get('a', {'x'}) == VALID
+    assert elections.get('b', {'x'}) == INVALID
+    assert elections.get('c', {'x'}) is None
+    # statuses are only valid for the keyring they were decided with
+    assert elections.get('a', {'x', 'y'}) is None
+
+    # the least recently used status is evicted
+    elections.get('a', {'x'})
+    elections.add('d', {'x'}, VALID)
+    assert elections.get('b', {'x'}) is None
+    assert elections.get('a', {'x'}) == VALID
+
+    elections.clear()
+    assert len(elections) == 0
+
+
 ################################################################################
 # block_election tests
 
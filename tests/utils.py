@@ -34,6 +34,8 @@ def flush_rethink_db(connection, dbname):
         connection.run(r.db(dbname).table('votes').delete())
         connection.run(r.db(dbname).table('assets').delete())
         connection.run(r.db(dbname).table('metadata').delete())
+        connection.run(r.db(dbname).table('transactions').delete())
+        connection.run(r.db(dbname).table('outputs').delete())
     except r.ReqlOpFailedError:
         pass
 
@@ -45,6 +47,10 @@ def flush_mongo_db(connection, dbname):
     connection.conn[dbname].votes.delete_many({})
     connection.conn[dbname].assets.delete_many({})
     connection.conn[dbname].metadata.delete_many({})
+    connection.conn[dbname].transactions.delete_many({})
+    connection.conn[dbname].outputs.delete_many({})
+    connection.conn[dbname].voting_tips.delete_many({})
+    connection.conn[dbname].changefeed_checkpoints.delete_many({})
 
 
 @singledispatch
@@ -0,0 +1,89 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def async_app(loop):
+    from bigchaindb.web.async_server import init_app
+
+    app = init_app(threads=2, processes=1, loop=loop)
+    # the requests "handled in the process pool" are run in a thread
+    # instead, so that they can be observed
+    app['process_executor'].shutdown()
+    app['process_executor'] = ThreadPoolExecutor(max_workers=1)
+    return app
+
+
+def test_call_wsgi_app():
+    from bigchaindb.web.async_server import call_wsgi_app
+
+    def app(environ, start_response):
+        start_response('201 Created', [('X-Path', environ['PATH_INFO'])])
+        return [environ['HTTP_X_TOKEN'].encode(),
+                environ['wsgi.input'].read(),
+                environ['CONTENT_TYPE'].encode()]
+
+    request_data = ('POST', '/api/v1/transactions', 'mode=sync',
+                    [('X-Token', 'a'), ('Content-Type', 'text/plain')], b'b',
+                    'http', 'localhost', '9984', '127.0.0.1')
+    assert call_wsgi_app(app, request_data) == (
+        '201 Created', [('X-Path', '/api/v1/transactions')], b'abtext/plain')
+
+
+@asyncio.coroutine
+def test_get_is_served_by_the_flask_app(async_app, test_client, client):
+    api_client = yield from test_client(async_app)
+
+    response = yield from api_client.get('/api/v1/')
+    assert response.status == 200
+    assert response.headers['Content-Type'] == 'application/json'
+    assert (yield from response.json()) == client.get('/api/v1/').json
+
+
+@asyncio.coroutine
+@pytest.mark.bdb
+def test_get_not_found(async_app, test_client):
+    api_client = yield from test_client(async_app)
+
+    response = yield from api_client.get('/api/v1/transactions/' + 'a' * 64)
+    assert response.status == 404
+
+
+@asyncio.coroutine
+@pytest.mark.bdb
+def test_post_is_served_in_the_process_pool(async_app, test_client):
+    from bigchaindb.web import async_server
+
+    api_client = yield from test_client(async_app)
+
+    with patch('bigchaindb.web.async_server._call_worker_app',
+               wraps=async_server._call_worker_app) as mock_worker:
+        response = yield from api_client.post('/api/v1/transactions',
+                                              data=json.dumps({'id': 'abc'}))
+
+    assert response.status == 400
+    assert 'Invalid transaction' in (yield from response.json())['message']
+    assert mock_worker.call_count == 1
+
+
+@patch('aiohttp.web.run_app')
+@patch('bigchaindb.web.async_server.init_app')
+def test_start_coerces_the_settings_from_the_environment(init_app_mock,
+                                                         run_app_mock):
+    from bigchaindb.web.async_server import start, DEFAULT_THREADS
+
+    start({'bind': 'localhost:9984', 'threads': '16', 'workers': '4'},
+          loop='event-loop')
+    _, kwargs = init_app_mock.call_args
+    assert (kwargs['threads'], kwargs['processes']) == (16, 4)
+    run_app_mock.assert_called_once_with(init_app_mock.return_value,
+                                         host='localhost', port=9984)
+
+    start({'bind': 'localhost:9984', 'threads': None, 'workers': None},
+          loop='event-loop')
+    _, kwargs = init_app_mock.call_args
+    assert (kwargs['threads'], kwargs['processes']) == (DEFAULT_THREADS, None)
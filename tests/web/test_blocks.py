@@ -19,6 +19,72 @@ def test_get_block_endpoint(b, client):
     assert res.status_code == 200
 
 
+@pytest.mark.bdb
+@pytest.mark.usefixtures('inputs')
+def test_get_decided_block_is_immutable(b, client):
+    from unittest.mock import patch
+    from bigchaindb.web.views.base import IMMUTABLE_CACHE_CONTROL
+
+    tx = Transaction.create([b.me], [([b.me], 1)])
+    tx = tx.sign([b.me_private])
+
+    block = b.create_block([tx])
+    b.write_block(block)
+
+    # undecided blocks are not cached
+    res = client.get(BLOCKS_ENDPOINT + block.id)
+    assert res.status_code == 200
+    assert 'ETag' not in res.headers
+    assert 'Cache-Control' not in res.headers
+
+    vote = b.vote(block.id, b.get_last_voted_block().id, True)
+    b.write_vote(vote)
+
+    res = client.get(BLOCKS_ENDPOINT + block.id)
+    assert res.status_code == 200
+    assert res.json == block.to_dict()
+    assert res.headers['ETag'] == '"{}"'.format(block.id)
+    assert res.headers['Cache-Control'] == IMMUTABLE_CACHE_CONTROL
+
+    with patch('bigchaindb.core.Bigchain.get_block') as mock_get_block:
+        res = client.get(BLOCKS_ENDPOINT + block.id)
+        assert res.status_code == 200
+        assert res.json == block.to_dict()
+
+        res = client.get(BLOCKS_ENDPOINT + block.id,
+                         headers={'If-None-Match': '"{}"'.format(block.id)})
+        assert res.status_code == 304
+        assert res.data == b''
+
+    assert not mock_get_block.called
+
+
+@pytest.mark.bdb
+def test_get_block_checks_the_etag_of_an_uncached_block(b, client):
+    from bigchaindb.models import Transaction
+
+    tx = Transaction.create([b.me], [([b.me], 1)])
+    tx = tx.sign([b.me_private])
+    block = b.create_block([tx])
+    etag = '"{}"'.format(block.id)
+
+    # a block that does not exist
+    res = client.get(BLOCKS_ENDPOINT + block.id, headers={'If-None-Match': etag})
+    assert res.status_code == 404
+
+    # an undecided block
+    b.write_block(block)
+    res = client.get(BLOCKS_ENDPOINT + block.id, headers={'If-None-Match': etag})
+    assert res.status_code == 200
+    assert 'ETag' not in res.headers
+
+    # a decided block, not cached yet
+    vote = b.vote(block.id, b.get_last_voted_block().id, True)
+    b.write_vote(vote)
+    res = client.get(BLOCKS_ENDPOINT + block.id, headers={'If-None-Match': etag})
+    assert res.status_code == 304
+
+
 @pytest.mark.bdb
 @pytest.mark.usefixtures('inputs')
 def test_get_block_returns_404_if_not_found(client):
@@ -0,0 +1,22 @@
+def test_response_cache_evicts_the_least_recently_used():
+    from bigchaindb.web.cache import ResponseCache
+
+    cache = ResponseCache(maxsize=2)
+    cache.put('a', b'1')
+    cache.put('b', b'2')
+    assert cache.get('a') == b'1'
+    cache.put('c', b'3')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1'
+    assert cache.get('c') == b'3'
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_response_cache_disabled():
+    from bigchaindb.web.cache import ResponseCache
+
+    cache = ResponseCache(maxsize=0)
+    cache.put('a', b'1')
+    assert cache.get('a') is None
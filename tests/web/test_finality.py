@@ -0,0 +1,63 @@
+from multiprocessing import Queue
+
+from bigchaindb.events import Event, EventTypes, POISON_PILL
+
+
+def block_event(event_type, *tx_ids):
+    block = {'block': {'transactions': [{'id': tx_id} for tx_id in tx_ids]}}
+    return Event(event_type, block)
+
+
+def test_notifier_wakes_the_waiters_of_a_valid_block():
+    from bigchaindb.web.finality import FinalityNotifier
+
+    notifier = FinalityNotifier()
+    with notifier.waiting('a') as waiter_a, notifier.waiting('b') as waiter_b:
+        notifier.notify(block_event(EventTypes.BLOCK_VALID, 'a', 'c'))
+
+        assert waiter_a.wait(0)
+        assert waiter_a.valid
+        assert not waiter_b.wait(0)
+        assert not waiter_b.valid
+
+
+def test_notifier_wakes_the_waiters_of_an_invalid_block():
+    from bigchaindb.web.finality import FinalityNotifier
+
+    notifier = FinalityNotifier()
+    with notifier.waiting('a') as waiter:
+        notifier.notify(block_event(EventTypes.BLOCK_INVALID, 'a'))
+
+        assert waiter.wait(0)
+        assert not waiter.valid
+        # the waiter is woken once per block
+        assert not waiter.wait(0)
+
+
+def test_notifier_limits_the_number_of_waiters():
+    from bigchaindb.web.finality import FinalityNotifier
+
+    notifier = FinalityNotifier(max_waiters=1)
+    with notifier.waiting('a') as waiter:
+        assert waiter
+        with notifier.waiting('b') as other_waiter:
+            assert other_waiter is None
+
+    with notifier.waiting('b') as waiter:
+        assert waiter
+    assert not notifier._waiters
+
+
+def test_notifier_listens_to_a_queue():
+    from bigchaindb.web.finality import FinalityNotifier
+
+    queue = Queue()
+    notifier = FinalityNotifier()
+    with notifier.waiting('a') as waiter:
+        thread = notifier.start(queue)
+        queue.put(block_event(EventTypes.BLOCK_VALID, 'a'))
+        assert waiter.wait(5)
+
+        queue.put(POISON_PILL)
+        thread.join(5)
+        assert not thread.is_alive()
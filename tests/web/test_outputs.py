@@ -10,7 +10,7 @@ def test_get_outputs_endpoint(client, user_pk):
     m = MagicMock()
     m.txid = 'a'
     m.output = 0
-    with patch('bigchaindb.core.Bigchain.get_outputs_filtered') as gof:
+    with patch('bigchaindb.core.Bigchain.get_valid_outputs') as gof:
         gof.return_value = [m, m]
         res = client.get(OUTPUTS_ENDPOINT + '?public_key={}'.format(user_pk))
         assert res.json == [
@@ -25,7 +25,7 @@ def test_get_outputs_endpoint_unspent(client, user_pk):
     m = MagicMock()
     m.txid = 'a'
     m.output = 0
-    with patch('bigchaindb.core.Bigchain.get_outputs_filtered') as gof:
+    with patch('bigchaindb.core.Bigchain.get_valid_outputs') as gof:
         gof.return_value = [m]
         params = '?spent=False&public_key={}'.format(user_pk)
         res = client.get(OUTPUTS_ENDPOINT + params)
@@ -38,7 +38,7 @@ def test_get_outputs_endpoint_spent(client, user_pk):
     m = MagicMock()
     m.txid = 'a'
     m.output = 0
-    with patch('bigchaindb.core.Bigchain.get_outputs_filtered') as gof:
+    with patch('bigchaindb.core.Bigchain.get_valid_outputs') as gof:
         gof.return_value = [m]
         params = '?spent=true&public_key={}'.format(user_pk)
         res = client.get(OUTPUTS_ENDPOINT + params)
@@ -47,6 +47,22 @@ def test_get_outputs_endpoint_spent(client, user_pk):
     gof.assert_called_once_with(user_pk, True)
 
 
+def test_get_outputs_endpoint_before_the_outputs_are_stored(client, user_pk):
+    m = MagicMock()
+    m.txid = 'a'
+    m.output = 0
+    with patch('bigchaindb.migrations.is_applied') as is_applied, \
+            patch('bigchaindb.core.Bigchain.get_outputs_filtered') as gof:
+        is_applied.return_value = False
+        gof.return_value = [m]
+        params = '?spent=false&public_key={}'.format(user_pk)
+        res = client.get(OUTPUTS_ENDPOINT + params)
+    assert res.json == [{'transaction_id': 'a', 'output_index': 0}]
+    assert res.status_code == 200
+    assert is_applied.call_args[0][1] == 'store_outputs'
+    gof.assert_called_once_with(user_pk, False)
+
+
 def test_get_outputs_endpoint_without_public_key(client):
     res = client.get(OUTPUTS_ENDPOINT)
     assert res.status_code == 400
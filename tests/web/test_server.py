@@ -1,3 +1,6 @@
+from unittest.mock import patch
+
+
 def test_settings():
     import bigchaindb
     from bigchaindb.web import server
@@ -7,3 +10,33 @@ def test_settings():
     # for whatever reason the value is wrapped in a list
     # needs further investigation
     assert s.cfg.bind[0] == bigchaindb.config['server']['bind']
+
+
+def test_settings_threads_from_the_environment():
+    import bigchaindb
+    from bigchaindb.web import server
+
+    # a value read from the environment is a string
+    s = server.create_server(dict(bigchaindb.config['server'], threads='4'))
+    assert s.cfg.threads == 4
+
+
+def test_read_pool_is_the_primary_pool_by_default():
+    from bigchaindb.web import server
+
+    app = server.create_app()
+    assert app.config['bigchain_read_pool'] is app.config['bigchain_pool']
+
+
+def test_read_pool_reads_from_secondaries():
+    from bigchaindb.web import server
+
+    app = server.create_app(read_preference='secondaryPreferred',
+                            max_staleness=120)
+
+    with patch('bigchaindb.backend.connect') as mock_connect:
+        with app.config['bigchain_read_pool']() as bigchain:
+            assert bigchain.connection is mock_connect.return_value
+
+    mock_connect.assert_called_once_with(read_preference='secondaryPreferred',
+                                         max_staleness=120)
@@ -1,5 +1,10 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
 import pytest
 
+from bigchaindb.events import Event, EventTypes
 from bigchaindb.models import Transaction
 
 STATUSES_ENDPOINT = '/api/v1/statuses'
@@ -21,6 +26,104 @@ def test_get_transaction_status_endpoint_returns_404_if_not_found(client):
     assert res.status_code == 404
 
 
+@pytest.fixture
+def notifier(app):
+    from bigchaindb.web.finality import FinalityNotifier
+
+    notifier = FinalityNotifier()
+    app.config['finality_notifier'] = notifier
+    return notifier
+
+
+def notify_when_waiting(notifier, event_type, block):
+    """Publish a decided block once a request waits on its transaction."""
+
+    def notify():
+        tx_id = block.transactions[0].id
+        while tx_id not in notifier._waiters:
+            time.sleep(0.01)
+        notifier.notify(Event(event_type, block.to_dict()))
+
+    thread = threading.Thread(target=notify, daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.fixture
+def backlog_tx(b):
+    tx = Transaction.create([b.me], [([b.me], 1)])
+    tx = tx.sign([b.me_private])
+    b.write_transaction(tx)
+    return tx
+
+
+@pytest.mark.bdb
+def test_get_transaction_status_waits_until_valid(b, client, notifier, backlog_tx):
+    block = b.create_block([backlog_tx])
+    notify_when_waiting(notifier, EventTypes.BLOCK_VALID, block)
+
+    res = client.get(STATUSES_ENDPOINT + '?transaction_id=' + backlog_tx.id + '&wait=30')
+    assert res.status_code == 200
+    assert res.json['status'] == 'valid'
+
+
+@pytest.mark.bdb
+def test_get_transaction_status_waits_after_an_invalid_block(b, client, notifier, backlog_tx):
+    block = b.create_block([backlog_tx])
+    notify_when_waiting(notifier, EventTypes.BLOCK_INVALID, block)
+
+    with patch('bigchaindb.Bigchain.get_status',
+               side_effect=['backlog', 'backlog']) as mock_get_status:
+        res = client.get(STATUSES_ENDPOINT + '?transaction_id=' + backlog_tx.id + '&wait=0.5')
+
+    assert res.status_code == 200
+    assert res.json['status'] == 'backlog'
+    # read once before waiting, and once after the invalid block
+    assert mock_get_status.call_count == 2
+
+
+@pytest.mark.bdb
+def test_get_transaction_status_wait_times_out(client, notifier, backlog_tx):
+    res = client.get(STATUSES_ENDPOINT + '?transaction_id=' + backlog_tx.id + '&wait=0.1')
+    assert res.status_code == 200
+    assert res.json['status'] == 'backlog'
+    assert not notifier._waiters
+
+
+@pytest.mark.bdb
+def test_get_transaction_status_wait_reads_from_the_primary(app, b, client, notifier, backlog_tx):
+    app.config['bigchain_read_pool'] = read_pool = MagicMock()
+    block = b.create_block([backlog_tx])
+    notify_when_waiting(notifier, EventTypes.BLOCK_VALID, block)
+
+    res = client.get(STATUSES_ENDPOINT + '?transaction_id=' + backlog_tx.id + '&wait=30')
+    assert res.status_code == 200
+    assert res.json['status'] == 'valid'
+    assert not read_pool.called
+
+
+@pytest.mark.bdb
+def test_get_transaction_status_does_not_wait_if_not_found(client, notifier):
+    res = client.get(STATUSES_ENDPOINT + '?transaction_id=123&wait=30')
+    assert res.status_code == 404
+
+
+@pytest.mark.bdb
+def test_get_transaction_status_wait_is_ignored_without_notifier(client, backlog_tx):
+    res = client.get(STATUSES_ENDPOINT + '?transaction_id=' + backlog_tx.id + '&wait=30')
+    assert res.status_code == 200
+    assert res.json['status'] == 'backlog'
+
+
+@pytest.mark.bdb
+def test_get_transaction_status_reads_from_the_primary(app, client, backlog_tx):
+    app.config['bigchain_read_pool'] = read_pool = MagicMock()
+    res = client.get(STATUSES_ENDPOINT + '?transaction_id=' + backlog_tx.id)
+    assert res.status_code == 200
+    assert res.json['status'] == 'backlog'
+    assert not read_pool.called
+
+
 @pytest.mark.bdb
 def test_get_block_status_endpoint_undecided(b, client):
     tx = Transaction.create([b.me], [([b.me], 1)])
@@ -92,3 +195,6 @@ def test_get_status_endpoint_returns_400_bad_query_params(client):
 
     res = client.get(STATUSES_ENDPOINT + '?transaction_id=123&block_id=123')
     assert res.status_code == 400
+
+    res = client.get(STATUSES_ENDPOINT + '?transaction_id=123&wait=-1')
+    assert res.status_code == 400
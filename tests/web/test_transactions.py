@@ -22,6 +22,29 @@ def test_get_transaction_endpoint(b, client, user_pk):
     assert res.status_code == 200
 
 
+@pytest.mark.bdb
+@pytest.mark.usefixtures('inputs')
+def test_get_transaction_is_immutable(b, client, user_pk):
+    from bigchaindb.web.views.base import IMMUTABLE_CACHE_CONTROL
+
+    input_tx = b.get_owned_ids(user_pk).pop()
+    tx = b.get_transaction(input_tx.txid)
+    res = client.get(TX_ENDPOINT + tx.id)
+    assert res.headers['ETag'] == '"{}"'.format(tx.id)
+    assert res.headers['Cache-Control'] == IMMUTABLE_CACHE_CONTROL
+
+    with patch('bigchaindb.core.Bigchain.get_transaction') as mock_get_tx:
+        res = client.get(TX_ENDPOINT + tx.id)
+        assert res.status_code == 200
+        assert res.json == tx.to_dict()
+
+        res = client.get(TX_ENDPOINT + tx.id,
+                         headers={'If-None-Match': '"{}"'.format(tx.id)})
+        assert res.status_code == 304
+
+    assert not mock_get_tx.called
+
+
 @pytest.mark.bdb
 @pytest.mark.usefixtures('inputs')
 def test_get_transaction_returns_404_if_not_found(client):
@@ -361,14 +384,41 @@ def test_transactions_get_list_good(client):
     with patch('bigchaindb.core.Bigchain.get_transactions_filtered', get_txs_patched):
         url = TX_ENDPOINT + '?asset_id=' + asset_id
         assert client.get(url).json == [
+            ['after', None],
             ['asset_id', asset_id],
+            ['limit', None],
             ['operation', None]
         ]
         url = TX_ENDPOINT + '?asset_id=' + asset_id + '&operation=CREATE'
         assert client.get(url).json == [
+            ['after', None],
             ['asset_id', asset_id],
+            ['limit', None],
             ['operation', 'CREATE']
         ]
+        url = TX_ENDPOINT + '?asset_id=' + asset_id + '&limit=10&after=' + 'A' * 64
+        assert client.get(url).json == [
+            ['after', 'a' * 64],
+            ['asset_id', asset_id],
+            ['limit', 10],
+            ['operation', None]
+        ]
+
+
+def test_transactions_get_list_backend_error(client):
+    from bigchaindb.backend.exceptions import OperationError
+
+    def get_txs_patched(conn, **args):
+        yield type('', (), {'to_dict': lambda: {'id': 'a'}})
+        raise OperationError('second chunk')
+
+    url = TX_ENDPOINT + '?asset_id=' + '1' * 64
+
+    # the whole page is read before the response starts
+    with patch('bigchaindb.core.Bigchain.get_transactions_filtered',
+               get_txs_patched):
+        with pytest.raises(OperationError):
+            client.get(url)
 
 
 def test_transactions_get_list_bad(client):
@@ -385,6 +435,12 @@ def test_transactions_get_list_bad(client):
         # Test asset ID required
         url = TX_ENDPOINT + '?operation=CREATE'
         assert client.get(url).status_code == 400
+        # Test limit validated
+        url = TX_ENDPOINT + '?asset_id=' + '1' * 64 + '&limit=0'
+        assert client.get(url).status_code == 400
+        # Test after validated
+        url = TX_ENDPOINT + '?asset_id=' + '1' * 64 + '&after=1'
+        assert client.get(url).status_code == 400
 
 
 def test_return_only_valid_transaction(client):
@@ -408,3 +464,99 @@ def test_return_only_valid_transaction(client):
                get_transaction_patched(Bigchain.TX_IN_BACKLOG)):
         url = '{}{}'.format(TX_ENDPOINT, '123')
         assert client.get(url).status_code == 404
+
+
+@pytest.mark.bdb
+def test_post_transaction_batch(b, client):
+    from bigchaindb.models import Transaction
+    user_priv, user_pub = crypto.generate_key_pair()
+
+    txs = [Transaction.create([user_pub], [([user_pub], 1)],
+                              metadata={'n': n}).sign([user_priv])
+           for n in range(2)]
+    invalid_tx = txs[0].to_dict()
+    invalid_tx['id'] = 'abc'
+    batch = [txs[0].to_dict(), invalid_tx, 'tx', txs[1].to_dict()]
+
+    res = client.post(TX_ENDPOINT + 'batch', data=json.dumps(batch))
+
+    assert res.status_code == 202
+    assert [result['id'] for result in res.json] == [txs[0].id, 'abc', None, txs[1].id]
+    assert [result['status'] for result in res.json] == [
+        'accepted', 'rejected', 'rejected', 'accepted']
+    assert res.json[0]['location'] == '../statuses?transaction_id={}'.format(txs[0].id)
+    assert res.json[1]['message'].startswith('Invalid transaction (InvalidHash)')
+    assert res.json[2]['message'] == 'Invalid transaction: not a JSON object'
+    for tx in txs:
+        assert b.get_transaction(tx.id, include_status=True)[1] == b.TX_IN_BACKLOG
+
+
+@pytest.mark.bdb
+@pytest.mark.usefixtures('inputs')
+def test_post_transaction_batch_as_ndjson(b, client, user_pk, user_sk):
+    from bigchaindb.models import Transaction
+
+    user_pub = crypto.generate_key_pair()[1]
+    create_tx = b.get_transaction(b.get_owned_ids(user_pk).pop().txid)
+    transfers = [Transaction.transfer(create_tx.to_inputs(),
+                                      [([user_pub], 1)],
+                                      asset_id=create_tx.id,
+                                      metadata={'n': n}).sign([user_sk])
+                 for n in range(2)]
+    body = '\n'.join([json.dumps(transfers[0].to_dict()), '{"id":',
+                      '', json.dumps(transfers[1].to_dict())])
+
+    res = client.post(TX_ENDPOINT + 'batch', data=body,
+                      headers={'Content-Type': 'application/x-ndjson'})
+
+    assert res.status_code == 202
+    assert [result['status'] for result in res.json] == [
+        'accepted', 'rejected', 'rejected']
+    assert res.json[1]['message'].startswith('Invalid JSON')
+    assert res.json[2]['message'] == (
+        'Invalid transaction (DoubleSpend): an input is spent by a '
+        'previous transaction of the batch')
+    assert b.get_transaction(transfers[1].id) is None
+
+
+@pytest.mark.parametrize('body,status_code', (
+    ('', 400),
+    ('[1', 400),
+    ('[{}, {}]', 413),
+    ('["tx"]', 400),
+))
+def test_post_invalid_transaction_batch(client, monkeypatch, body, status_code):
+    monkeypatch.setattr(
+        'bigchaindb.web.views.transactions.BATCH_MAX_SIZE', 1)
+    res = client.post(TX_ENDPOINT + 'batch', data=body)
+    assert res.status_code == status_code
+
+
+def test_post_transaction_batch_without_accepted_transaction(client):
+    res = client.post(TX_ENDPOINT + 'batch', data='["tx"]')
+    assert res.status_code == 400
+    # the outcome of each transaction, not the error of a malformed batch
+    assert res.json == [{'id': None, 'status': 'rejected',
+                         'message': 'Invalid transaction: not a JSON object'}]
+
+
+def test_validate_pooled_transaction():
+    from unittest.mock import Mock
+    from bigchaindb.common.exceptions import InvalidHash
+    from bigchaindb.utils import pool
+    from bigchaindb.web.views.transactions import validate_pooled_transaction
+
+    instances = []
+
+    def builder():
+        instances.append(Mock())
+        return instances[-1]
+
+    bigchain_pool = pool(builder, size=1)
+    assert validate_pooled_transaction(bigchain_pool, 'tx') is None
+
+    instances[0].validate_transaction.side_effect = InvalidHash('bad hash')
+    assert validate_pooled_transaction(bigchain_pool, 'tx') == \
+        'Invalid transaction (InvalidHash): bad hash'
+    # the instance is put back in the pool after each validation
+    assert len(instances) == 1